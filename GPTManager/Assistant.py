@@ -7,8 +7,12 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from GPTManager.Client import Client
+from GPTManager.Errors import APIError
 from .Thread import Thread
 from .Run import Run
+from .Store import evict, read_through, write_through
+from .Cache import TTLCache
+from .Mapper import mapper
 @dataclass
 class AssistantFile:
     id: str
@@ -37,9 +41,14 @@ class Assistant:
         tools (List[Tool]): List of tools associated with the assistant.
         file_ids (List[Any]): List of file IDs associated with the assistant.
         metadata (dict[str, Any]): Assistant metadata.
+        cache (TTLCache): Process-wide cache of retrieved assistants, shared by every instance.
+            Constructing an Assistant from an id is served from it until the entry expires.
+            Modifying or deleting the assistant, or changing its files, updates or drops the entry.
+            Replace it, e.g. `Assistant.cache = TTLCache(ttl=60, maxsize=1000)`, to tune it.
 
     Methods:
         __init__(self, assistant_id: str = None)
+        ref(cls, assistant_id: str) -> 'Assistant'
         create_assistant(self, instructions: str, name: str, model: str, tools: list[dict[str, str]] = []) -> 'Assistant'
         retrieve_assistant(self) -> 'Assistant'
         modify_assistant(self, instructions: str, name: Optional[str], tools: list[Tool], model: str, file_ids: list[Any] = [])
@@ -60,6 +69,8 @@ class Assistant:
     file_ids: list[Any] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    cache = TTLCache(ttl=300.0, maxsize=256)
+
 
     def __init__(self, **kwargs) -> 'Assistant':
         """
@@ -80,7 +91,8 @@ class Assistant:
         """
         if 'assistant_id' in kwargs and kwargs['assistant_id'] is not None:
             self.id = kwargs['assistant_id']
-            self.retrieve_assistant()
+            if not self._load_cached() and not self._load_stored():
+                self.retrieve_assistant()
         elif 'instructions' in kwargs and 'name' in kwargs and 'model' in kwargs:
             tools = kwargs.get('tools', [])
             self.create_assistant(
@@ -92,6 +104,53 @@ class Assistant:
         return None
 
 
+    @classmethod
+    def ref(cls, assistant_id: str) -> 'Assistant':
+        """
+        Creates a handle for an existing assistant without calling the API.
+
+        The handle is enough to create runs, which only need the id. The other
+        attributes are loaded on first access, from the cache, the Store or the API.
+
+        Parameters:
+            assistant_id (str): The ID of the assistant.
+
+        Returns:
+            Assistant: The assistant handle.
+        """
+        assistant = cls.__new__(cls)
+        assistant.id = assistant_id
+        assistant._lazy = True
+        return assistant
+
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes that are not set yet, i.e. on a ref() handle before hydration.
+        if name in Assistant.__dataclass_fields__ and self.__dict__.get('_lazy'):
+            if not self._load_cached() and not self._load_stored():
+                self.retrieve_assistant()
+            self._lazy = False
+            return getattr(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+
+    def __repr__(self) -> str:
+        # The dataclass repr reads every field, which would hydrate a ref() handle.
+        if self.__dict__.get('_lazy'):
+            return f"{type(self).__name__}.ref({self.id!r})"
+        values = ', '.join(f"{name}={getattr(self, name)!r}" for name in Assistant.__dataclass_fields__)
+        return f"{type(self).__name__}({values})"
+
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        # A ref() handle is compared by id alone, so comparing it never calls the API.
+        if self.__dict__.get('_lazy') or other.__dict__.get('_lazy'):
+            return self.id == other.id
+        return all(getattr(self, name) == getattr(other, name) for name in Assistant.__dataclass_fields__)
+
+
     def create_assistant(
         self, 
         instructions: str, 
@@ -117,26 +176,20 @@ class Assistant:
         client = Client.get_instance()
 
         try:
-            assistant_data = client.beta.assistants.create(
+            assistant_data = Client.call(client.beta.assistants.create,
                 instructions=instructions,
                 name=name,
                 tools=tools,
                 model=model,
             )
 
-            self.id = assistant_data.id
-            self.object = assistant_data.object
-            self.created_at = assistant_data.created_at
-            self.name = assistant_data.name
-            self.description = assistant_data.description
-            self.model = assistant_data.model
-            self.instructions = assistant_data.instructions
-            self.tools = assistant_data.tools
-            self.file_ids = assistant_data.file_ids
-            self.metadata = assistant_data.metadata
+            mapper(Assistant).update(self, assistant_data)
+            Client.pin(self.id, client)
 
         except Exception as e:
-            raise ValueError("Failed to create assistant") from e
+            raise APIError.from_exception("Failed to create assistant", e) from e
+
+        self._remember()
 
 
     def retrieve_assistant(self) -> 'Assistant':
@@ -149,23 +202,17 @@ class Assistant:
         Raises:
             ValueError: If the assistant retrieval fails or returns invalid data.
         """
-        client = Client.get_instance()
+        client = Client.get_instance(self.id)
 
         try:
-            assistant_data = client.beta.assistants.retrieve(self.id)
-
-            self.object = assistant_data.object
-            self.created_at = assistant_data.created_at
-            self.name = assistant_data.name
-            self.description = assistant_data.description
-            self.model = assistant_data.model
-            self.instructions = assistant_data.instructions
-            self.tools = assistant_data.tools
-            self.file_ids = assistant_data.file_ids
-            self.metadata = assistant_data.metadata
+            assistant_data = Client.call_shared(client.beta.assistants.retrieve, self.id)
+
+            mapper(Assistant).update(self, assistant_data)
 
         except Exception as e:
-            raise ValueError("Failed to retrieve assistant") from e
+            raise APIError.from_exception("Failed to retrieve assistant", e) from e
+
+        self._remember()
 
 
     def modify_assistant(
@@ -193,8 +240,8 @@ class Assistant:
             ValueError: If assistant modification fails or returns invalid data.
         """
         try:
-            client = Client.get_instance()
-            assistant_data = client.beta.assistants.update(
+            client = Client.get_instance(self.id)
+            assistant_data = Client.call(client.beta.assistants.update,
                 assistant_id=self.id,
                 instructions=instructions,
                 name=name,
@@ -203,18 +250,12 @@ class Assistant:
                 file_ids=file_ids
             )
             
-            self.object = assistant_data.object
-            self.created_at = assistant_data.created_at
-            self.name = assistant_data.name
-            self.description = assistant_data.description
-            self.model = assistant_data.model
-            self.instructions = assistant_data.instructions
-            self.tools = assistant_data.tools
-            self.file_ids = assistant_data.file_ids
-            self.metadata = assistant_data.metadata
+            mapper(Assistant).update(self, assistant_data)
 
         except Exception as e:
-            raise ValueError("Failed to modify assistant") from e
+            raise APIError.from_exception("Failed to modify assistant", e) from e
+
+        self._remember()
 
 
     def delete_assistant(self):
@@ -227,15 +268,48 @@ class Assistant:
         Raises:
             ValueError: If assistant deletion fails.
         """
-        client = Client.get_instance()
+        client = Client.get_instance(self.id)
 
         try:
-            client = Client.get_instance()
-            return client.beta.assistants.delete(self.id)
+            client = Client.get_instance(self.id)
+            response = Client.call(client.beta.assistants.delete, self.id)
         except Exception as e:
-            raise ValueError("Failed to delete assistant") from e
+            raise APIError.from_exception("Failed to delete assistant", e) from e
+
+        self._forget()
+        Client.unpin(self.id)
+        return response
 
         
+    def _load_cached(self) -> bool:
+        cached = Assistant.cache.get(self.id)
+        if cached is None:
+            return False
+        # Instances must not share the cached lists and dicts.
+        for name, value in cached.items():
+            setattr(self, name, value.copy() if isinstance(value, (list, dict)) else value)
+        return True
+
+
+    def _remember(self) -> None:
+        assistant_fields = mapper(Assistant)
+        Assistant.cache.put(self.id, dict(zip(assistant_fields.fields, assistant_fields.values(self))))
+        write_through(self)
+
+
+    def _forget(self) -> None:
+        Assistant.cache.invalidate(self.id)
+        evict('Assistant', self.id)
+
+
+    def _load_stored(self) -> bool:
+        stored = read_through('Assistant', self.id)
+        if stored is None:
+            return False
+        mapper(Assistant).update(self, stored)
+        return True
+
+
     def create_assistant_file(self, file_id: str) -> 'AssistantFile':
         """
         Creates a new assistant file.
@@ -249,16 +323,19 @@ class Assistant:
         Raises:
             ValueError: If assistant file creation fails.
         """
-        client = Client.get_instance()
+        client = Client.get_instance(self.id)
 
         try:
-            assistant_file = client.beta.assistants.files.create(
+            assistant_file = Client.call(client.beta.assistants.files.create,
                 assistant_id=self.id, 
                 file_id=file_id
                 )
-            return AssistantFile(**assistant_file)
+            assistant_file = mapper(AssistantFile).build(assistant_file)
         except Exception as e:
-            raise ValueError("Failed to create assistant file") from e
+            raise APIError.from_exception("Failed to create assistant file", e) from e
+
+        self._forget()
+        return assistant_file
         
 
     def retrieve_assistant_file(self, file_id: str) -> 'AssistantFile':
@@ -274,16 +351,16 @@ class Assistant:
         Raises:
             ValueError: If assistant file retrieval fails.
         """
-        client = Client.get_instance()
+        client = Client.get_instance(self.id)
 
         try:
-            assistant_file = client.beta.assistants.files.retrieve(
+            assistant_file = Client.call(client.beta.assistants.files.retrieve,
                 assistant_id=self.id, 
                 file_id=file_id
                 )
-            return AssistantFile(**assistant_file)
+            return mapper(AssistantFile).build(assistant_file)
         except Exception as e:
-            raise ValueError("Failed to retrieve assistant file") from e
+            raise APIError.from_exception("Failed to retrieve assistant file", e) from e
         
 
     def delete_assistant_file(self, file_id: str) -> dict:
@@ -299,15 +376,18 @@ class Assistant:
         Raises:
             ValueError: If assistant file deletion fails.
         """
-        client = Client.get_instance()
+        client = Client.get_instance(self.id)
 
         try:
-            return client.beta.assistants.files.delete(
+            response = Client.call(client.beta.assistants.files.delete,
                 assistant_id=self.id, 
                 file_id=file_id
                 )
         except Exception as e:
-            raise ValueError("Failed to delete assistant file") from e
+            raise APIError.from_exception("Failed to delete assistant file", e) from e
+
+        self._forget()
+        return response
         
         
     def list_assistant_files(self) -> list['AssistantFile']:
@@ -320,15 +400,15 @@ class Assistant:
         Raises:
             ValueError: If listing assistant files fails.
         """
-        client = Client.get_instance()
+        client = Client.get_instance(self.id)
 
         try:
-            assistant_files = client.beta.assistants.files.list(
+            assistant_files = Client.call(client.beta.assistants.files.list,
                 assistant_id=self.id
                 )
-            return [AssistantFile(**assistant_file) for assistant_file in assistant_files]
+            return mapper(AssistantFile).build_many(assistant_files)
         except Exception as e:
-            raise ValueError("Failed to list assistant files") from e
+            raise APIError.from_exception("Failed to list assistant files", e) from e
         
     def create_run(self, thread: Thread) -> Run:
         """
@@ -343,34 +423,16 @@ class Assistant:
         Raises:
             ValueError: If run creation fails.
         """
-        client = Client.get_instance()
+        client = Client.get_instance(thread.id)
 
         try:
-            run_data = client.beta.assistants.create_run(
+            run_data = Client.call(client.beta.assistants.create_run,
                 assistant_id=self.id,
                 thread_id=thread.id
             )
-            return Run(
-                id = run_data.id,
-                object = run_data.object,
-                created_at = run_data.created_at,
-                status = run_data.status,
-                started_at = run_data.started_at,
-                expires_at = run_data.expires_at,
-                cancelled_at = run_data.cancelled_at,
-                failed_at = run_data.failed_at,
-                completed_at = run_data.completed_at,
-                last_error = run_data.last_error,
-                model = run_data.model,
-                instructions = run_data.instructions,
-                tools = run_data.tools,
-                file_ids = run_data.file_ids,
-                metadata = run_data.metadata,
-                thread_id=run_data.thread_id,
-                assistant_id=run_data.assistant_id
-            )
+            return mapper(Run).build(run_data)
         except Exception as e:
-            raise ValueError("Failed to create run") from e
+            raise APIError.from_exception("Failed to create run", e) from e
     
 
 
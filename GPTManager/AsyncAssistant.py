@@ -0,0 +1,321 @@
+from typing import Any, Optional
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GPTManager.Client import Client
+from GPTManager.Errors import APIError
+from .Assistant import Assistant, AssistantFile, Tool
+from .Thread import Thread
+from .AsyncRun import AsyncRun
+from .Mapper import mapper
+
+
+class AsyncAssistant(Assistant):
+    """
+    Asyncio counterpart of Assistant, backed by the AsyncOpenAI client.
+
+    Constructing an AsyncAssistant never performs I/O. Awaiting it retrieves
+    or creates the assistant with the same keyword arguments as Assistant:
+
+        assistant = await AsyncAssistant(assistant_id="asst_abc123")
+        assistant = await AsyncAssistant(instructions=..., name=..., model=...)
+
+    All methods mirror Assistant and return the same dataclasses.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        """
+        Stores the constructor arguments without calling the API.
+
+        Parameters:
+            kwargs: The same keyword arguments accepted by Assistant.
+
+        Returns:
+            None
+        """
+        self.id = kwargs.get('assistant_id', None)
+        self.__kwargs = kwargs
+
+
+    @classmethod
+    def ref(cls, assistant_id: str) -> 'AsyncAssistant':
+        """
+        Creates a handle for an existing assistant without calling the API.
+
+        AsyncAssistant handles never fetch implicitly, since attribute access
+        cannot await. Await the handle to load the other attributes.
+
+        Parameters:
+            assistant_id (str): The ID of the assistant.
+
+        Returns:
+            AsyncAssistant: The assistant handle.
+        """
+        return cls(assistant_id=assistant_id)
+
+
+    def __await__(self):
+        return self.__hydrate().__await__()
+
+
+    async def __hydrate(self) -> 'AsyncAssistant':
+        kwargs = self.__kwargs
+        if self.id is not None:
+            if not self._load_cached() and not self._load_stored():
+                await self.retrieve_assistant()
+        elif 'instructions' in kwargs and 'name' in kwargs and 'model' in kwargs:
+            await self.create_assistant(
+                instructions=kwargs['instructions'],
+                name=kwargs['name'],
+                model=kwargs['model'],
+                tools=kwargs.get('tools', [])
+            )
+        return self
+
+
+    async def create_assistant(
+        self,
+        instructions: str,
+        name: str,
+        model: str,
+        tools: list[dict[str, str]] = [],
+    ) -> None:
+        """
+        Creates a new assistant using the OpenAI client and sets the assistant attribute.
+
+        Parameters:
+            instructions (str): The instructions for the assistant.
+            name (str): The name of the assistant.
+            model (str): The model identifier.
+            tools (list[dict[str, str]]): The list of tools to be associated with the assistant.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the assistant creation fails or returns invalid data.
+        """
+        client = Client.get_async_instance()
+
+        try:
+            assistant_data = await Client.call_async(client.beta.assistants.create,
+                instructions=instructions,
+                name=name,
+                tools=tools,
+                model=model,
+            )
+
+            mapper(Assistant).update(self, assistant_data)
+            Client.pin(self.id, client)
+
+        except Exception as e:
+            raise APIError.from_exception("Failed to create assistant", e) from e
+
+        self._remember()
+
+
+    async def retrieve_assistant(self) -> None:
+        """
+        Retrieves the assistant from id using the OpenAI client and sets the assistant attribute.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the assistant retrieval fails or returns invalid data.
+        """
+        client = Client.get_async_instance(self.id)
+
+        try:
+            assistant_data = await Client.call_shared_async(client.beta.assistants.retrieve, self.id)
+
+            mapper(Assistant).update(self, assistant_data)
+
+        except Exception as e:
+            raise APIError.from_exception("Failed to retrieve assistant", e) from e
+
+        self._remember()
+
+
+    async def modify_assistant(
+        self,
+        instructions: str,
+        name: Optional[str],
+        tools: list[Tool],
+        model: str,
+        file_ids: list[Any] = []
+    ) -> None:
+        """
+        Modifies the assistant's details.
+
+        Parameters:
+            instructions (str): New instructions for the assistant.
+            name (Optional[str]): New name of the assistant.
+            tools (List[Tool]): List of tools to be associated with the assistant.
+            model (str): Model identifier.
+            file_ids (List[Any]): List of file IDs associated with the assistant.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If assistant modification fails or returns invalid data.
+        """
+        try:
+            client = Client.get_async_instance(self.id)
+            assistant_data = await Client.call_async(client.beta.assistants.update,
+                assistant_id=self.id,
+                instructions=instructions,
+                name=name,
+                tools=[tool.__dict__ for tool in tools],  # Convert Tool objects to dictionaries
+                model=model,
+                file_ids=file_ids
+            )
+
+            mapper(Assistant).update(self, assistant_data)
+
+        except Exception as e:
+            raise APIError.from_exception("Failed to modify assistant", e) from e
+
+        self._remember()
+
+
+    async def delete_assistant(self):
+        """
+        Deletes the assistant.
+
+        Returns:
+            The deletion status returned by the API.
+
+        Raises:
+            ValueError: If assistant deletion fails.
+        """
+        try:
+            client = Client.get_async_instance(self.id)
+            response = await Client.call_async(client.beta.assistants.delete, self.id)
+        except Exception as e:
+            raise APIError.from_exception("Failed to delete assistant", e) from e
+
+        self._forget()
+        Client.unpin(self.id)
+        return response
+
+
+    async def create_assistant_file(self, file_id: str) -> AssistantFile:
+        """
+        Creates a new assistant file.
+
+        Parameters:
+            file_id (str): The ID of the file.
+
+        Returns:
+            AssistantFile: The created assistant file.
+
+        Raises:
+            ValueError: If assistant file creation fails.
+        """
+        client = Client.get_async_instance(self.id)
+
+        try:
+            assistant_file = await Client.call_async(client.beta.assistants.files.create,
+                assistant_id=self.id,
+                file_id=file_id
+                )
+            assistant_file = mapper(AssistantFile).build(assistant_file)
+        except Exception as e:
+            raise APIError.from_exception("Failed to create assistant file", e) from e
+
+        self._forget()
+        return assistant_file
+
+
+    async def retrieve_assistant_file(self, file_id: str) -> AssistantFile:
+        """
+        Retrieves an assistant file.
+
+        Parameters:
+            file_id (str): The ID of the file.
+
+        Returns:
+            AssistantFile: The retrieved assistant file.
+
+        Raises:
+            ValueError: If assistant file retrieval fails.
+        """
+        client = Client.get_async_instance(self.id)
+
+        try:
+            assistant_file = await Client.call_async(client.beta.assistants.files.retrieve,
+                assistant_id=self.id,
+                file_id=file_id
+                )
+            return mapper(AssistantFile).build(assistant_file)
+        except Exception as e:
+            raise APIError.from_exception("Failed to retrieve assistant file", e) from e
+
+
+    async def delete_assistant_file(self, file_id: str) -> dict:
+        """
+        Deletes an assistant file.
+
+        Parameters:
+            file_id (str): The ID of the file.
+
+        Returns:
+            dict: The response from the API.
+
+        Raises:
+            ValueError: If assistant file deletion fails.
+        """
+        client = Client.get_async_instance(self.id)
+
+        try:
+            response = await Client.call_async(client.beta.assistants.files.delete,
+                assistant_id=self.id,
+                file_id=file_id
+                )
+        except Exception as e:
+            raise APIError.from_exception("Failed to delete assistant file", e) from e
+
+        self._forget()
+        return response
+
+
+    async def list_assistant_files(self) -> list[AssistantFile]:
+        """
+        Lists all assistant files.
+
+        Returns:
+            list[AssistantFile]: The list of assistant files.
+
+        Raises:
+            ValueError: If listing assistant files fails.
+        """
+        client = Client.get_async_instance(self.id)
+
+        try:
+            assistant_files = await Client.call_async(client.beta.assistants.files.list,
+                assistant_id=self.id
+                )
+            return mapper(AssistantFile).build_many(assistant_files.data)
+        except Exception as e:
+            raise APIError.from_exception("Failed to list assistant files", e) from e
+
+
+    async def create_run(self, thread: Thread) -> AsyncRun:
+        """
+        Creates a new run.
+
+        Parameters:
+            thread (Thread): The thread to be used for the run.
+
+        Returns:
+            AsyncRun: The created run.
+
+        Raises:
+            ValueError: If run creation fails.
+        """
+        run = AsyncRun(thread_id=thread.id, assistant_id=self.id)
+        await run.create_run()
+        return run
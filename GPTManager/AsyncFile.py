@@ -0,0 +1,214 @@
+import asyncio
+import mmap
+import os
+from typing import BinaryIO, Callable, Optional, Union
+
+from GPTManager.Client import Client
+from GPTManager.ChunkedUpload import DEFAULT_PART_SIZE, ChunkedUpload
+from GPTManager.Download import DEFAULT_CHUNK_SIZE, download_async, map_file
+from GPTManager.Errors import APIError
+from GPTManager.FileIndex import FileIndex
+from GPTManager.Mapper import mapper
+from .File import File
+
+
+class AsyncFile(File):
+    """
+    Asyncio counterpart of File, backed by the AsyncOpenAI client.
+
+    All methods mirror File and update the same attributes.
+    """
+
+    async def upload_file(self, file_path: str, purpose: str):
+        """
+        Uploads a file to the OpenAI API.
+
+        Parameters:
+            file_path (str): The path to the file to upload.
+            purpose (str): The purpose of the file.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the file upload fails or returns invalid data.
+        """
+        self.purpose = purpose
+        self.filename = file_path.split('/')[-1]
+
+        digest = await asyncio.to_thread(self._digest, file_path)
+        if digest is not None and await self._reuse_indexed(digest, purpose):
+            return
+
+        client = Client.get_async_instance()
+
+        try:
+            with open(file_path, 'rb') as file:
+                file_data = await Client.call_async(client.files.create,
+                    file=file,
+                    purpose=purpose
+                )
+
+            self.id = file_data.id
+            Client.pin(self.id, client)
+            self.object = file_data.object
+            self.bytes = file_data.bytes
+            self.created_at = file_data.created_at
+
+        except Exception as e:
+            raise APIError.from_exception(f'Unable to create file: {e}', e) from e
+
+        self._index(digest, purpose)
+
+    async def upload_file_in_parts(
+        self,
+        file_path: str,
+        purpose: str,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = 4,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        checkpoint_path: Optional[str] = None
+    ) -> None:
+        """
+        Uploads a large file in parts, several at a time, resuming from the completed parts after a failure.
+
+        See File.upload_file_in_parts.
+        """
+        digest = await asyncio.to_thread(self._digest, file_path)
+        if digest is not None and await self._reuse_indexed(digest, purpose):
+            return
+
+        upload = getattr(self, '_upload', None)
+        if upload is None or (upload.file_path, upload.purpose, upload.part_size) != (file_path, purpose, part_size):
+            upload = self._upload = ChunkedUpload(file_path, purpose, part_size, max_concurrency, on_progress, checkpoint_path)
+        upload.max_concurrency = max_concurrency
+        upload.on_progress = on_progress
+
+        client = Client.get_async_instance()
+
+        try:
+            file_data = await upload.run_async(client)
+        except Exception as e:
+            raise APIError.from_exception(f'Unable to upload file in parts: {e}', e) from e
+
+        mapper(File).update(self, file_data)
+        Client.pin(self.id, client)
+        self._upload = None
+        self._index(digest, purpose)
+
+    async def _reuse_indexed(self, digest: str, purpose: str) -> bool:
+        index = FileIndex.get_instance()
+        file_id = index.get(digest, purpose)
+        if file_id is None:
+            return False
+        self.id = file_id
+        try:
+            await self.retrieve_file()
+        except APIError as e:
+            if e.status_code != 404:
+                raise
+            index.discard(file_id)
+            return False
+        index.hits += 1
+        return True
+
+    async def delete_file(self) -> dict:
+        """
+        Deletes a file from the OpenAI API.
+
+        Parameters:
+            None
+
+        Returns:
+            Response from the OpenAI API.
+            {id: str, object: str, deleted: bool}
+
+        Raises:
+            ValueError: If the file deletion fails or returns invalid data.
+            """
+
+        client = Client.get_async_instance(self.id)
+
+        try:
+            deleted = await Client.call_async(client.files.delete, self.id)
+        except Exception as e:
+            raise APIError.from_exception(f'Unable to delete file: {e}', e) from e
+
+        index = FileIndex.get_instance()
+        if index is not None:
+            index.discard(self.id)
+        Client.unpin(self.id)
+        return deleted
+
+    async def retrieve_file(self) -> None:
+        """
+        Retrieves a file from the OpenAI API.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the file retrieval fails or returns invalid data.
+            """
+
+        client = Client.get_async_instance(self.id)
+
+        try:
+            file = await Client.call_async(client.files.retrieve, self.id)
+
+            self.object = file.object
+            self.bytes = file.bytes
+            self.created_at = file.created_at
+            self.filename = file.filename
+            self.purpose = file.purpose
+
+        except Exception as e:
+            raise APIError.from_exception(f'Unable to retrieve file: {e}', e) from e
+
+    async def retrieve_file_content(self) -> str:
+        """
+        Retrieves the content of a file from the OpenAI API.
+
+        Parameters:
+            None
+
+        Returns:
+            The content of the file as a string.
+
+        Raises:
+            ValueError: If the file content retrieval fails or returns invalid data.
+        """
+
+        client = Client.get_async_instance(self.id)
+
+        try:
+            content = await Client.call_async(client.files.content, self.id)
+
+            return content.text
+
+        except Exception as e:
+            raise APIError.from_exception(f'Unable to retrieve file content: {e}', e) from e
+
+    async def download_content(
+        self,
+        destination: Union[str, os.PathLike, BinaryIO],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        resume: bool = True,
+        on_progress: Optional[Callable[[int, Optional[int]], None]] = None
+    ) -> int:
+        """
+        Streams the content of the file to a path or binary file object. See File.download_content.
+        """
+        client = Client.get_async_instance(self.id)
+
+        return await download_async(client, self.id, destination, chunk_size, resume, getattr(self, 'bytes', None), on_progress)
+
+    async def map_content(self, path: Union[str, os.PathLike], chunk_size: int = DEFAULT_CHUNK_SIZE) -> mmap.mmap:
+        """
+        Downloads the content of the file to path and returns a read-only memory map of it. See File.map_content.
+        """
+        await self.download_content(path, chunk_size=chunk_size)
+        return map_file(path)
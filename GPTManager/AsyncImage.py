@@ -0,0 +1,115 @@
+from GPTManager.Client import Client
+from GPTManager.Errors import APIError
+from .Image import Image
+
+
+class AsyncImage(Image):
+    """
+    Asyncio counterpart of Image, backed by the AsyncOpenAI client.
+
+    All methods mirror Image and set the b64_json, url and revised_prompt
+    attributes from the first generated image.
+    """
+
+    async def create_image(self, prompt: str, model: str = None, n: int = None, size: str = None):
+        """
+        Creates an image.
+
+        Parameters:
+            model (str): The model to use.
+            prompt (str): The prompt to use.
+            n (int): The number of images to create.
+            size (str): The size of the image.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the image creation fails or returns invalid data.
+        """
+        client = Client.get_async_instance()
+
+        try:
+            kwargs = {
+                "prompt": prompt,
+            }
+            if model is not None:
+                kwargs["model"] = model
+            if n is not None:
+                kwargs["n"] = n
+            if size is not None:
+                kwargs["size"] = size
+
+            image_data = (await Client.call_async(client.images.generate, **kwargs)).data[0]
+
+            self.b64_json = image_data.b64_json or ''
+            self.url = image_data.url
+            self.revised_prompt = image_data.revised_prompt or ''
+        except Exception as e:
+            raise APIError.from_exception(f'Unable to create image: {e}', e) from e
+
+    async def create_image_edit(self, image: str, mask: str, prompt: str, n: int, size: str):
+        """
+        Creates an edited image.
+
+        Parameters:
+            image (str): The path to the image to edit.
+            mask (str): The path to the image mask.
+            prompt (str): The prompt to use.
+            n (int): The number of images to create.
+            size (str): The size of the image.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the image creation fails or returns invalid data.
+        """
+        client = Client.get_async_instance()
+
+        try:
+            with open(image, "rb") as image_file, open(mask, "rb") as mask_file:
+                image_data = (await Client.call_async(client.images.edit,
+                    image=image_file,
+                    mask=mask_file,
+                    prompt=prompt,
+                    n=n,
+                    size=size
+                )).data[0]
+
+            self.b64_json = image_data.b64_json
+            self.url = image_data.url
+            self.revised_prompt = image_data.revised_prompt
+        except Exception as e:
+            raise APIError.from_exception(f'Unable to create image: {e}', e) from e
+
+    async def create_image_variation(self, image: str, n: int, size: str):
+        """
+        Creates a variation of an image.
+
+        Parameters:
+            image (str): The path to the image to create a variation of.
+            n (int): The number of variations to create.
+            size (str): The size of the image.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the image creation fails or returns invalid data.
+        """
+        client = Client.get_async_instance()
+
+        try:
+            with open(image, "rb") as image_file:
+                image_data = (await Client.call_async(client.images.create_variation,
+                    image=image_file,
+                    n=n,
+                    size=size
+                )).data[0]
+
+            self.b64_json = image_data.b64_json
+            self.url = image_data.url
+            self.revised_prompt = image_data.revised_prompt
+        except Exception as e:
+            raise APIError.from_exception(f'Unable to create image: {e}', e) from e
@@ -0,0 +1,413 @@
+
+from typing import AsyncIterator, Optional
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from GPTManager.Client import Client
+from GPTManager.Errors import APIError
+from .Run import Run, RunStep, ToolRegistry
+from .Polling import PollBackoff, RunWaitResult, wait_for_runs_async
+from .RunStream import AsyncRunStream
+from .Pagination import MAX_PAGE_SIZE, page_params, paginate_async
+from .RawJSON import raw_fetch_async
+from .Store import write_through
+from .Mapper import mapper
+
+
+class AsyncRun(Run):
+    """
+    Asyncio counterpart of Run, backed by the AsyncOpenAI client.
+
+    Constructing an AsyncRun never performs I/O. Awaiting it creates or
+    retrieves the run with the same rules as Run.__init__:
+
+        run = await AsyncRun(thread_id=thread.id, assistant_id=assistant.id)
+        run = await AsyncRun(thread_id=thread.id, id=run_id)
+
+    All methods mirror Run and return the same dataclasses.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        """
+        Sets the run attributes from keyword arguments without calling the API.
+
+        Parameters:
+            kwargs: Any of the Run attributes (id, thread_id, assistant_id, ...).
+
+        Returns:
+            None
+        """
+        for name in Run.__annotations__:
+            setattr(self, name, kwargs.get(name, None))
+
+
+    def __await__(self):
+        return self.__hydrate().__await__()
+
+
+    async def __hydrate(self) -> 'AsyncRun':
+        # Built from an API payload: queued or in_progress runs legitimately
+        # have no started_at/completed_at, so don't re-fetch them.
+        if self.id is not None and self.object is not None and self.status is not None:
+            return self
+
+        if self.id is not None and self.thread_id is not None:
+            if not self._load_stored():
+                await self.retrieve_run()
+        elif self.thread_id is not None and self.assistant_id is not None:
+            await self.create_run()
+        return self
+
+
+    async def create_run(self) -> None:
+        """
+        Creates a new thread run.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the thread_id or assistant_id is not set.
+        """
+        client = Client.get_async_instance(self.thread_id)
+
+        try:
+            run = await Client.call_async(client.beta.threads.runs.create,
+                thread_id=self.thread_id,
+                assistant_id=self.assistant_id,
+            )
+
+            self.id = run.id
+            self._copy_from(run)
+
+        except Exception as e:
+            raise APIError.from_exception("Failed to create run", e) from e
+
+        write_through(self)
+
+
+    async def retrieve_run(self):
+        """
+        Retrieves a thread run.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the thread_id or assistant_id is not set.
+        """
+        client = Client.get_async_instance(self.thread_id)
+
+        try:
+            run = await Client.call_shared_async(client.beta.threads.runs.retrieve,
+                thread_id=self.thread_id,
+                run_id=self.id,
+            )
+
+            self._copy_from(run)
+
+        except Exception as e:
+            raise APIError.from_exception("Failed to retrieve run", e) from e
+
+        write_through(self)
+
+
+    async def modify_run(self, metadata) -> None:
+        """
+        Modifies a thread run.
+
+        Parameters:
+            metadata (dict): The metadata to set on the run.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the thread_id or assistant_id is not set.
+        """
+        client = Client.get_async_instance(self.thread_id)
+
+        try:
+            run = await Client.call_async(client.beta.threads.runs.update,
+                thread_id=self.thread_id,
+                run_id=self.id,
+                metadata=metadata
+            )
+
+            self.metadata = run.metadata
+
+        except Exception as e:
+            raise APIError.from_exception("Failed to modify run", e) from e
+
+
+    async def submit_tool_outputs(self, tool_outputs: list[dict]) -> None:
+        """
+        Submits tool outputs for a thread run.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the thread_id or assistant_id is not set.
+        """
+        client = Client.get_async_instance(self.thread_id)
+
+        try:
+            run = await Client.call_async(client.beta.threads.runs.submit_tool_outputs,
+                thread_id=self.thread_id,
+                run_id=self.id,
+                tool_outputs=tool_outputs
+            )
+
+            self._copy_from(run)
+
+        except Exception as e:
+            raise APIError.from_exception("Failed to submit tool outputs", e) from e
+
+        write_through(self)
+
+
+    async def cancel_run(self) -> None:
+        """
+        Cancels a thread run.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the thread_id or assistant_id is not set.
+        """
+        client = Client.get_async_instance(self.thread_id)
+
+        try:
+            run = await Client.call_async(client.beta.threads.runs.cancel,
+                thread_id=self.thread_id,
+                run_id=self.id,
+            )
+
+            self._copy_from(run)
+
+        except Exception as e:
+            raise APIError.from_exception("Failed to cancel run", e) from e
+
+        write_through(self)
+
+
+    async def create_thread_and_run(self, messages: list[dict]):
+        """
+        Creates a thread and run.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the thread_id or assistant_id is not set.
+        """
+        client = Client.get_async_instance(self.assistant_id)
+
+        try:
+            run = await Client.call_async(client.beta.threads.create_and_run,
+                assistant_id=self.assistant_id,
+                thread={
+                    "messages": messages
+                }
+            )
+
+            self.id = run.id
+            self.thread_id = run.thread_id
+            Client.pin(self.thread_id, client)
+            self._copy_from(run)
+
+        except Exception as e:
+            raise APIError.from_exception("Failed to create thread and run", e) from e
+
+        write_through(self)
+
+
+    async def retrieve_run_step(self, step_id: str) -> RunStep:
+        client = Client.get_async_instance(self.thread_id)
+
+        try:
+            run_step = await Client.call_async(client.beta.threads.runs.steps.retrieve,
+                thread_id=self.thread_id,
+                run_id=self.id,
+                step_id=step_id
+            )
+            step = mapper(RunStep).build(run_step)
+
+        except Exception as e:
+            raise APIError.from_exception("Failed to retrive run step.", e) from e
+
+        write_through(step)
+        return step
+
+
+    async def list_run_steps(
+        self,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        raw: bool = False
+    ) -> list[RunStep]:
+        """
+        Lists the steps of the run, following every page.
+
+        Parameters:
+            limit (int): The maximum number of steps to return. None returns all of them.
+            order (str): 'asc' or 'desc' by creation time.
+            page_size (int): The number of steps requested per page, at most 100.
+            raw (bool): Decode the response JSON directly into RunSteps, see iter_run_steps().
+
+        Returns:
+            list[RunStep]: The steps of the run.
+
+        Raises:
+            ValueError: If the API call fails.
+        """
+        run_steps = [run_step async for run_step in self.iter_run_steps(limit=limit, order=order, page_size=page_size, raw=raw)]
+        write_through(*run_steps)
+        return run_steps
+
+
+    async def iter_run_steps(
+        self,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = True,
+        raw: bool = False
+    ) -> AsyncIterator[RunStep]:
+        """
+        Lazily yields the steps of the run, one page in memory at a time.
+
+        In raw mode each page body is decoded once and built into RunSteps
+        without the SDK's pydantic models, so step_details and last_error are dicts.
+
+        Parameters:
+            limit (int): The maximum number of steps to yield. None yields all of them.
+            order (str): 'asc' or 'desc' by creation time.
+            page_size (int): The number of steps requested per page, at most 100.
+            prefetch (bool): Whether to request the next page ahead of time.
+            raw (bool): Decode the response JSON directly into RunSteps.
+
+        Returns:
+            AsyncIterator[RunStep]: The steps of the run.
+
+        Raises:
+            ValueError: If the API call fails.
+        """
+        client = Client.get_async_instance(self.thread_id)
+
+        try:
+            params = page_params(limit, page_size, order)
+            if raw:
+                fetch = raw_fetch_async(
+                    client.beta.threads.runs.steps.with_raw_response.list, RunStep, thread_id=self.thread_id, run_id=self.id
+                )
+                async for run_step in paginate_async(fetch, params, limit=limit, prefetch=prefetch):
+                    yield run_step
+                return
+            run_steps = paginate_async(
+                lambda **params: Client.call_async(client.beta.threads.runs.steps.list,
+                    thread_id=self.thread_id,
+                    run_id=self.id,
+                    **params
+                ),
+                params,
+                limit=limit,
+                prefetch=prefetch
+            )
+            build = mapper(RunStep).build
+            async for run_step in run_steps:
+                yield build(run_step)
+
+        except Exception as e:
+            raise APIError.from_exception("Failed to list run steps", e) from e
+
+
+    async def wait_run(self, timeout: Optional[float] = None, backoff: Optional[PollBackoff] = None) -> RunWaitResult:
+        """
+        Polls the run until it leaves the queued, in_progress and cancelling states.
+
+        Parameters:
+            timeout (float): Seconds after which to stop waiting. None waits indefinitely.
+            backoff (PollBackoff): The polling cadence. Defaults to PollBackoff().
+
+        Returns:
+            RunWaitResult: The run with its latest state and the number of polls the wait cost.
+
+        Raises:
+            ValueError: If the run retrieval fails.
+        """
+        return await wait_for_runs_async([self], timeout=timeout, backoff=backoff)
+
+
+    async def stream_run(self) -> AsyncRunStream:
+        """
+        Creates a new thread run for thread_id and assistant_id and streams its events.
+
+        Returns:
+            AsyncRunStream: The stream of typed run events, consumed with `async for`.
+
+        Raises:
+            ValueError: If the thread_id or assistant_id is not set, or if the run creation fails.
+        """
+        client = Client.get_async_instance(self.thread_id)
+
+        try:
+            events = await Client.call_async(client.beta.threads.runs.create,
+                thread_id=self.thread_id,
+                assistant_id=self.assistant_id,
+                stream=True
+            )
+        except Exception as e:
+            raise APIError.from_exception("Failed to create run", e) from e
+
+        return AsyncRunStream(events, self)
+
+
+    async def stream_tool_outputs(self, tool_outputs: list[dict]) -> AsyncRunStream:
+        """
+        Submits tool outputs for a thread run and streams the events of the resumed run.
+
+        Returns:
+            AsyncRunStream: The stream of typed run events, consumed with `async for`.
+
+        Raises:
+            ValueError: If submitting the tool outputs fails.
+        """
+        client = Client.get_async_instance(self.thread_id)
+
+        try:
+            events = await Client.call_async(client.beta.threads.runs.submit_tool_outputs,
+                thread_id=self.thread_id,
+                run_id=self.id,
+                tool_outputs=tool_outputs,
+                stream=True
+            )
+        except Exception as e:
+            raise APIError.from_exception("Failed to submit tool outputs", e) from e
+
+        return AsyncRunStream(events, self)
+
+
+    async def dispatch_tool_calls(self, registry: ToolRegistry) -> list[dict]:
+        """
+        Answers a requires_action run with the tools of a ToolRegistry.
+
+        Parameters:
+            registry (ToolRegistry): The registry mapping tool names to callables.
+
+        Returns:
+            list[dict]: The submitted tool outputs, or an empty list if the run does not require action.
+
+        Raises:
+            ValueError: If submitting the tool outputs fails.
+        """
+        if self.status != 'requires_action' or self.required_action is None:
+            return []
+        tool_outputs = await registry.execute_async(self.required_action.submit_tool_outputs.tool_calls)
+        await self.submit_tool_outputs(tool_outputs)
+        return tool_outputs
+
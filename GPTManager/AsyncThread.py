@@ -0,0 +1,639 @@
+import asyncio
+from typing import Any, AsyncIterator, Callable, Optional, TYPE_CHECKING
+
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from GPTManager.Client import Client
+from .Thread import Thread, Message, MessageFile, Message_Base, _THREAD_FIELDS, _message_params
+from .Mapper import mapper
+from .AsyncRun import AsyncRun
+from .RunStream import AsyncRunStream
+from .Pagination import MAX_PAGE_SIZE, page_params, paginate_async
+from .RawJSON import raw_fetch_async
+from .Polling import PollBackoff, RunWaitResult, wait_for_runs_async
+from .Store import evict, write_through
+from .Errors import APIError, BulkCreateError
+
+if TYPE_CHECKING:
+    from .Assistant import Assistant
+
+
+class AsyncThread(Thread):
+    """
+    Asyncio counterpart of Thread, backed by the AsyncOpenAI client.
+
+    Constructing an AsyncThread never performs I/O. Awaiting it creates a new
+    thread, or retrieves the existing one when a thread_id was given:
+
+        thread = await AsyncThread()
+        thread = await AsyncThread("thread_abc123")
+
+    All methods mirror Thread and return the same dataclasses. Runs are
+    returned as AsyncRun instances.
+    """
+
+    def __init__(self, thread_id: str|None = None, messages: Optional[list[Message_Base]] = None) -> None:
+        """
+        Initializes a thread handle without calling the API.
+        Parameters:
+            thread_id (str): The id of the thread to be retrieved when awaited.
+            messages (list[Message_Base]): Messages to create with the new thread when awaited.
+        Returns:
+            None
+        """
+        self.id = thread_id
+        self._init_messages()
+        self.__initial_messages = messages
+
+
+    @classmethod
+    def ref(cls, thread_id: str) -> 'AsyncThread':
+        """
+        Creates a handle for an existing thread without calling the API.
+
+        AsyncThread handles never fetch implicitly, since attribute access cannot
+        await. Await the handle to load the other attributes.
+
+        Parameters:
+            thread_id (str): The id of the thread.
+
+        Returns:
+            AsyncThread: The thread handle.
+        """
+        return cls(thread_id)
+
+
+    def __await__(self):
+        return self.__hydrate().__await__()
+
+
+    async def __hydrate(self) -> 'AsyncThread':
+        if self.id is not None:
+            if not self._load_stored():
+                await self.retrieve_thread()
+        else:
+            await self.create_thread(messages=self.__initial_messages)
+        return self
+
+
+    async def create_thread(self, messages: Optional[list[Message_Base]] = None):
+        """
+        Creates a new thread using the OpenAI client and sets the id, object, created_at and metadata attributes.
+
+        Parameters:
+            messages (list[Message_Base]): Messages to create with the thread, in one request.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the thread creation fails or returns invalid data.
+        """
+        try:
+            client = Client.get_async_instance()
+            if messages:
+                thread_data = await Client.call_async(client.beta.threads.create, messages=_message_params(messages))
+            else:
+                thread_data = await Client.call_async(client.beta.threads.create)
+            mapper(Thread, _THREAD_FIELDS).update(self, thread_data)
+        except Exception as e:
+            raise APIError.from_exception("Failed to create thread", e) from e
+
+        Client.pin(self.id, client)
+
+        write_through(self)
+        if messages:
+            await self.sync_messages()
+
+
+    async def retrieve_thread(self):
+        """
+        Retrieves the thread from id using the OpenAI client and sets the id, object, created_at and metadata attributes.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the thread retrieval fails or returns invalid data.
+        """
+        try:
+            client = Client.get_async_instance(self.id)
+            thread_data = await Client.call_shared_async(client.beta.threads.retrieve, self.id)
+            mapper(Thread, _THREAD_FIELDS).update(self, thread_data)
+        except Exception as e:
+            raise APIError.from_exception("Failed to retreive thread", e) from e
+
+        write_through(self)
+
+
+    async def modify_thread(self, metadata: dict):
+        """
+        Modifies the thread using the OpenAI client and sets the metadata attribute.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the thread modification fails or returns invalid data.
+        """
+        try:
+            client = Client.get_async_instance(self.id)
+            thread_data = await Client.call_async(client.beta.threads.update,
+                thread_id = self.id,
+                metadata = metadata
+            )
+            self.metadata = thread_data.metadata
+        except Exception as e:
+            raise APIError.from_exception("Failed to modify thread metadata", e) from e
+
+        if self._is_loaded():
+            write_through(self)
+        else:
+            # Storing a ref() handle would read, and so retrieve, its other fields; drop the stale row instead.
+            evict('Thread', self.id)
+
+
+    async def delete_thread(self) -> dict:
+        """
+        Deletes the thread using the OpenAI client.
+
+        Returns:
+            The deletion status returned by the API.
+
+        Raises:
+            ValueError: If the thread deletion fails.
+        """
+        try:
+            client = Client.get_async_instance(self.id)
+            response = await Client.call_async(client.beta.threads.delete, self.id)
+        except Exception as e:
+            raise APIError.from_exception("Failed to delete thread", e) from e
+
+        evict('Thread', self.id)
+        Client.unpin(self.id)
+        return response
+
+
+    async def create_message(self, **kwargs) -> Message:
+        """
+        Creates a message for the thread, either from a Message or by specifying individual parameters.
+
+        Parameters:
+            kwargs: A dictionary of keyword arguments. This can include:
+                - message (Message): An instance of Message containing message details.
+                - role (str): The role of the message sender (required if message is not provided).
+                - content (str): The content of the message (required if message is not provided).
+                - file_ids (list): A list of file IDs to be attached to the message (optional).
+
+        Returns:
+            Message: An instance representing the created message, or None if required parameters are missing.
+
+        Raises:
+            ValueError: If message creation fails or returns invalid data.
+        """
+        if 'message' in kwargs:
+            message = kwargs['message']
+            return await self.__create_message(
+                role=message.role,
+                content=message.content,
+                file_ids=message.file_ids,
+                error="Failed to create message from Message"
+            )
+        elif 'role' in kwargs and 'content' in kwargs:
+            return await self.__create_message(
+                role=kwargs['role'],
+                content=kwargs['content'],
+                file_ids=kwargs.get('file_ids', []),
+                error="Failed to create message"
+            )
+        return None
+
+
+    async def create_messages(self, messages: list[Message_Base], max_concurrency: int = 1) -> list[Message]:
+        """
+        Creates several messages, keeping up to max_concurrency create requests in flight.
+
+        By default the messages are created one after the other and land in the
+        thread in input order, as with Thread.create_messages.
+
+        Parameters:
+            messages (list[Message_Base]): The messages to create.
+            max_concurrency (int): The maximum number of create requests in flight.
+                Values above 1 do not preserve the order of the messages in the thread.
+
+        Returns:
+            list[Message]: The created messages, in input order.
+
+        Raises:
+            BulkCreateError: If some messages could not be created.
+        """
+        if not messages:
+            return []
+
+        window = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def create(message: Message_Base) -> Message:
+            async with window:
+                return await self.create_message(message=message)
+
+        outcomes = await asyncio.gather(*(create(message) for message in messages), return_exceptions=True)
+        errors = {index: outcome for index, outcome in enumerate(outcomes) if isinstance(outcome, Exception)}
+        if errors:
+            results = [None if index in errors else outcome for index, outcome in enumerate(outcomes)]
+            raise BulkCreateError(f"Failed to create {len(errors)} of {len(messages)} messages", results, errors)
+        return list(outcomes)
+
+
+    async def __create_message(self, role: str, content: Any, file_ids: list[str], error: str) -> Message:
+        try:
+            client = Client.get_async_instance(self.id)
+            message_data = await Client.call_async(client.beta.threads.messages.create,
+                thread_id=self.id,
+                role=role,
+                content=content,
+                file_ids=file_ids
+            )
+
+            message = mapper(Message).build(message_data)
+        except Exception as e:
+            raise APIError.from_exception(error, e) from e
+
+        write_through(message)
+        return message
+
+
+    async def retrieve_message(self, message_id: str) -> Message:
+        """
+        Retrieves a message from the thread using the message ID.
+
+        Parameters:
+            message_id (str): The unique identifier of the message to be retrieved.
+
+        Returns:
+            Message: An instance representing the retrieved message.
+
+        Raises:
+            ValueError: If message retrieval fails or returns invalid data.
+        """
+        try:
+            client = Client.get_async_instance(self.id)
+            message_data = await Client.call_async(client.beta.threads.messages.retrieve,
+                message_id=message_id,
+                thread_id=self.id
+            )
+
+            message = mapper(Message).build(message_data)
+        except Exception as e:
+            raise APIError.from_exception("Failed to retrieve message", e) from e
+
+        write_through(message)
+        return message
+
+
+    async def modify_message_metadata(self, message_id: str, metadata: dict) -> Message:
+        """
+        Modifies the metadata of a specific message identified by its ID.
+
+        Parameters:
+            message_id (str): The unique identifier of the message to be modified.
+            metadata (dict): A dictionary containing the metadata to be updated.
+
+        Returns:
+            Message: An instance representing the updated message.
+
+        Raises:
+            ValueError: If message metadata modification fails or returns invalid data.
+        """
+        try:
+            client = Client.get_async_instance(self.id)
+            message_data = await Client.call_async(client.beta.threads.messages.update,
+                message_id=message_id,
+                thread_id=self.id,
+                metadata=metadata
+            )
+
+            message = mapper(Message).build(message_data)
+        except Exception as e:
+            raise APIError.from_exception("Failed to modify message metadata", e) from e
+
+        write_through(message)
+        return message
+
+
+    async def list_thread_messages(
+        self,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        raw: bool = False
+    ) -> list[Message]:
+        """
+        Retrieves a list of messages from the current thread, following every page.
+
+        Parameters:
+            limit (int): The maximum number of messages to return. None returns all of them.
+            order (str): 'asc' or 'desc' by creation time. Defaults to the API order (desc).
+            page_size (int): The number of messages requested per page, at most 100.
+            after (str): Only return messages after this message id.
+            before (str): Only return messages before this message id.
+            raw (bool): Decode the response JSON directly into Messages, skipping the SDK models, see Thread.iter_thread_messages().
+
+        Returns:
+            list[Message]: A list of Message instances representing the messages in the thread.
+
+        Raises:
+            ValueError: If the retrieval of thread messages fails or returns invalid data.
+        """
+        messages = [
+            message
+            async for message
+            in self.iter_thread_messages(limit=limit, order=order, page_size=page_size, after=after, before=before, raw=raw)
+        ]
+        write_through(*messages)
+        return messages
+
+
+    async def iter_thread_messages(
+        self,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        prefetch: bool = True,
+        raw: bool = False
+    ) -> AsyncIterator[Message]:
+        """
+        Lazily yields the messages of the current thread, one page in memory at a time.
+
+        Parameters:
+            limit (int): The maximum number of messages to yield. None yields all of them.
+            order (str): 'asc' or 'desc' by creation time. Defaults to the API order (desc).
+            page_size (int): The number of messages requested per page, at most 100.
+            after (str): Only yield messages after this message id.
+            before (str): Only yield messages before this message id.
+            prefetch (bool): Whether to request the next page ahead of time.
+            raw (bool): Decode the response JSON directly into Messages, see Thread.iter_thread_messages().
+
+        Returns:
+            AsyncIterator[Message]: The messages of the thread.
+
+        Raises:
+            ValueError: If the retrieval of thread messages fails or returns invalid data.
+        """
+        try:
+            client = Client.get_async_instance(self.id)
+            params = page_params(limit, page_size, order, after, before)
+            if raw:
+                fetch = raw_fetch_async(client.beta.threads.messages.with_raw_response.list, Message, self.id)
+                async for message in paginate_async(fetch, params, limit=limit, prefetch=prefetch):
+                    yield message
+                return
+            messages_data = paginate_async(
+                lambda **params: Client.call_async(client.beta.threads.messages.list, self.id, **params),
+                params,
+                limit=limit,
+                prefetch=prefetch
+            )
+            build = mapper(Message).build
+            async for message in messages_data:
+                yield build(message)
+        except Exception as e:
+            raise APIError.from_exception("Failed to retrieve thread messages", e) from e
+
+
+    async def sync_messages(self, page_size: int = MAX_PAGE_SIZE, prefetch: bool = True) -> list[Message]:
+        """
+        Fetches the messages created since the last sync and merges them into `messages`.
+
+        Parameters:
+            page_size (int): The number of messages requested per page, at most 100.
+            prefetch (bool): Whether to request the next page ahead of time.
+
+        Returns:
+            list[Message]: The messages added by this sync, oldest first.
+
+        Raises:
+            ValueError: If the retrieval of thread messages fails.
+        """
+        new_messages = [
+            message
+            async for message
+            in self.iter_thread_messages(order='asc', page_size=page_size, after=self.last_message_id, prefetch=prefetch)
+        ]
+        self._merge_messages(new_messages)
+        write_through(*new_messages)
+        return new_messages
+
+
+    async def retrieve_message_file(self, message_id: str, file_id: str) -> MessageFile:
+        """
+        Retrieves a specific file associated with a message in the thread.
+
+        Parameters:
+            message_id (str): The unique identifier of the message.
+            file_id (str): The unique identifier of the file to be retrieved.
+
+        Returns:
+            MessageFile: An instance representing the retrieved file.
+
+        Raises:
+            ValueError: If file retrieval fails or returns invalid data.
+        """
+        try:
+            client = Client.get_async_instance(self.id)
+            file_data = await Client.call_async(client.beta.threads.messages.files.retrieve,
+                thread_id=self.id,
+                message_id=message_id,
+                file_id=file_id
+            )
+
+            return mapper(MessageFile).build(file_data)
+        except Exception as e:
+            raise APIError.from_exception("Failed to retrieve message file", e) from e
+
+
+    async def list_message_files(
+        self,
+        message_id: str,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE
+    ) -> list[MessageFile]:
+        """
+        Lists all files associated with a specific message in the thread, following every page.
+
+        Parameters:
+            message_id (str): The unique identifier of the message whose files are to be listed.
+            limit (int): The maximum number of files to return. None returns all of them.
+            order (str): 'asc' or 'desc' by creation time.
+            page_size (int): The number of files requested per page, at most 100.
+
+        Returns:
+            list[MessageFile]: A list of MessageFile instances representing the files associated with the message.
+
+        Raises:
+            ValueError: If file listing fails or returns invalid data.
+        """
+        return [
+            message_file
+            async for message_file
+            in self.iter_message_files(message_id, limit=limit, order=order, page_size=page_size)
+        ]
+
+
+    async def iter_message_files(
+        self,
+        message_id: str,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = True
+    ) -> AsyncIterator[MessageFile]:
+        """
+        Lazily yields the files associated with a specific message in the thread.
+
+        Parameters:
+            message_id (str): The unique identifier of the message whose files are to be listed.
+            limit (int): The maximum number of files to yield. None yields all of them.
+            order (str): 'asc' or 'desc' by creation time.
+            page_size (int): The number of files requested per page, at most 100.
+            prefetch (bool): Whether to request the next page ahead of time.
+
+        Returns:
+            AsyncIterator[MessageFile]: The files associated with the message.
+
+        Raises:
+            ValueError: If file listing fails or returns invalid data.
+        """
+        try:
+            client = Client.get_async_instance(self.id)
+            files_data = paginate_async(
+                lambda **params: Client.call_async(client.beta.threads.messages.files.list,
+                    thread_id=self.id,
+                    message_id=message_id,
+                    **params
+                ),
+                page_params(limit, page_size, order),
+                limit=limit,
+                prefetch=prefetch
+            )
+            build = mapper(MessageFile).build
+            async for message_file in files_data:
+                yield build(message_file)
+        except Exception as e:
+            raise APIError.from_exception("Failed to list message files", e) from e
+
+
+    async def list_runs(
+        self,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        on_page: Optional[Callable[[Any], None]] = None
+    ) -> list[AsyncRun]:
+        """
+        Lists all thread runs, following every page.
+        Parameters:
+            limit (int): The maximum number of runs to return. None returns all of them.
+            order (str): 'asc' or 'desc' by creation time.
+            page_size (int): The number of runs requested per page, at most 100.
+            on_page (Callable): Called with every page fetched, e.g. to count requests.
+        Returns:
+            list[AsyncRun]: A list of AsyncRun instances representing each run.
+        Raises:
+            ValueError: If the API call fails.
+        """
+        runs = [run async for run in self.iter_runs(limit=limit, order=order, page_size=page_size, on_page=on_page)]
+        write_through(*runs)
+        return runs
+
+
+    async def iter_runs(
+        self,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = True,
+        on_page: Optional[Callable[[Any], None]] = None
+    ) -> AsyncIterator[AsyncRun]:
+        """
+        Lazily yields the thread runs, one page in memory at a time.
+        Parameters:
+            limit (int): The maximum number of runs to yield. None yields all of them.
+            order (str): 'asc' or 'desc' by creation time.
+            page_size (int): The number of runs requested per page, at most 100.
+            prefetch (bool): Whether to request the next page ahead of time.
+            on_page (Callable): Called with every page fetched, e.g. to count requests.
+        Returns:
+            AsyncIterator[AsyncRun]: The runs of the thread.
+        Raises:
+            ValueError: If the API call fails.
+        """
+        client = Client.get_async_instance(self.id)
+
+        try:
+            runs_data = paginate_async(
+                lambda **params: Client.call_async(client.beta.threads.runs.list, thread_id=self.id, **params),
+                page_params(limit, page_size, order),
+                limit=limit,
+                prefetch=prefetch,
+                on_page=on_page
+            )
+            build = mapper(AsyncRun).build
+            async for run_data in runs_data:
+                yield build(run_data)
+
+        except Exception as e:
+            raise APIError.from_exception("Failed to list runs", e) from e
+
+
+    async def create_run(self, assistant: 'Assistant') -> AsyncRun:
+        """
+        Creates a new run for the thread.
+        Returns:
+            AsyncRun: An instance representing the created run.
+        Raises:
+            ValueError: If the API call fails.
+        """
+        run = AsyncRun(thread_id=self.id, assistant_id=assistant.id)
+        await run.create_run()
+        return run
+
+
+    async def wait_runs(self, timeout: Optional[float] = None, backoff: Optional[PollBackoff] = None) -> RunWaitResult:
+        """
+        Waits for all runs in the thread to complete.
+
+        Parameters:
+            timeout (float): Seconds after which to stop waiting. None waits indefinitely.
+            backoff (PollBackoff): The polling cadence. Defaults to PollBackoff().
+
+        Returns:
+            RunWaitResult: The runs with their latest state, the polls spent per run
+            and the total number of requests, including one per listed page.
+
+        Raises:
+            ValueError: If listing or retrieving the runs fails.
+        """
+        pages = []
+        runs = await self.list_runs(on_page=pages.append)
+        return await wait_for_runs_async(runs, timeout=timeout, backoff=backoff, requests=len(pages))
+
+
+    async def stream_run(self, assistant: 'Assistant') -> AsyncRunStream:
+        """
+        Creates a new run for the thread and streams its events.
+
+        Returns:
+            AsyncRunStream: The stream of typed run events, consumed with `async for`.
+        Raises:
+            ValueError: If the API call fails.
+        """
+        run = AsyncRun(thread_id=self.id, assistant_id=assistant.id)
+        return await run.stream_run()
+
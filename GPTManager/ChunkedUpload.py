@@ -0,0 +1,314 @@
+import asyncio
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Optional
+
+from GPTManager.Client import Client
+from .Errors import APIError
+
+
+MAX_PART_SIZE = 64 * 1024 * 1024
+DEFAULT_PART_SIZE = 16 * 1024 * 1024
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+@dataclass
+class UploadCheckpoint:
+    """
+    The resumable state of a chunked upload, saved as JSON after every completed part.
+
+    Attributes:
+        upload_id (str): The id of the upload created with uploads.create.
+        expires_at (int): The time the upload expires. An expired upload is started again.
+        file_path (str): The uploaded file.
+        size (int): The file size when the upload started.
+        modified_ns (int): The file modification time when the upload started.
+        part_size (int): The size of every part but the last.
+        checksums (list[str]): The MD5 hex digest of each part.
+        parts (dict[int, str]): The part id of each completed part, by part index.
+    """
+    upload_id: str
+    expires_at: Optional[int]
+    file_path: str
+    size: int
+    modified_ns: int
+    part_size: int
+    checksums: list[str]
+    parts: dict[int, str] = field(default_factory=dict)
+
+    def save(self, path: str) -> None:
+        # Written to a temporary file first, so a crash never leaves a truncated checkpoint.
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, 'w') as checkpoint_file:
+            json.dump(asdict(self), checkpoint_file)
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['UploadCheckpoint']:
+        try:
+            with open(path) as checkpoint_file:
+                data = json.load(checkpoint_file)
+            data['parts'] = {int(index): part_id for index, part_id in data['parts'].items()}
+            return cls(**data)
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Invalid upload checkpoint {path}") from e
+
+
+class ChunkedUpload:
+    """
+    Uploads a large file in parts, several at a time, and resumes after failures.
+
+    The file is sent through the Uploads API: uploads.create, one
+    uploads.parts.create per part and uploads.complete with the part ids in
+    order. Before sending, one sequential pass hashes every part and the whole
+    file. Each part is hashed again when it is read for sending, so a file
+    changed during the upload fails instead of being assembled from mixed
+    contents, and the whole-file MD5 is passed to uploads.complete for the
+    API to verify the assembled file.
+
+    At most max_concurrency parts are read and in flight at once, so memory
+    use stays within part_size * max_concurrency. Completed parts are recorded
+    in the checkpoint. When run() fails, calling it again, or on a new
+    ChunkedUpload with the same checkpoint_path, sends only the missing parts.
+    The checkpoint is discarded when the file changed or the upload expired.
+
+        upload = ChunkedUpload("corpus.jsonl", "assistants", checkpoint_path="corpus.upload.json")
+        file_object = upload.run(Client.get_instance())
+
+    Attributes:
+        file_path (str): The file to upload.
+        purpose (str): The purpose of the file.
+        part_size (int): The size of every part but the last, at most 64 MiB.
+        max_concurrency (int): The maximum number of parts read and sent at once.
+        on_progress (Callable[[int, int], None]): Called with the bytes sent so far and the file size after each part.
+        checkpoint_path (str): Where the checkpoint is saved. None keeps it in memory only.
+        checkpoint (UploadCheckpoint): The state of the current upload, None before the first run.
+
+    Methods:
+        run(client): Uploads the missing parts and completes the upload.
+        run_async(client): Asyncio variant of run, for an AsyncOpenAI client.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        purpose: str,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = 4,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        checkpoint_path: Optional[str] = None,
+        mime_type: Optional[str] = None
+    ):
+        if not 0 < part_size <= MAX_PART_SIZE:
+            raise ValueError(f"part_size must be between 1 and {MAX_PART_SIZE} bytes")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.file_path = file_path
+        self.purpose = purpose
+        self.part_size = part_size
+        self.max_concurrency = max_concurrency
+        self.on_progress = on_progress
+        self.checkpoint_path = checkpoint_path
+        self.mime_type = mime_type or mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+        self.checkpoint = UploadCheckpoint.load(checkpoint_path) if checkpoint_path is not None else None
+        self._checksums = None
+        self._md5 = None
+        self._lock = threading.Lock()
+        self._failed = threading.Event()
+
+
+    def run(self, client: Any) -> Any:
+        """
+        Uploads the parts that are not completed yet and completes the upload.
+
+        Parameters:
+            client (OpenAI): The client to send the parts with.
+
+        Returns:
+            FileObject: The created file.
+
+        Raises:
+            ValueError: If a part or the upload fails, or the file changed while being uploaded.
+                The completed parts are kept for the next run.
+        """
+        checkpoint = self._prepare()
+        if checkpoint is None:
+            checkpoint = self._start(Client.call(client.uploads.create, **self._create_params()))
+
+        missing = [index for index in range(len(checkpoint.checksums)) if index not in checkpoint.parts]
+        self._failed.clear()
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='GPTManager-Upload') as executor:
+            futures = [executor.submit(self._send_part, client, checkpoint, index) for index in missing]
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+            for future in done:
+                future.result()
+
+        upload = Client.call(client.uploads.complete,
+            checkpoint.upload_id,
+            part_ids=[checkpoint.parts[index] for index in range(len(checkpoint.checksums))],
+            md5=self._md5
+        )
+        return self._finish(upload)
+
+
+    async def run_async(self, client: Any) -> Any:
+        """
+        Asyncio variant of run. Parts are read in worker threads, so the event loop is not blocked.
+        """
+        checkpoint = await asyncio.to_thread(self._prepare)
+        if checkpoint is None:
+            checkpoint = self._start(await Client.call_async(client.uploads.create, **self._create_params()))
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def send(index: int) -> None:
+            async with semaphore:
+                data = await asyncio.to_thread(self._read_part, checkpoint, index)
+                part = await Client.call_async(client.uploads.parts.create, checkpoint.upload_id, data=data)
+                self._record(checkpoint, index, part.id)
+
+        missing = [index for index in range(len(checkpoint.checksums)) if index not in checkpoint.parts]
+        tasks = [asyncio.ensure_future(send(index)) for index in missing]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        upload = await Client.call_async(client.uploads.complete,
+            checkpoint.upload_id,
+            part_ids=[checkpoint.parts[index] for index in range(len(checkpoint.checksums))],
+            md5=self._md5
+        )
+        return self._finish(upload)
+
+
+    def _prepare(self) -> Optional[UploadCheckpoint]:
+        """
+        Hashes the file and returns the checkpoint to resume, or None if the upload has to start over.
+        """
+        stat = os.stat(self.file_path)
+        self._checksums, self._md5 = _hash_parts(self.file_path, self.part_size)
+        checkpoint = self.checkpoint
+        if checkpoint is None:
+            return None
+        unchanged = (
+            checkpoint.file_path == self.file_path
+            and checkpoint.size == stat.st_size
+            and checkpoint.modified_ns == stat.st_mtime_ns
+            and checkpoint.part_size == self.part_size
+            and checkpoint.checksums == self._checksums
+        )
+        expired = checkpoint.expires_at is not None and checkpoint.expires_at <= time.time()
+        if not unchanged or expired:
+            self.checkpoint = None
+            return None
+        return checkpoint
+
+
+    def _create_params(self) -> dict[str, Any]:
+        return {
+            'bytes': os.path.getsize(self.file_path),
+            'filename': os.path.basename(self.file_path),
+            'mime_type': self.mime_type,
+            'purpose': self.purpose,
+        }
+
+
+    def _start(self, upload: Any) -> UploadCheckpoint:
+        stat = os.stat(self.file_path)
+        self.checkpoint = UploadCheckpoint(
+            upload_id=upload.id,
+            expires_at=getattr(upload, 'expires_at', None),
+            file_path=self.file_path,
+            size=stat.st_size,
+            modified_ns=stat.st_mtime_ns,
+            part_size=self.part_size,
+            checksums=self._checksums,
+        )
+        self._save()
+        return self.checkpoint
+
+
+    def _send_part(self, client: Any, checkpoint: UploadCheckpoint, index: int) -> None:
+        # Parts already queued when another part failed are left for the next run.
+        if self._failed.is_set():
+            return
+        try:
+            data = self._read_part(checkpoint, index)
+            part = Client.call(client.uploads.parts.create, checkpoint.upload_id, data=data)
+        except Exception:
+            self._failed.set()
+            raise
+        self._record(checkpoint, index, part.id)
+
+
+    def _read_part(self, checkpoint: UploadCheckpoint, index: int) -> bytes:
+        with open(self.file_path, 'rb') as source:
+            source.seek(index * checkpoint.part_size)
+            data = source.read(checkpoint.part_size)
+        if hashlib.md5(data).hexdigest() != checkpoint.checksums[index]:
+            raise ValueError(f"{self.file_path} changed during the upload, part {index} no longer matches its checksum")
+        return data
+
+
+    def _record(self, checkpoint: UploadCheckpoint, index: int, part_id: str) -> None:
+        with self._lock:
+            checkpoint.parts[index] = part_id
+            self._save()
+            sent = sum(min(checkpoint.part_size, checkpoint.size - done * checkpoint.part_size) for done in checkpoint.parts)
+        if self.on_progress is not None:
+            self.on_progress(sent, checkpoint.size)
+
+
+    def _finish(self, upload: Any) -> Any:
+        if getattr(upload, 'status', 'completed') != 'completed' or getattr(upload, 'file', None) is None:
+            raise APIError(f"Upload {upload.id} was not completed, status {getattr(upload, 'status', None)}")
+        if self.checkpoint_path is not None:
+            try:
+                os.remove(self.checkpoint_path)
+            except FileNotFoundError:
+                pass
+        self.checkpoint = None
+        return upload.file
+
+
+    def _save(self) -> None:
+        if self.checkpoint_path is not None:
+            self.checkpoint.save(self.checkpoint_path)
+
+
+def _hash_parts(file_path: str, part_size: int) -> tuple[list[str], str]:
+    """
+    Returns the MD5 hex digest of each part and of the whole file, reading the file once in small blocks.
+    """
+    checksums = []
+    whole = hashlib.md5()
+    with open(file_path, 'rb') as source:
+        while True:
+            part = hashlib.md5()
+            remaining = part_size
+            while remaining > 0:
+                block = source.read(min(_HASH_BLOCK_SIZE, remaining))
+                if not block:
+                    break
+                part.update(block)
+                whole.update(block)
+                remaining -= len(block)
+            if remaining == part_size:
+                break
+            checksums.append(part.hexdigest())
+            if remaining > 0:
+                break
+    # An empty file is still sent as one empty part.
+    return checksums or [whole.hexdigest()], whole.hexdigest()
@@ -1,11 +1,272 @@
-from openai import OpenAI
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import httpx
+from openai import OpenAI, AsyncOpenAI, DefaultHttpxClient, DefaultAsyncHttpxClient
+
+from .RateLimiter import RateLimiter
+from .Retry import CircuitBreaker, RetryPolicy, call, call_async
+from .SingleFlight import SingleFlight
+
+
+@dataclass
+class ClientConfig:
+    """
+    Transport settings shared by the sync and async clients.
+
+    Attributes:
+        max_connections (int): Maximum number of open connections in the pool.
+        max_keepalive_connections (int): Maximum number of idle connections kept alive.
+        keepalive_expiry (float): Seconds an idle connection is kept alive.
+        http2 (bool): Negotiate HTTP/2, which multiplexes requests over one connection. Requires the h2 package.
+        connect_timeout (float): Seconds to wait for a connection, including the TLS handshake.
+        read_timeout (float): Seconds to wait for response data.
+        write_timeout (float): Seconds to wait while sending request data.
+        pool_timeout (float): Seconds to wait for a free connection from the pool.
+        http_client (httpx.Client): A custom client for OpenAI. The pool settings above are then ignored for it.
+        async_http_client (httpx.AsyncClient): A custom client for AsyncOpenAI.
+        options (dict): Extra OpenAI constructor arguments, e.g. api_key, organization, base_url or max_retries.
+        rate_limiter (RateLimiter): Holds requests back while the per-minute request or token budget is spent.
+            Shared by the sync and async clients built from this config. None turns client-side limiting off.
+            It is not installed on custom http_client or async_http_client instances.
+        retry_policy (RetryPolicy): Backoff used by Client.call. None sends every call once. While it is set,
+            the OpenAI client's own retries default to off (options max_retries=0), so failures are not retried twice.
+        circuit_breaker (CircuitBreaker): Fails calls fast after repeated upstream failures. None disables it.
+    """
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    connect_timeout: float = 5.0
+    read_timeout: float = 600.0
+    write_timeout: float = 600.0
+    pool_timeout: float = 10.0
+    http_client: Optional[httpx.Client] = None
+    async_http_client: Optional[httpx.AsyncClient] = None
+    options: dict[str, Any] = field(default_factory=dict)
+    rate_limiter: Optional[RateLimiter] = field(default_factory=RateLimiter)
+    retry_policy: Optional[RetryPolicy] = field(default_factory=RetryPolicy)
+    circuit_breaker: Optional[CircuitBreaker] = field(default_factory=CircuitBreaker)
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    def build_client(self, transport: Optional[httpx.BaseTransport] = None) -> OpenAI:
+        """
+        Builds an OpenAI client from these settings, optionally over a given transport.
+        """
+        hooks = self.rate_limiter.hooks() if self.rate_limiter is not None else None
+        http_client = self.http_client or _http_client(DefaultHttpxClient, self, transport, hooks)
+        return OpenAI(http_client=http_client, timeout=self.timeout(), **self.client_options())
+
+    def build_async_client(self, transport: Optional[httpx.AsyncBaseTransport] = None) -> AsyncOpenAI:
+        """
+        Builds an AsyncOpenAI client from these settings, optionally over a given transport.
+        """
+        hooks = self.rate_limiter.async_hooks() if self.rate_limiter is not None else None
+        http_client = self.async_http_client or _http_client(DefaultAsyncHttpxClient, self, transport, hooks)
+        return AsyncOpenAI(http_client=http_client, timeout=self.timeout(), **self.client_options())
+
+    def client_options(self) -> dict[str, Any]:
+        options = dict(self.options)
+        if self.retry_policy is not None:
+            options.setdefault('max_retries', 0)
+        return options
 
 
 class Client:
+    """
+    Process-wide OpenAI clients. Every module uses these, so all requests share one connection pool.
+
+    When a ClientPool is installed with use_pool(), get_instance() and
+    get_async_instance() return the client of the pool member that owns the
+    given id, or of the least loaded member.
+
+    Methods:
+        configure(**settings): Sets the transport settings and rebuilds the clients on next use.
+        use_pool(pool): Routes every request through a ClientPool. None goes back to the single client.
+        get_instance(owner_id): Returns the OpenAI client for a thread, assistant or file id.
+        get_async_instance(owner_id): Returns the AsyncOpenAI client for a thread, assistant or file id.
+        pin(owner_id, client): Records that owner_id was created through client.
+        unpin(owner_id): Forgets the pin of a deleted owner_id.
+        call(fn, *args, **kwargs): Calls an OpenAI client method with retries and the circuit breaker.
+        call_async(fn, *args, **kwargs): Asyncio variant of call.
+        call_shared(fn, *args, **kwargs): Like call, but concurrent identical reads share one request.
+        call_shared_async(fn, *args, **kwargs): Asyncio variant of call_shared.
+        reset(): Closes the shared clients.
+
+    Attributes:
+        single_flight (SingleFlight): Coalesces identical in-flight reads. Its coalesced counter
+            tells how many calls were answered by a request already in flight.
+    """
     _instance = None
+    _async_instance = None
+    _config = ClientConfig()
+    _pool = None
+    single_flight = SingleFlight()
 
     @classmethod
-    def get_instance(cls):
+    def configure(cls, **settings) -> ClientConfig:
+        """
+        Sets the transport settings used by the shared clients.
+
+        Parameters:
+            settings: Any ClientConfig attribute, e.g. max_connections=200, http2=True,
+                connect_timeout=3, http_client=httpx.Client(...), options={"max_retries": 0},
+                rate_limiter=RateLimiter(requests_per_minute=500, tokens_per_minute=150_000).
+
+        Returns:
+            ClientConfig: The applied configuration.
+
+        Raises:
+            ValueError: If a setting is unknown.
+        """
+        try:
+            config = ClientConfig(**settings)
+        except TypeError as e:
+            raise ValueError("Failed to configure client") from e
+        cls.reset()
+        cls._config = config
+        return config
+
+    @classmethod
+    def use_pool(cls, pool) -> None:
+        cls._pool = pool
+
+    @classmethod
+    def get_instance(cls, owner_id: Optional[str] = None):
+        if cls._pool is not None:
+            return cls._pool.get_client(owner_id)
         if cls._instance is None:
-            cls._instance = OpenAI()
-        return cls._instance
\ No newline at end of file
+            cls._instance = cls._config.build_client()
+        return cls._instance
+
+    @classmethod
+    def get_async_instance(cls, owner_id: Optional[str] = None):
+        if cls._pool is not None:
+            return cls._pool.get_async_client(owner_id)
+        if cls._async_instance is None:
+            cls._async_instance = cls._config.build_async_client()
+        return cls._async_instance
+
+    @classmethod
+    def pin(cls, owner_id: str, client: Any) -> None:
+        """
+        Keeps later requests for owner_id on the pool member whose client created it. A no-op without a pool.
+        """
+        if cls._pool is not None:
+            cls._pool.pin(owner_id, client)
+
+    @classmethod
+    def unpin(cls, owner_id: str) -> None:
+        """
+        Forgets the pool member of a deleted owner_id, so pins do not pile up. A no-op without a pool.
+        """
+        if cls._pool is not None:
+            cls._pool.unpin(owner_id)
+
+    @classmethod
+    def call(cls, fn, *args, **kwargs):
+        """
+        Calls an OpenAI client method, retrying transient failures.
+
+        Reads (retrieve, list, update, delete, cancel) are retried on 408, 429,
+        5xx, timeouts and connection errors. Other calls, such as create, are
+        only retried on 429, because the API may already have acted on them.
+        Retries wait for Retry-After when the API sends it, and otherwise back
+        off exponentially with jitter.
+
+        Parameters:
+            fn (Callable): The client method, e.g. client.beta.threads.retrieve.
+            args, kwargs: The arguments of the call.
+
+        Returns:
+            The result of the call.
+
+        Raises:
+            APIError: If the call failed, with its HTTP status_code.
+            CircuitOpenError: If the circuit breaker is open.
+        """
+        return call(fn, args, kwargs, *cls._resilience(fn))
+
+    @classmethod
+    async def call_async(cls, fn, *args, **kwargs):
+        return await call_async(fn, args, kwargs, *cls._resilience(fn))
+
+    @classmethod
+    def _resilience(cls, fn) -> tuple[Optional[RetryPolicy], Optional[CircuitBreaker]]:
+        # With a pool, a call uses the retry policy and circuit breaker of the member whose client it goes through.
+        if cls._pool is not None:
+            member = cls._pool.member_of(_owning_client(fn))
+            if member is not None:
+                return member.retry_policy, member.circuit_breaker
+        return cls._config.retry_policy, cls._config.circuit_breaker
+
+    @classmethod
+    def call_shared(cls, fn, *args, **kwargs):
+        """
+        Calls an idempotent read, sharing the request with identical calls already in flight.
+
+        Calls are identical when they use the same client method and arguments,
+        e.g. several threads retrieving the same run at once. All of them get
+        the same response object, or the same error.
+        """
+        return cls.single_flight.do(_flight_key(fn, args, kwargs), lambda: cls.call(fn, *args, **kwargs))
+
+    @classmethod
+    async def call_shared_async(cls, fn, *args, **kwargs):
+        return await cls.single_flight.do_async(_flight_key(fn, args, kwargs), lambda: cls.call_async(fn, *args, **kwargs))
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Closes the shared sync client and forgets both clients.
+
+        The next get_instance() or get_async_instance() call builds them again. The
+        async client is not closed here, because closing it has to be awaited on its
+        own event loop.
+        """
+        if cls._instance is not None and cls._config.http_client is None:
+            try:
+                cls._instance.close()
+            except Exception:
+                pass
+        cls._instance = None
+        cls._async_instance = None
+
+
+def _owning_client(fn) -> Any:
+    # SDK methods are bound to a resource that holds its client; with_raw_response wrappers keep the method in __wrapped__.
+    for candidate in (fn, getattr(fn, '__wrapped__', None)):
+        client = getattr(getattr(candidate, '__self__', None), '_client', None)
+        if client is not None:
+            return client
+    return None
+
+
+def _flight_key(fn, args: tuple, kwargs: dict) -> tuple:
+    # Bound methods of the same client resource compare equal, so the method itself identifies the endpoint.
+    return (fn, args, tuple(sorted(kwargs.items())))
+
+
+def _http_client(http_client_class, config: ClientConfig, transport=None, event_hooks=None):
+    try:
+        if transport is not None:
+            return http_client_class(transport=transport, timeout=config.timeout(), event_hooks=event_hooks)
+        return http_client_class(
+            limits=config.limits(), timeout=config.timeout(), http2=config.http2, event_hooks=event_hooks
+        )
+    except ImportError as e:
+        raise ValueError("http2=True requires the h2 package, install httpx[http2]") from e
@@ -0,0 +1,254 @@
+import contextvars
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+import httpx
+
+from .Client import ClientConfig
+from .Retry import CircuitBreaker
+
+
+_selected_member: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar('gptmanager_pool_member', default=None)
+
+
+class PoolMember:
+    """
+    One API key or organization of a ClientPool, with its own clients, load counters and failure handling.
+
+    Attributes:
+        name (str): The member name used for explicit selection and pinning.
+        config (ClientConfig): The transport settings and OpenAI options (api_key, organization, ...).
+        retry_policy (RetryPolicy): The backoff Client.call uses for requests routed to this member.
+        circuit_breaker (CircuitBreaker): This member's breaker, built with the settings of
+            config.circuit_breaker, so failures of one member never open the circuit of another.
+        outstanding (int): Requests currently in flight through this member.
+        requests (int): Requests sent through this member so far.
+        remaining_requests (int): The last x-ratelimit-remaining-requests value seen, or None.
+        remaining_tokens (int): The last x-ratelimit-remaining-tokens value seen, or None.
+    """
+
+    def __init__(self, name: str, config: ClientConfig):
+        self.name = name
+        self.config = config
+        self.retry_policy = config.retry_policy
+        breaker = config.circuit_breaker
+        self.circuit_breaker = CircuitBreaker(breaker.failure_threshold, breaker.reset_timeout) if breaker is not None else None
+        self.outstanding = 0
+        self.requests = 0
+        self.remaining_requests: Optional[int] = None
+        self.remaining_tokens: Optional[int] = None
+        self._client = None
+        self._async_client = None
+        self._lock = threading.Lock()
+
+
+    def get_client(self):
+        with self._lock:
+            if self._client is None:
+                transport = None
+                if self.config.http_client is None:
+                    transport = _CountingTransport(
+                        httpx.HTTPTransport(limits=self.config.limits(), http2=self.config.http2), self
+                    )
+                self._client = self.config.build_client(transport=transport)
+            return self._client
+
+
+    def get_async_client(self):
+        with self._lock:
+            if self._async_client is None:
+                transport = None
+                if self.config.async_http_client is None:
+                    transport = _AsyncCountingTransport(
+                        httpx.AsyncHTTPTransport(limits=self.config.limits(), http2=self.config.http2), self
+                    )
+                self._async_client = self.config.build_async_client(transport=transport)
+            return self._async_client
+
+
+    def _begin(self) -> None:
+        with self._lock:
+            self.outstanding += 1
+            self.requests += 1
+
+
+    def _end(self, response: Optional[httpx.Response]) -> None:
+        with self._lock:
+            self.outstanding -= 1
+            if response is not None:
+                self.remaining_requests = _header_int(response, 'x-ratelimit-remaining-requests', self.remaining_requests)
+                self.remaining_tokens = _header_int(response, 'x-ratelimit-remaining-tokens', self.remaining_tokens)
+
+
+class ClientPool:
+    """
+    Spreads requests over several API keys or organizations.
+
+    Each request goes to the member with the fewest requests in flight. Ties
+    go to the member with the most remaining rate-limit budget, as reported by
+    the x-ratelimit-remaining-* headers. Threads, assistants and files live in
+    the organization that created them. The pool therefore pins every id
+    created through a member, and later calls for that id use the same member.
+    Deleting a thread, assistant or file drops its pin. Ids created elsewhere
+    can be pinned with pin().
+
+        pool = ClientPool({
+            "primary": ClientConfig(options={"api_key": key_a}),
+            "secondary": ClientConfig(options={"api_key": key_b, "organization": "org-b"}),
+        })
+        Client.use_pool(pool)
+
+        with pool.member("secondary"):
+            thread = Thread()
+
+    Load is counted by a wrapper around each member's HTTP transport. Members
+    configured with a custom http_client are routed, but their load is not counted.
+    Every member config has its own rate limiter, matching the per-key quota, and
+    every member has its own retry policy and circuit breaker, so Client.call
+    keeps sending to healthy members while a failing one is cut off.
+
+    Methods:
+        member(name): Context manager sending new, unpinned requests to one member.
+        pin(owner_id, member): Routes every request for owner_id to a member.
+        unpin(owner_id): Forgets a pin.
+        get_client(owner_id): Returns the OpenAI client for an id, or the least loaded one.
+        get_async_client(owner_id): Asyncio variant of get_client.
+        member_of(client): Returns the member an OpenAI or AsyncOpenAI client belongs to.
+    """
+
+    def __init__(self, members: dict[str, ClientConfig]):
+        if not members:
+            raise ValueError("A client pool needs at least one member")
+        self.members = {name: PoolMember(name, config) for name, config in members.items()}
+        self._pins: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+
+    @contextmanager
+    def member(self, name: str) -> Iterator[PoolMember]:
+        """
+        Sends the requests made inside the block to one member, unless their id is pinned elsewhere.
+
+        Parameters:
+            name (str): The member name.
+
+        Raises:
+            ValueError: If there is no member with that name.
+        """
+        if name not in self.members:
+            raise ValueError(f"No pool member named '{name}'")
+        token = _selected_member.set(name)
+        try:
+            yield self.members[name]
+        finally:
+            _selected_member.reset(token)
+
+
+    def pin(self, owner_id: str, member: Any) -> None:
+        """
+        Routes every later request for owner_id to a member.
+
+        Parameters:
+            owner_id (str): A thread, assistant or file id.
+            member: The member name, PoolMember, or an OpenAI client of the pool.
+        """
+        name = self.__member_name(member)
+        if name is not None and owner_id is not None:
+            with self._lock:
+                self._pins[owner_id] = name
+
+
+    def unpin(self, owner_id: str) -> None:
+        with self._lock:
+            self._pins.pop(owner_id, None)
+
+
+    def route(self, owner_id: Optional[str] = None) -> PoolMember:
+        """
+        Picks the member for a request: the pinned one, the one selected with member(), or the least loaded one.
+        """
+        with self._lock:
+            name = self._pins.get(owner_id) if owner_id is not None else None
+        name = name or _selected_member.get()
+        if name is not None:
+            return self.members[name]
+        return min(self.members.values(), key=_load)
+
+
+    def get_client(self, owner_id: Optional[str] = None):
+        return self.route(owner_id).get_client()
+
+
+    def get_async_client(self, owner_id: Optional[str] = None):
+        return self.route(owner_id).get_async_client()
+
+
+    def member_of(self, client: Any) -> Optional[PoolMember]:
+        """
+        Returns the member whose OpenAI or AsyncOpenAI client this is, or None for a client outside the pool.
+        """
+        name = self.__member_name(client) if client is not None else None
+        return self.members[name] if name is not None else None
+
+
+    def __member_name(self, member: Any) -> Optional[str]:
+        if isinstance(member, str):
+            return member if member in self.members else None
+        if isinstance(member, PoolMember):
+            return member.name
+        for candidate in self.members.values():
+            if member is candidate._client or member is candidate._async_client:
+                return candidate.name
+        return None
+
+
+class _CountingTransport(httpx.BaseTransport):
+
+    def __init__(self, transport: httpx.BaseTransport, member: PoolMember):
+        self._transport = transport
+        self._member = member
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self._member._begin()
+        response = None
+        try:
+            response = self._transport.handle_request(request)
+            return response
+        finally:
+            self._member._end(response)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _AsyncCountingTransport(httpx.AsyncBaseTransport):
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, member: PoolMember):
+        self._transport = transport
+        self._member = member
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._member._begin()
+        response = None
+        try:
+            response = await self._transport.handle_async_request(request)
+            return response
+        finally:
+            self._member._end(response)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _load(member: PoolMember) -> tuple:
+    budget = member.remaining_requests
+    return (member.outstanding, -(budget if budget is not None else float('inf')))
+
+
+def _header_int(response: httpx.Response, name: str, default: Optional[int]) -> Optional[int]:
+    value = response.headers.get(name)
+    try:
+        return int(value) if value is not None else default
+    except ValueError:
+        return default
@@ -0,0 +1,220 @@
+import sys
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class CompactMessage:
+    """
+    A memory-compact, read-only view of a Message for holding many messages in memory.
+
+    The class has __slots__ instead of a per-instance __dict__. Content is a
+    tuple of (type, value) pairs, e.g. ('text', 'Hello') or ('image_file',
+    'file-abc'), instead of SDK objects. Ids that repeat across messages, such
+    as thread_id, assistant_id and run_id, are interned, so all messages of a
+    thread share one string. Empty file_ids and metadata are stored as () and None.
+
+    Attributes:
+        id (str): The message id.
+        created_at (int): The timestamp of message creation.
+        thread_id (str): The thread id.
+        role (str): 'user' or 'assistant'.
+        content (tuple[tuple[str, str], ...]): The (type, value) pair of each content part.
+        file_ids (tuple[str, ...]): The attached file ids.
+        assistant_id (str): The assistant that wrote the message, if any.
+        run_id (str): The run that wrote the message, if any.
+        metadata (dict): The metadata, or None when empty.
+    """
+    __slots__ = ('id', 'created_at', 'thread_id', 'role', 'content', 'file_ids', 'assistant_id', 'run_id', 'metadata')
+    id: str
+    created_at: int
+    thread_id: str
+    role: str
+    content: tuple
+    file_ids: tuple
+    assistant_id: Optional[str]
+    run_id: Optional[str]
+    metadata: Optional[dict]
+
+    @classmethod
+    def from_message(cls, message: Any) -> 'CompactMessage':
+        return cls(
+            id=message.id,
+            created_at=message.created_at,
+            thread_id=_intern(message.thread_id),
+            role=_intern(message.role),
+            content=tuple(_content_part(part) for part in message.content or ()),
+            file_ids=_strings(getattr(message, 'file_ids', None)),
+            assistant_id=_intern(message.assistant_id),
+            run_id=_intern(message.run_id),
+            metadata=message.metadata or None,
+        )
+
+    @property
+    def text(self) -> str:
+        """
+        The text parts of the message, joined by newlines.
+        """
+        return "\n".join(value for kind, value in self.content if kind == 'text')
+
+
+@dataclass
+class CompactRun:
+    """
+    A memory-compact, read-only view of a Run.
+
+    Tools are a tuple of names, 'code_interpreter', 'retrieval' or
+    'function:<name>', and last_error is its message text. Status, model and
+    the thread and assistant ids are interned.
+
+    Attributes:
+        id (str): The run id.
+        created_at (int): The time the run was created.
+        thread_id (str): The thread id.
+        assistant_id (str): The assistant id.
+        status (str): The status of the run.
+        model (str): The model used for the run.
+        started_at (int): The time the run was started.
+        completed_at (int): The time the run completed.
+        cancelled_at (int): The time the run was cancelled.
+        failed_at (int): The time the run failed.
+        expires_at (int): The time the run expires.
+        last_error (str): The last error message.
+        tools (tuple[str, ...]): The tool names.
+        file_ids (tuple[str, ...]): The file ids used for the run.
+        metadata (dict): The metadata, or None when empty.
+    """
+    __slots__ = (
+        'id', 'created_at', 'thread_id', 'assistant_id', 'status', 'model', 'started_at', 'completed_at',
+        'cancelled_at', 'failed_at', 'expires_at', 'last_error', 'tools', 'file_ids', 'metadata',
+    )
+    id: str
+    created_at: int
+    thread_id: str
+    assistant_id: str
+    status: str
+    model: Optional[str]
+    started_at: Optional[int]
+    completed_at: Optional[int]
+    cancelled_at: Optional[int]
+    failed_at: Optional[int]
+    expires_at: Optional[int]
+    last_error: Optional[str]
+    tools: tuple
+    file_ids: tuple
+    metadata: Optional[dict]
+
+    @classmethod
+    def from_run(cls, run: Any) -> 'CompactRun':
+        return cls(
+            id=run.id,
+            created_at=run.created_at,
+            thread_id=_intern(run.thread_id),
+            assistant_id=_intern(run.assistant_id),
+            status=_intern(run.status),
+            model=_intern(run.model),
+            started_at=run.started_at,
+            completed_at=run.completed_at,
+            cancelled_at=run.cancelled_at,
+            failed_at=run.failed_at,
+            expires_at=run.expires_at,
+            last_error=_error_message(run.last_error),
+            tools=tuple(_tool_name(tool) for tool in run.tools or ()),
+            file_ids=_strings(getattr(run, 'file_ids', None)),
+            metadata=run.metadata or None,
+        )
+
+
+@dataclass
+class CompactRunStep:
+    """
+    A memory-compact, read-only view of a RunStep.
+
+    step_details is reduced to what identifies the step's output: the
+    message id of a message_creation step, or the tool call ids of a
+    tool_calls step.
+
+    Attributes:
+        id (str): The run step id.
+        created_at (int): The time the run step was created.
+        run_id (str): The run id.
+        thread_id (str): The thread id.
+        assistant_id (str): The assistant id.
+        type (str): 'message_creation' or 'tool_calls'.
+        status (str): The status of the run step.
+        completed_at (int): The time the run step was completed.
+        last_error (str): The last error message.
+        details (tuple[str, ...]): The created message id, or the tool call ids.
+    """
+    __slots__ = ('id', 'created_at', 'run_id', 'thread_id', 'assistant_id', 'type', 'status', 'completed_at', 'last_error', 'details')
+    id: str
+    created_at: int
+    run_id: str
+    thread_id: str
+    assistant_id: str
+    type: str
+    status: str
+    completed_at: Optional[int]
+    last_error: Optional[str]
+    details: tuple
+
+    @classmethod
+    def from_run_step(cls, step: Any) -> 'CompactRunStep':
+        return cls(
+            id=step.id,
+            created_at=step.created_at,
+            run_id=_intern(step.run_id),
+            thread_id=_intern(step.thread_id),
+            assistant_id=_intern(step.assistant_id),
+            type=_intern(step.type),
+            status=_intern(step.status),
+            completed_at=step.completed_at,
+            last_error=_error_message(step.last_error),
+            details=_step_details(step.step_details),
+        )
+
+
+def _get(obj: Any, name: str) -> Any:
+    # SDK objects and plain dicts read back from the Store carry the same fields.
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _strings(values: Any) -> tuple:
+    return tuple(_intern(value) for value in values) if values else ()
+
+
+def _content_part(part: Any) -> tuple[str, str]:
+    kind = _get(part, 'type')
+    if kind == 'text':
+        return ('text', _get(_get(part, 'text'), 'value') or '')
+    if kind == 'image_file':
+        return ('image_file', _intern(_get(_get(part, 'image_file'), 'file_id')))
+    return (_intern(kind), str(part))
+
+
+def _tool_name(tool: Any) -> str:
+    kind = _get(tool, 'type')
+    if kind == 'function':
+        return _intern(f"function:{_get(_get(tool, 'function'), 'name')}")
+    return _intern(kind)
+
+
+def _error_message(error: Any) -> Optional[str]:
+    if error is None or isinstance(error, str):
+        return error
+    return _get(error, 'message') or str(error)
+
+
+def _step_details(details: Any) -> tuple:
+    if details is None:
+        return ()
+    message_creation = _get(details, 'message_creation')
+    if message_creation is not None:
+        return (_get(message_creation, 'message_id'),)
+    return tuple(_get(call, 'id') for call in _get(details, 'tool_calls') or ())
@@ -0,0 +1,187 @@
+import asyncio
+import mmap
+import os
+import re
+import time
+from typing import Any, BinaryIO, Callable, Optional, Union
+
+from GPTManager.Client import Client
+from .Errors import APIError
+
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+_CONTENT_RANGE = re.compile(r'bytes \d+-\d+/(\d+)')
+
+
+class _Target:
+    """
+    The destination of a download: a path opened here, or a caller's binary file object.
+
+    Writes start at `start`, the position of the file object or the end of an
+    existing partial file when resuming, so a restarted download can truncate
+    back to it.
+    """
+
+    def __init__(self, destination: Union[str, os.PathLike, BinaryIO], resume: bool, expected_size: Optional[int]):
+        self.owned = isinstance(destination, (str, os.PathLike))
+        if self.owned:
+            self.file = open(destination, 'ab' if resume else 'wb')
+            self.start = 0
+            self.written = self.file.tell()
+            if expected_size is not None and self.written > expected_size:
+                self.restart()
+        else:
+            self.file = destination
+            self.start = destination.tell()
+            self.written = 0
+
+    def write(self, chunk: bytes) -> None:
+        self.file.write(chunk)
+        self.written += len(chunk)
+
+    def restart(self) -> None:
+        # The server ignored the Range header and sends the whole file again.
+        self.file.seek(self.start)
+        self.file.truncate()
+        self.written = 0
+
+    def close(self) -> None:
+        if self.owned:
+            self.file.close()
+        else:
+            self.file.flush()
+
+
+def download(
+    client: Any,
+    file_id: str,
+    destination: Union[str, os.PathLike, BinaryIO],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    resume: bool = True,
+    expected_size: Optional[int] = None,
+    on_progress: Optional[Callable[[int, Optional[int]], None]] = None
+) -> int:
+    """
+    Streams the content of a file to a path or binary file object, one chunk in memory at a time.
+
+    A partial file at a destination path is resumed with a Range request when
+    resume is set. A transient failure mid-stream is retried under the
+    client's RetryPolicy from the bytes already written, instead of from the
+    start. A server that ignores Range and answers 200 is handled by
+    truncating and writing the whole body.
+
+    Parameters:
+        client (OpenAI): The client to download with.
+        file_id (str): The id of the file.
+        destination (str | PathLike | BinaryIO): A path, or a file object opened for binary writing.
+        chunk_size (int): The number of bytes read and written at a time.
+        resume (bool): Continue a partial file at a destination path instead of overwriting it.
+        expected_size (int): The size of the file, if known. A complete destination is then not requested again.
+        on_progress (Callable[[int, int], None]): Called with the bytes written and the total size, if known, after each chunk.
+
+    Returns:
+        int: The size of the downloaded content.
+
+    Raises:
+        APIError: If the download fails.
+    """
+    target = _Target(destination, resume, expected_size)
+    try:
+        if expected_size is not None and target.written == expected_size and target.owned:
+            return target.written
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                with client.files.with_streaming_response.content(file_id, extra_headers=_range(target)) as response:
+                    total = _open_stream(response, target, expected_size)
+                    for chunk in response.iter_bytes(chunk_size):
+                        target.write(chunk)
+                        if on_progress is not None:
+                            on_progress(target.written, total)
+                return target.written
+            except Exception as e:
+                if _range_done(e, target):
+                    return target.written
+                policy = Client._config.retry_policy
+                if policy is None or not policy.should_retry(attempt, e, True):
+                    raise APIError.from_exception(f'Unable to download file content: {e}', e, attempt) from e
+                time.sleep(policy.delay(attempt, e))
+    finally:
+        target.close()
+
+
+async def download_async(
+    client: Any,
+    file_id: str,
+    destination: Union[str, os.PathLike, BinaryIO],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    resume: bool = True,
+    expected_size: Optional[int] = None,
+    on_progress: Optional[Callable[[int, Optional[int]], None]] = None
+) -> int:
+    """
+    Asyncio variant of download, for an AsyncOpenAI client.
+    """
+    target = _Target(destination, resume, expected_size)
+    try:
+        if expected_size is not None and target.written == expected_size and target.owned:
+            return target.written
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                async with client.files.with_streaming_response.content(file_id, extra_headers=_range(target)) as response:
+                    total = _open_stream(response, target, expected_size)
+                    async for chunk in response.iter_bytes(chunk_size):
+                        target.write(chunk)
+                        if on_progress is not None:
+                            on_progress(target.written, total)
+                return target.written
+            except Exception as e:
+                if _range_done(e, target):
+                    return target.written
+                policy = Client._config.retry_policy
+                if policy is None or not policy.should_retry(attempt, e, True):
+                    raise APIError.from_exception(f'Unable to download file content: {e}', e, attempt) from e
+                await asyncio.sleep(policy.delay(attempt, e))
+    finally:
+        target.close()
+
+
+def map_file(path: Union[str, os.PathLike]) -> mmap.mmap:
+    """
+    Returns a read-only memory map of a file. Pages are loaded by the OS on access, not read up front.
+
+    Raises:
+        ValueError: If the file is empty, since an empty file cannot be mapped.
+    """
+    with open(path, 'rb') as source:
+        if os.fstat(source.fileno()).st_size == 0:
+            raise ValueError(f"Cannot memory-map the empty file {path}")
+        return mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _range(target: _Target) -> Optional[dict[str, str]]:
+    return {'Range': f'bytes={target.written}-'} if target.written else None
+
+
+def _open_stream(response: Any, target: _Target, expected_size: Optional[int]) -> Optional[int]:
+    """
+    Restarts the target if a Range request was answered with the whole body, and returns the total size if known.
+    """
+    if target.written and response.status_code != 206:
+        target.restart()
+    match = _CONTENT_RANGE.match(response.headers.get('content-range', ''))
+    if match is not None:
+        return int(match.group(1))
+    length = response.headers.get('content-length')
+    if length is not None and length.isdigit():
+        return target.written + int(length)
+    return expected_size
+
+
+def _range_done(error: BaseException, target: _Target) -> bool:
+    # 416: the partial file already holds the whole content.
+    return target.written > 0 and getattr(error, 'status_code', None) == 416
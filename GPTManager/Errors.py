@@ -0,0 +1,84 @@
+from typing import Any, Optional
+
+import httpx
+import openai
+
+
+class BulkCreateError(ValueError):
+    """
+    Raised when some items of a bulk operation failed.
+
+    The items that succeeded were still created, so callers can retry only the
+    failed ones.
+
+    Attributes:
+        results (list): One entry per input item, in input order. None where the item failed.
+        errors (dict[int, Exception]): The error of each failed item, by input index.
+    """
+
+    def __init__(self, message: str, results: list[Optional[Any]], errors: dict[int, Exception]):
+        super().__init__(message)
+        self.results = results
+        self.errors = errors
+
+
+class APIError(ValueError):
+    """
+    Raised when an API call fails. Subclasses ValueError, so existing handlers keep working.
+
+    Attributes:
+        status_code (int): The HTTP status of the failed response, or None for timeouts and connection errors.
+        retryable (bool): Whether the failure was transient, e.g. a 429, a 5xx or a timeout.
+        attempts (int): How many times the call was sent before giving up.
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None, retryable: bool = False, attempts: int = 1):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retryable = retryable
+        self.attempts = attempts
+
+
+    @classmethod
+    def from_exception(cls, message: str, error: BaseException, attempts: int = 1) -> 'APIError':
+        """
+        Builds the error raised for a failed call, keeping the HTTP status and retry details of its cause.
+        """
+        if isinstance(error, APIError):
+            return cls(message, error.status_code, error.retryable, error.attempts)
+        status_code = getattr(error, 'status_code', None)
+        return cls(
+            message,
+            status_code=status_code if isinstance(status_code, int) else None,
+            retryable=is_transient(error),
+            attempts=attempts,
+        )
+
+
+class CircuitOpenError(APIError):
+    """
+    Raised without calling the API while the circuit breaker is open after repeated upstream failures.
+
+    Attributes:
+        retry_at (float): The time.monotonic() value at which a trial call is let through again.
+    """
+
+    def __init__(self, message: str, retry_at: float):
+        super().__init__(message, status_code=None, retryable=True, attempts=0)
+        self.retry_at = retry_at
+
+
+TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Returns whether an error is worth retrying: a transient HTTP status, a timeout or a connection failure.
+    """
+    if isinstance(error, CircuitOpenError):
+        return True
+    status_code = getattr(error, 'status_code', None)
+    if isinstance(status_code, int):
+        return status_code in TRANSIENT_STATUS_CODES
+    # httpx transport errors surface unwrapped when a streamed body breaks off mid-read.
+    return isinstance(error, (openai.APIConnectionError, httpx.TransportError, TimeoutError, ConnectionError))
@@ -1,6 +1,14 @@
+import mmap
+import os
 from dataclasses import dataclass
+from typing import BinaryIO, Callable, Optional, Union
 from openai import OpenAI
 from GPTManager.Client import Client
+from GPTManager.ChunkedUpload import DEFAULT_PART_SIZE, ChunkedUpload
+from GPTManager.Download import DEFAULT_CHUNK_SIZE, download, map_file
+from GPTManager.Errors import APIError
+from GPTManager.FileIndex import FileIndex, file_digest
+from GPTManager.Mapper import mapper
 
 
 @dataclass
@@ -16,6 +24,9 @@ class File:
         """
         Uploads a file to the OpenAI API.
 
+        When a FileIndex is configured, a live file with the same content and
+        purpose is reused instead of uploading it again.
+
         Parameters:
             file_path (str): The path to the file to upload.
             purpose (str): The purpose of the file.
@@ -29,25 +40,109 @@ class File:
         self.purpose = purpose
         self.filename = file_path.split('/')[-1]
 
+        digest = self._digest(file_path)
+        if digest is not None and self._reuse_indexed(digest, purpose):
+            return
+
         client = Client.get_instance()
 
         try:
-            file_data = client.files.create(
-                file=open(file_path, 'rb'),
-                purpose=purpose
-            )
+            with open(file_path, 'rb') as file:
+                file_data = Client.call(client.files.create,
+                    file=file,
+                    purpose=purpose
+                )
 
-            self.id = file_data['id']
-            self.object = file_data['object']
-            self.bytes = file_data['bytes']
-            self.created_at = file_data['created_at']
+            mapper(File).update(self, file_data)
+            Client.pin(self.id, client)
 
         except Exception as e:
-            raise ValueError(f'Unable to create file: {e}')
-        
+            raise APIError.from_exception(f'Unable to create file: {e}', e) from e
+
+        self._index(digest, purpose)
+
+    def upload_file_in_parts(
+        self,
+        file_path: str,
+        purpose: str,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = 4,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        checkpoint_path: Optional[str] = None
+    ) -> None:
+        """
+        Uploads a large file in parts, several at a time, resuming from the completed parts after a failure.
+
+        Calling it again after a failure, on the same File or with the same
+        checkpoint_path, sends only the missing parts. See ChunkedUpload. A
+        configured FileIndex is consulted first, as in upload_file().
+
+        Parameters:
+            file_path (str): The path to the file to upload.
+            purpose (str): The purpose of the file.
+            part_size (int): The size of each part, at most 64 MiB. Memory use is bounded by part_size * max_concurrency.
+            max_concurrency (int): The maximum number of parts sent at once.
+            on_progress (Callable[[int, int], None]): Called with the bytes sent and the file size after each part.
+            checkpoint_path (str): A JSON file to record completed parts in, for resuming from another process.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the upload fails or the file changed while being uploaded.
+        """
+        digest = self._digest(file_path)
+        if digest is not None and self._reuse_indexed(digest, purpose):
+            return
+
+        upload = getattr(self, '_upload', None)
+        if upload is None or (upload.file_path, upload.purpose, upload.part_size) != (file_path, purpose, part_size):
+            upload = self._upload = ChunkedUpload(file_path, purpose, part_size, max_concurrency, on_progress, checkpoint_path)
+        upload.max_concurrency = max_concurrency
+        upload.on_progress = on_progress
+
+        client = Client.get_instance()
+
+        try:
+            file_data = upload.run(client)
+        except Exception as e:
+            raise APIError.from_exception(f'Unable to upload file in parts: {e}', e) from e
+
+        mapper(File).update(self, file_data)
+        Client.pin(self.id, client)
+        self._upload = None
+        self._index(digest, purpose)
+
+    def _digest(self, file_path: str) -> Optional[str]:
+        return file_digest(file_path) if FileIndex.get_instance() is not None else None
+
+    def _reuse_indexed(self, digest: str, purpose: str) -> bool:
+        """
+        Points the file at the indexed upload of the same content, if it still exists.
+        """
+        index = FileIndex.get_instance()
+        file_id = index.get(digest, purpose)
+        if file_id is None:
+            return False
+        self.id = file_id
+        try:
+            self.retrieve_file()
+        except APIError as e:
+            if e.status_code != 404:
+                raise
+            index.discard(file_id)
+            return False
+        index.hits += 1
+        return True
+
+    def _index(self, digest: Optional[str], purpose: str) -> None:
+        index = FileIndex.get_instance()
+        if digest is not None and index is not None:
+            index.put(digest, purpose, self.id)
+
     def delete_file(self) -> dict:
         """
-        Deletes a file from the OpenAI API.
+        Deletes a file from the OpenAI API, and its entries in a configured FileIndex.
         
         Parameters:
             None
@@ -60,12 +155,18 @@ class File:
             ValueError: If the file deletion fails or returns invalid data.
             """
 
-        client = Client.get_instance()
+        client = Client.get_instance(self.id)
 
         try:
-            return client.files.delete(self.id)
+            deleted = Client.call(client.files.delete, self.id)
         except Exception as e:
-            raise ValueError(f'Unable to delete file: {e}')
+            raise APIError.from_exception(f'Unable to delete file: {e}', e) from e
+
+        index = FileIndex.get_instance()
+        if index is not None:
+            index.discard(self.id)
+        Client.unpin(self.id)
+        return deleted
         
     def retrieve_file(self) -> None:
         """
@@ -81,23 +182,21 @@ class File:
             ValueError: If the file retrieval fails or returns invalid data.
             """
 
-        client = Client.get_instance()
+        client = Client.get_instance(self.id)
 
         try:
-            file = client.files.retrieve(self.id)
+            file = Client.call(client.files.retrieve, self.id)
 
-            self.object = file['object']
-            self.bytes = file['bytes']
-            self.created_at = file['created_at']
-            self.filename = file['filename']
-            self.purpose = file['purpose']
+            mapper(File).update(self, file)
 
         except Exception as e:
-            raise ValueError(f'Unable to retrieve file: {e}')
+            raise APIError.from_exception(f'Unable to retrieve file: {e}', e) from e
         
     def retrieve_file_content(self) -> str:
         """
         Retrieves the content of a file from the OpenAI API.
+
+        The whole content is held in memory. Use download_content() for large or binary files.
         
         Parameters:
             None
@@ -109,14 +208,64 @@ class File:
             ValueError: If the file content retrieval fails or returns invalid data.
         """
 
-        client = Client.get_instance()
+        client = Client.get_instance(self.id)
 
         try:
-            file = client.files.retrieve(self.id)
+            content = Client.call(client.files.content, self.id)
 
-            return file['bytes']
+            return content.text
 
         except Exception as e:
-            raise ValueError(f'Unable to retrieve file content: {e}')
+            raise APIError.from_exception(f'Unable to retrieve file content: {e}', e) from e
+
+    def download_content(
+        self,
+        destination: Union[str, os.PathLike, BinaryIO],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        resume: bool = True,
+        on_progress: Optional[Callable[[int, Optional[int]], None]] = None
+    ) -> int:
+        """
+        Streams the content of the file to a path or binary file object, one chunk in memory at a time.
+
+        A partial file left at the destination path by an interrupted download
+        is continued with a byte-range request, and a connection that breaks
+        mid-stream is retried from the bytes already written.
+
+        Parameters:
+            destination (str | PathLike | BinaryIO): A path, or a file object opened for binary writing.
+            chunk_size (int): The number of bytes read and written at a time.
+            resume (bool): Continue a partial file at the destination path instead of overwriting it.
+            on_progress (Callable[[int, int], None]): Called with the bytes written and the total size, if known.
+
+        Returns:
+            int: The size of the downloaded content.
+
+        Raises:
+            ValueError: If the download fails.
+        """
+        client = Client.get_instance(self.id)
+
+        return download(client, self.id, destination, chunk_size, resume, getattr(self, 'bytes', None), on_progress)
+
+    def map_content(self, path: Union[str, os.PathLike], chunk_size: int = DEFAULT_CHUNK_SIZE) -> mmap.mmap:
+        """
+        Downloads the content of the file to path, resuming a partial download, and returns a read-only memory map of it.
+
+        The map reads pages from disk on access, so large outputs can be sliced
+        and searched without loading them into memory. Close it when done.
+
+        Parameters:
+            path (str | PathLike): Where the content is stored.
+            chunk_size (int): The number of bytes read and written at a time.
+
+        Returns:
+            mmap.mmap: The read-only content.
+
+        Raises:
+            ValueError: If the download fails or the file is empty.
+        """
+        self.download_content(path, chunk_size=chunk_size)
+        return map_file(path)
 
   
\ No newline at end of file
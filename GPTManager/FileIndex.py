@@ -0,0 +1,119 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Union
+
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class FileIndex:
+    """
+    Optional content-addressed index of uploaded files, backed by SQLite.
+
+    Maps the SHA-256 digest of a file's content and its purpose to the id of
+    the file already uploaded with them. Once configured, File.upload_file and
+    File.upload_file_in_parts look the digest up first and reuse the existing
+    file instead of uploading the same bytes again. A hit is confirmed with
+    retrieve_file before it is reused, and an id the API no longer knows is
+    dropped and uploaded again. File.delete_file removes the entries of the
+    deleted file.
+
+        FileIndex.configure("files.db")
+
+    Attributes:
+        path (str): The SQLite database path, or ':memory:'.
+        hits (int): Uploads skipped because a live match existed.
+
+    Methods:
+        configure(path): Opens the shared index used by File and AsyncFile.
+        get_instance(): Returns the shared index, or None when deduplication is disabled.
+        disable(): Closes the shared index and turns deduplication off.
+        get(digest, purpose): Returns the file id recorded for a digest and purpose.
+        put(digest, purpose, file_id): Records an uploaded file.
+        discard(file_id): Removes every entry of a file id.
+        close(): Closes the database connection.
+    """
+    _instance = None
+
+    def __init__(self, path: str = "gptmanager-files.db"):
+        self.path = path
+        self.hits = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ':memory:':
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS file_digests ("
+            "digest TEXT NOT NULL, purpose TEXT NOT NULL, file_id TEXT NOT NULL, created_at REAL NOT NULL, "
+            "PRIMARY KEY (digest, purpose))"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS file_digests_file_id ON file_digests (file_id)")
+
+
+    @classmethod
+    def configure(cls, path: str = "gptmanager-files.db") -> 'FileIndex':
+        """
+        Opens the shared index used by File and AsyncFile uploads.
+
+        Parameters:
+            path (str): The SQLite database path, or ':memory:'.
+
+        Returns:
+            FileIndex: The shared index.
+        """
+        if cls._instance is not None:
+            cls._instance.close()
+        cls._instance = cls(path)
+        return cls._instance
+
+
+    @classmethod
+    def get_instance(cls) -> Optional['FileIndex']:
+        return cls._instance
+
+
+    @classmethod
+    def disable(cls) -> None:
+        if cls._instance is not None:
+            cls._instance.close()
+        cls._instance = None
+
+
+    def get(self, digest: str, purpose: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT file_id FROM file_digests WHERE digest = ? AND purpose = ?", (digest, purpose)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+
+    def put(self, digest: str, purpose: str, file_id: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO file_digests (digest, purpose, file_id, created_at) VALUES (?, ?, ?, ?)",
+                (digest, purpose, file_id, time.time())
+            )
+
+
+    def discard(self, file_id: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM file_digests WHERE file_id = ?", (file_id,))
+
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def file_digest(file_path: Union[str, os.PathLike]) -> str:
+    """
+    Returns the SHA-256 hex digest of a file, read in 1 MiB blocks so large files are never held in memory.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as source:
+        for block in iter(lambda: source.read(_HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
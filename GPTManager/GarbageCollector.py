@@ -0,0 +1,253 @@
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Optional
+
+from .Assistant import Assistant
+from .Client import Client
+from .File import File
+from .FileIndex import FileIndex
+from .Organization import Organization
+from .Store import Store, evict
+from .Thread import Thread
+
+
+KINDS = ('file', 'assistant', 'thread')
+
+
+@dataclass
+class CollectionReport:
+    """
+    The outcome of GarbageCollector.run().
+
+    Attributes:
+        dry_run (bool): Whether the selected objects were only reported, not deleted.
+        selected (dict[str, list[str]]): The ids selected per kind ('file', 'assistant', 'thread').
+        deleted (dict[str, list[str]]): The ids deleted per kind, including those the API no longer knew.
+        resumed (int): Selected ids skipped because the checkpoint already lists them as deleted.
+        errors (dict[str, Exception]): The error of each id that could not be deleted.
+        elapsed (float): Seconds the run took.
+    """
+    dry_run: bool
+    selected: dict[str, list[str]] = field(default_factory=lambda: {kind: [] for kind in KINDS})
+    deleted: dict[str, list[str]] = field(default_factory=lambda: {kind: [] for kind in KINDS})
+    resumed: int = 0
+    errors: dict[str, Exception] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def deletions_per_second(self) -> float:
+        deleted = sum(len(ids) for ids in self.deleted.values())
+        return deleted / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class GarbageCollector:
+    """
+    Deletes stale files, assistants and threads of the organization.
+
+    Objects are selected by age, by metadata tags and, for files, by not being
+    referenced by any assistant. Every configured rule that applies to a kind
+    must match: files have no metadata, so the metadata rule is ignored for
+    them, and a kind with no applicable rule is left alone rather than
+    emptied. Files and assistants come from the Organization listings. The API
+    cannot list threads, so threads are taken from the configured Store and
+    skipped without one.
+
+    Selection finishes before the first deletion, so listings are never paged
+    while their items disappear. Deletions run on up to concurrency threads
+    through File.delete_file, Assistant.delete_assistant and
+    Thread.delete_thread. Every request goes through Client.call, so the
+    shared RateLimiter holds deletions back while the request budget is spent
+    and 429s are retried after Retry-After. An object the API no longer knows
+    (404) counts as deleted, and its Store, cache and FileIndex entries are
+    dropped.
+
+    With a checkpoint_path, every deleted id is appended to that file as it
+    completes. A rerun skips the ids it lists, so an interrupted collection of
+    100k objects continues where it stopped.
+
+        collector = GarbageCollector(older_than=7 * 86400, metadata={"env": "test"}, checkpoint_path="gc.log")
+        print(collector.run(dry_run=True).selected)
+        collector.run()
+
+    Attributes:
+        kinds (tuple[str, ...]): The kinds to collect, out of 'file', 'assistant' and 'thread'.
+        older_than (float): Select objects created more than this many seconds ago.
+        metadata (dict[str, str]): Select assistants and threads whose metadata contains all these items.
+        unreferenced (bool): Select files that no assistant lists in its file_ids.
+        purpose (str): Only consider files with this purpose.
+        concurrency (int): The maximum number of deletions in flight.
+        checkpoint_path (str): The file deleted ids are appended to, for resuming. None disables checkpointing.
+
+    Methods:
+        select(): Returns the ids selected per kind, without deleting anything.
+        run(dry_run, on_delete): Selects and deletes the stale objects.
+    """
+
+    def __init__(
+        self,
+        kinds: Iterable[str] = KINDS,
+        older_than: Optional[float] = None,
+        metadata: Optional[dict[str, str]] = None,
+        unreferenced: bool = False,
+        purpose: Optional[str] = None,
+        concurrency: int = 8,
+        checkpoint_path: Optional[str] = None
+    ):
+        self.kinds = tuple(kinds)
+        unknown = set(self.kinds) - set(KINDS)
+        if unknown:
+            raise ValueError(f"Unknown kinds {sorted(unknown)}, expected some of {KINDS}")
+        if older_than is None and not metadata and not unreferenced:
+            raise ValueError("Set older_than, metadata or unreferenced, otherwise every object would be selected")
+        self.older_than = older_than
+        self.metadata = metadata or {}
+        self.unreferenced = unreferenced
+        self.purpose = purpose
+        self.concurrency = max(1, concurrency)
+        self.checkpoint_path = checkpoint_path
+        self._lock = threading.Lock()
+
+
+    def select(self) -> dict[str, list[str]]:
+        """
+        Returns the ids of the objects the rules select, per kind, without deleting anything.
+
+        Raises:
+            ValueError: If a listing fails.
+        """
+        cutoff = time.time() - self.older_than if self.older_than is not None else None
+        selected: dict[str, list[str]] = {kind: [] for kind in KINDS}
+
+        needs_assistants = 'assistant' in self.kinds or ('file' in self.kinds and self.unreferenced)
+        assistants = list(Organization.iter_assistants(order='asc')) if needs_assistants else []
+
+        if 'assistant' in self.kinds and (cutoff is not None or self.metadata):
+            selected['assistant'] = [
+                assistant.id for assistant in assistants
+                if self._matches(assistant.created_at, assistant.metadata, cutoff)
+            ]
+
+        if 'file' in self.kinds and (cutoff is not None or self.unreferenced):
+            referenced = {file_id for assistant in assistants for file_id in assistant.file_ids or ()}
+            # Oldest first, so an age rule stops the listing at the first file that is young enough.
+            files = Organization.iter_files(purpose=self.purpose, created_before=cutoff, order='asc')
+            selected['file'] = [
+                file.id for file in files
+                if not (self.unreferenced and file.id in referenced)
+            ]
+
+        store = Store.get_instance()
+        if 'thread' in self.kinds and store is not None and (cutoff is not None or self.metadata):
+            selected['thread'] = [
+                row['id'] for row in store.iter_rows('Thread')
+                if self._matches(row.get('created_at'), row.get('metadata'), cutoff)
+            ]
+        return selected
+
+
+    def run(self, dry_run: bool = False, on_delete: Optional[Callable[[str, str, Optional[Exception]], None]] = None) -> CollectionReport:
+        """
+        Selects the stale objects and deletes them with bounded concurrency.
+
+        Parameters:
+            dry_run (bool): Only report what would be deleted.
+            on_delete (Callable[[str, str, Exception], None]): Called with the kind, the id and the error, None on success, after each deletion.
+
+        Returns:
+            CollectionReport: The selected, deleted and failed ids.
+
+        Raises:
+            ValueError: If a listing fails. Failed deletions are reported, not raised.
+        """
+        started = time.monotonic()
+        report = CollectionReport(dry_run=dry_run)
+        report.selected = self.select()
+        if dry_run:
+            report.elapsed = time.monotonic() - started
+            return report
+
+        done = self._load_checkpoint()
+        checkpoint = open(self.checkpoint_path, 'a') if self.checkpoint_path is not None else None
+
+        def delete(kind: str, object_id: str) -> None:
+            error = None
+            try:
+                _DELETERS[kind](object_id)
+            except Exception as e:
+                if getattr(e, 'status_code', None) == 404:
+                    _forget(kind, object_id)
+                else:
+                    error = e
+            with self._lock:
+                if error is None:
+                    report.deleted[kind].append(object_id)
+                    if checkpoint is not None:
+                        checkpoint.write(f"{kind} {object_id}\n")
+                        checkpoint.flush()
+                else:
+                    report.errors[object_id] = error
+            if on_delete is not None:
+                on_delete(kind, object_id, error)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='GPTManager-GC') as pool:
+                pending = set()
+                for kind in KINDS:
+                    for object_id in report.selected[kind]:
+                        if (kind, object_id) in done:
+                            report.resumed += 1
+                            continue
+                        if len(pending) >= 2 * self.concurrency:
+                            _, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        pending.add(pool.submit(delete, kind, object_id))
+                wait(pending)
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+
+        report.elapsed = time.monotonic() - started
+        return report
+
+
+    def _matches(self, created_at: Optional[int], metadata: Optional[dict[str, Any]], cutoff: Optional[float]) -> bool:
+        if cutoff is not None and (created_at is None or created_at >= cutoff):
+            return False
+        metadata = metadata or {}
+        return all(metadata.get(key) == value for key, value in self.metadata.items())
+
+
+    def _load_checkpoint(self) -> set[tuple[str, str]]:
+        if self.checkpoint_path is None or not os.path.exists(self.checkpoint_path):
+            return set()
+        with open(self.checkpoint_path) as checkpoint:
+            return {tuple(line.split()) for line in checkpoint if line.strip()}
+
+
+def _delete_file(file_id: str) -> None:
+    file = File.__new__(File)
+    file.id = file_id
+    file.delete_file()
+
+
+_DELETERS: dict[str, Callable[[str], Any]] = {
+    'file': _delete_file,
+    'assistant': lambda assistant_id: Assistant.ref(assistant_id).delete_assistant(),
+    'thread': lambda thread_id: Thread.ref(thread_id).delete_thread(),
+}
+
+
+def _forget(kind: str, object_id: str) -> None:
+    # The object was already deleted elsewhere; drop what is still remembered locally.
+    Client.unpin(object_id)
+    if kind == 'thread':
+        evict('Thread', object_id)
+    elif kind == 'assistant':
+        Assistant.cache.invalidate(object_id)
+        evict('Assistant', object_id)
+    else:
+        index = FileIndex.get_instance()
+        if index is not None:
+            index.discard(object_id)
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from openai import OpenAI
 from typing import Optional
 from GPTManager.Client import Client
+from GPTManager.Errors import APIError
 
 
 @dataclass
@@ -53,13 +54,13 @@ class Image:
             if size is not None:
                 kwargs["size"] = size
 
-            image_data = client.images.generate(**kwargs)
+            image_data = Client.call(client.images.generate, **kwargs)
 
             self.b64_json = image_data.get('b64_json', '')
             self.url = image_data['url']
             self.revised_prompt = image_data.get('revised_prompt', '')
         except Exception as e:
-            raise ValueError(f'Unable to create image: {e}')
+            raise APIError.from_exception(f'Unable to create image: {e}', e) from e
         
     def create_image_edit(self, image: str, mask: str, prompt: str, n: int, size: str):
         """
@@ -81,7 +82,7 @@ class Image:
         client = Client.get_instance()
 
         try:
-            image_data = client.images.edit(
+            image_data = Client.call(client.images.edit,
                 image=open(image, "rb"),
                 mask=open(mask, "rb"),
                 prompt=prompt,
@@ -93,7 +94,7 @@ class Image:
             self.url = image_data['url']
             self.revised_prompt = image_data['revised_prompt']
         except Exception as e:
-            raise ValueError(f'Unable to create image: {e}')
+            raise APIError.from_exception(f'Unable to create image: {e}', e) from e
         
     def create_image_variation(self, image: str, n: int, size: str):
         """
@@ -113,7 +114,7 @@ class Image:
         client = Client.get_instance()
 
         try:
-            image_data = client.images.create_variation(
+            image_data = Client.call(client.images.create_variation,
                 image=open(image, "rb"),
                 n=n,
                 size=size
@@ -123,4 +124,4 @@ class Image:
             self.url = image_data['url']
             self.revised_prompt = image_data['revised_prompt']
         except Exception as e:
-            raise ValueError(f'Unable to create image: {e}')
\ No newline at end of file
+            raise APIError.from_exception(f'Unable to create image: {e}', e) from e
\ No newline at end of file
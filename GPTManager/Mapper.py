@@ -0,0 +1,129 @@
+import dataclasses
+from typing import Any, Callable, Iterable, Optional
+
+
+class Mapper:
+    """
+    Copies fields from SDK objects or JSON dicts onto GPTManager objects.
+
+    The converters of a target class are compiled once, the way dataclasses
+    compiles __init__: one line per field, reading an SDK attribute or a key
+    of a JSON dict from the store or a raw response. build_many() converts a
+    whole page in a single compiled loop. build() creates instances without
+    calling __init__, so building a Run or an Assistant never calls the API.
+    A source missing a field, e.g. an older or newer SDK model, falls back to
+    getattr with None for that object only.
+
+        message = mapper(Message).build(message_data)
+        mapper(Run, RUN_STATE_FIELDS).update(run, run_data)
+
+    Attributes:
+        cls (type): The target class.
+        fields (tuple[str, ...]): The copied field names.
+
+    Methods:
+        values(source): Returns the field values of a source, in field order.
+        build(source): Creates a target instance from a source.
+        build_many(sources): Creates a target instance per source in one loop.
+        update(target, source): Copies the fields of a source onto an existing instance.
+    """
+
+    def __init__(self, cls: type, fields: Optional[Iterable[str]] = None):
+        self.cls = cls
+        self.fields = tuple(fields) if fields is not None else tuple(field.name for field in dataclasses.fields(cls))
+        for name in self.fields:
+            if not name.isidentifier():
+                raise ValueError(f"Cannot map field '{name}' of {cls.__name__}")
+        self._from_object = _compile(cls, self.fields, "source.{}")
+        self._from_dict = _compile(cls, self.fields, "get('{}')", "get = source.get")
+
+
+    def values(self, source: Any) -> tuple:
+        if type(source) is dict:
+            return self._from_dict.values(source)
+        try:
+            return self._from_object.values(source)
+        except AttributeError:
+            return tuple(getattr(source, name, None) for name in self.fields)
+
+
+    def build(self, source: Any) -> Any:
+        return self.update(self.cls.__new__(self.cls), source)
+
+
+    def build_many(self, sources: Iterable[Any]) -> list:
+        sources = sources if isinstance(sources, list) else list(sources)
+        try:
+            if all(type(source) is dict for source in sources):
+                return self._from_dict.build_many(sources)
+            return self._from_object.build_many(sources)
+        except AttributeError:
+            return [self.build(source) for source in sources]
+
+
+    def update(self, target: Any, source: Any) -> Any:
+        if type(source) is dict:
+            return self._from_dict.update(target, source)
+        try:
+            return self._from_object.update(target, source)
+        except AttributeError:
+            for name in self.fields:
+                setattr(target, name, getattr(source, name, None))
+            return target
+
+
+_MAPPERS: dict[tuple[type, Optional[tuple[str, ...]]], Mapper] = {}
+
+
+def mapper(cls: type, fields: Optional[Iterable[str]] = None) -> Mapper:
+    """
+    Returns the shared Mapper of a class and field list, compiling it on first use.
+    """
+    key = (cls, tuple(fields) if fields is not None else None)
+    found = _MAPPERS.get(key)
+    if found is None:
+        found = _MAPPERS[key] = Mapper(cls, fields)
+    return found
+
+
+class _Compiled:
+    values: Callable[[Any], tuple]
+    update: Callable[[Any, Any], Any]
+    build_many: Callable[[list], list]
+
+
+def _compile(cls: type, fields: tuple[str, ...], access: str, prelude: str = "pass") -> _Compiled:
+    """
+    Compiles values, update and build_many for one kind of source, with one line per field.
+
+    Fields are set with plain attribute stores, like a generated __init__, so
+    instances keep CPython's key-sharing dicts.
+    """
+    reads = [access.format(name) for name in fields]
+    stores = "".join(f"    obj.{name} = {read}\n" for name, read in zip(fields, reads))
+    loop_stores = "".join(f"    {line}\n" for line in stores.splitlines())
+    source = (
+        f"def values(source):\n"
+        f"    {prelude}\n"
+        f"    return ({', '.join(reads)},)\n"
+        f"def update(obj, source):\n"
+        f"    {prelude}\n"
+        f"{stores}"
+        f"    return obj\n"
+        f"def build_many(sources):\n"
+        f"    objects = []\n"
+        f"    append = objects.append\n"
+        f"    for source in sources:\n"
+        f"        {prelude}\n"
+        f"        obj = new(cls)\n"
+        f"{loop_stores}"
+        f"        append(obj)\n"
+        f"    return objects\n"
+    )
+    namespace: dict[str, Any] = {'new': cls.__new__, 'cls': cls}
+    exec(source, namespace)
+    compiled = _Compiled()
+    compiled.values = namespace['values']
+    compiled.update = namespace['update']
+    compiled.build_many = namespace['build_many']
+    return compiled
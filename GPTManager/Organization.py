@@ -1,19 +1,89 @@
-from openai import OpenAI
-from . import File, Assistant
-import openai
+import fnmatch
 import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional
+
+from .Client import Client
+from . import File, Assistant
+from .Errors import APIError, BulkCreateError
+from .Mapper import mapper
+from .Pagination import MAX_PAGE_SIZE, page_params, paginate
+from .RawJSON import raw_fetch
+from .Store import write_through
 from dotenv import load_dotenv
 load_dotenv()
 
+
+@dataclass
+class FileUploadReport:
+    """
+    The outcome of one file of Organization.upload_directory(), with the running totals of the whole upload.
+
+    Attributes:
+        path (str): The uploaded path.
+        file (File): The uploaded file, or None if the upload failed.
+        error (Exception): Why the file failed, or None. A file that uploaded but could not be attached to the assistant keeps both.
+        size (int): The size of the file in bytes.
+        seconds (float): How long this file took.
+        completed (int): The files finished so far, including failures.
+        failed (int): The files failed so far.
+        bytes_uploaded (int): The bytes of all files uploaded so far.
+        elapsed (float): Seconds since the upload started.
+    """
+    path: str
+    file: Optional['File']
+    error: Optional[Exception]
+    size: int
+    seconds: float
+    completed: int
+    failed: int
+    bytes_uploaded: int
+    elapsed: float
+
+    @property
+    def files_per_second(self) -> float:
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_uploaded / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass
+class Inventory:
+    """
+    The files and assistants of an organization, see Organization.inventory().
+
+    Attributes:
+        files (list[File]): The files.
+        assistants (list[Assistant]): The assistants.
+    """
+    files: list['File']
+    assistants: list['Assistant']
+
+
 class Organization:
 
     @staticmethod
-    def list_files():
+    def list_files(
+        purpose: Optional[str] = None,
+        created_after: Optional[int] = None,
+        created_before: Optional[int] = None,
+        limit: Optional[int] = None,
+        order: Optional[str] = None
+    ) -> list['File']:
         """
-        Lists all files in the OpenAI API.
-        
+        Lists the files of the organization, following every page.
+
         Parameters:
-            None
+            purpose (str): Only list files with this purpose. Filtered by the API.
+            created_after (int): Only list files created at or after this Unix time.
+            created_before (int): Only list files created before this Unix time.
+            limit (int): The maximum number of files to return. None returns all of them.
+            order (str): 'asc' or 'desc' by creation time. Defaults to the API order (desc).
 
         Returns:
             list[File]: A list of File objects.
@@ -21,23 +91,66 @@ class Organization:
         Raises:
             ValueError: If the file list fails or returns invalid data.
         """
-        client = OpenAI()
-        openai.api_key = os.getenv('OPENAI_API_KEY')
+        return list(Organization.iter_files(purpose, created_after, created_before, limit, order))
+
+
+    @staticmethod
+    def iter_files(
+        purpose: Optional[str] = None,
+        created_after: Optional[int] = None,
+        created_before: Optional[int] = None,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = True,
+        raw: bool = False
+    ) -> Iterator['File']:
+        """
+        Lazily yields the files of the organization, one page in memory at a time.
+
+        The purpose filter is sent to the API. The API has no creation time
+        filter, so created_after and created_before are applied to each page,
+        and listing stops at the first file past the range in the listing
+        order instead of reading the remaining pages.
+
+        Parameters:
+            purpose (str): Only yield files with this purpose.
+            created_after (int): Only yield files created at or after this Unix time.
+            created_before (int): Only yield files created before this Unix time.
+            limit (int): The maximum number of files to yield. None yields all of them.
+            order (str): 'asc' or 'desc' by creation time. Defaults to the API order (desc).
+            page_size (int): The number of files requested per page, at most 100.
+            prefetch (bool): Whether to request the next page ahead of time.
+            raw (bool): Decode the response JSON directly into Files, skipping the SDK models.
+
+        Returns:
+            Iterator[File]: The files, built from the listing without a retrieve per file.
+
+        Raises:
+            ValueError: If the file list fails or returns invalid data.
+        """
+        extra = {'purpose': purpose} if purpose is not None else {}
+        return _iter_listing(
+            lambda client: client.files, File, extra, created_after, created_before, limit, order, page_size, prefetch, raw,
+            "Failed to retrieve files"
+        )
+
 
-        try:
-            files_response = client.files.list()
-            return [File(**file) for file in files_response['data']]
-        except:
-            raise ValueError("Failed to retrieve files")
-    
     @staticmethod
-    def list_assistants(order: str, limit: str) -> list['Assistant']:
+    def list_assistants(
+        order: Optional[str] = None,
+        limit: Optional[int] = None,
+        created_after: Optional[int] = None,
+        created_before: Optional[int] = None
+    ) -> list['Assistant']:
         """
-        Lists all assistants in the OpenAI API.
+        Lists the assistants of the organization, following every page.
         
         Parameters:
-            order (str): The order in which to list the assistants.
-            limit (str): The maximum number of assistants to list.
+            order (str): 'asc' or 'desc' by creation time. Defaults to the API order (desc).
+            limit (int): The maximum number of assistants to return. None returns all of them.
+            created_after (int): Only list assistants created at or after this Unix time.
+            created_before (int): Only list assistants created before this Unix time.
             
         Returns:
             list[Assistant]: A list of Assistant objects.
@@ -45,15 +158,248 @@ class Organization:
         Raises:
             ValueError: If the assistant list fails or returns invalid data.
         """
-        client = OpenAI()
-        openai.api_key = os.getenv('OPENAI_API_KEY')
+        assistants = list(Organization.iter_assistants(order, limit, created_after, created_before))
+        write_through(*assistants)
+        return assistants
+
+
+    @staticmethod
+    def iter_assistants(
+        order: Optional[str] = None,
+        limit: Optional[int] = None,
+        created_after: Optional[int] = None,
+        created_before: Optional[int] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = True,
+        raw: bool = False
+    ) -> Iterator['Assistant']:
+        """
+        Lazily yields the assistants of the organization, one page in memory at a time.
+
+        The Assistant objects are built from the listing, without the retrieve
+        call Assistant(assistant_id=...) would make. Date filters work as in iter_files().
+
+        Parameters:
+            order (str): 'asc' or 'desc' by creation time. Defaults to the API order (desc).
+            limit (int): The maximum number of assistants to yield. None yields all of them.
+            created_after (int): Only yield assistants created at or after this Unix time.
+            created_before (int): Only yield assistants created before this Unix time.
+            page_size (int): The number of assistants requested per page, at most 100.
+            prefetch (bool): Whether to request the next page ahead of time.
+            raw (bool): Decode the response JSON directly into Assistants, skipping the SDK models.
+
+        Returns:
+            Iterator[Assistant]: The assistants.
+
+        Raises:
+            ValueError: If the assistant list fails or returns invalid data.
+        """
+        return _iter_listing(
+            lambda client: client.beta.assistants, Assistant, {}, created_after, created_before, limit, order, page_size, prefetch, raw,
+            "Failed to retrieve assistants"
+        )
+
+
+    @staticmethod
+    def inventory(
+        purpose: Optional[str] = None,
+        created_after: Optional[int] = None,
+        created_before: Optional[int] = None
+    ) -> 'Inventory':
+        """
+        Lists the files and the assistants of the organization concurrently.
+
+        The two listings are independent, so each follows its own pages on its
+        own thread and the total time is that of the longer listing.
+
+        Parameters:
+            purpose (str): Only list files with this purpose.
+            created_after (int): Only list objects created at or after this Unix time.
+            created_before (int): Only list objects created before this Unix time.
+
+        Returns:
+            Inventory: The files and assistants.
+
+        Raises:
+            ValueError: If either listing fails.
+        """
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix='GPTManager-Inventory') as pool:
+            files = pool.submit(Organization.list_files, purpose, created_after, created_before)
+            assistants = pool.submit(Organization.list_assistants, None, None, created_after, created_before)
+            return Inventory(files=files.result(), assistants=assistants.result())
+
+
+    @staticmethod
+    def upload_directory(
+        path: str,
+        purpose: str,
+        pattern: str = '*',
+        concurrency: int = 8,
+        recursive: bool = True,
+        assistant: Optional['Assistant'] = None,
+        on_file: Optional[Callable[[FileUploadReport], None]] = None
+    ) -> list['File']:
+        """
+        Uploads every file of a directory tree that matches a pattern, keeping up to concurrency uploads in flight.
+
+        The tree is walked lazily and at most twice concurrency paths are
+        queued ahead of the uploads, so thousands of files never sit in memory
+        at once. Each file goes through File.upload_file, so a configured
+        FileIndex skips content uploaded before.
+
+        Parameters:
+            path (str): The directory to upload.
+            purpose (str): The purpose of the files.
+            pattern (str): A glob matched against each file name, e.g. '*.pdf'.
+            concurrency (int): The maximum number of uploads in flight.
+            recursive (bool): Whether to descend into subdirectories.
+            assistant (Assistant): Attach every uploaded file to this assistant in the same pass.
+            on_file (Callable[[FileUploadReport], None]): Called after each file with its outcome and the running throughput.
+
+        Returns:
+            list[File]: The uploaded files, in walk order.
+
+        Raises:
+            ValueError: If path is not a directory.
+            BulkCreateError: If some files failed. Its results hold the File of each
+                path in walk order (None for failed uploads) and its errors the exception
+                per index, including exceptions raised by on_file.
+        """
+        if not os.path.isdir(path):
+            raise ValueError(f"{path} is not a directory")
+
+        started = time.monotonic()
+        lock = threading.Lock()
+        totals = {'completed': 0, 'failed': 0, 'bytes': 0}
+        results: list[Optional[File]] = []
+        errors: dict[int, Exception] = {}
+
+        def upload(index: int, file_path: str) -> None:
+            file, error, size = None, None, 0
+            begun = time.monotonic()
+            try:
+                size = os.path.getsize(file_path)
+                file = File(id=None, object=None, bytes=None, created_at=None, filename=None, purpose=purpose)
+                file.upload_file(file_path, purpose)
+                if assistant is not None:
+                    assistant.create_assistant_file(file.id)
+            except Exception as e:
+                error = e
+            with lock:
+                totals['completed'] += 1
+                if error is None:
+                    results[index] = file
+                else:
+                    errors[index] = error
+                    totals['failed'] += 1
+                if file is not None and file.id is not None:
+                    totals['bytes'] += size
+                report = FileUploadReport(
+                    path=file_path,
+                    file=file if file is not None and file.id is not None else None,
+                    error=error,
+                    size=size,
+                    seconds=time.monotonic() - begun,
+                    completed=totals['completed'],
+                    failed=totals['failed'],
+                    bytes_uploaded=totals['bytes'],
+                    elapsed=time.monotonic() - started,
+                )
+            if on_file is not None:
+                on_file(report)
+
+        def collect(done: set[Future]) -> None:
+            # upload() records its own failures; this catches what escapes it, such as an on_file callback that raised.
+            for future in done:
+                try:
+                    future.result()
+                except Exception as e:
+                    with lock:
+                        errors.setdefault(indexes.pop(future), e)
+                else:
+                    indexes.pop(future)
+
+        workers = max(1, concurrency)
+        indexes: dict[Future, int] = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='GPTManager-DirectoryUpload') as pool:
+            pending = set()
+            for index, file_path in enumerate(_walk(path, pattern, recursive)):
+                if len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                with lock:
+                    results.append(None)
+                future = pool.submit(upload, index, file_path)
+                indexes[future] = index
+                pending.add(future)
+            collect(wait(pending).done)
+
+        if errors:
+            raise BulkCreateError(f"Failed to upload {len(errors)} of {len(results)} files", results, errors)
+        return results
+
+
+def _iter_listing(
+    resource: Callable[[Any], Any],
+    target: type,
+    extra: dict[str, Any],
+    created_after: Optional[int],
+    created_before: Optional[int],
+    limit: Optional[int],
+    order: Optional[str],
+    page_size: int,
+    prefetch: bool,
+    raw: bool,
+    error: str
+) -> Iterator[Any]:
+    """
+    Yields the typed items of a cursor-paginated organization listing, within a creation time range.
+    """
+    filtered = created_after is not None or created_before is not None
+    if limit is not None:
+        limit = int(limit)
+    try:
+        client = Client.get_instance()
+        listing = resource(client)
+        if raw:
+            fetch = raw_fetch(listing.with_raw_response.list, target, **extra)
+        else:
+            fetch = lambda **params: Client.call(listing.list, **extra, **params)
+        items = paginate(
+            fetch,
+            page_params(limit, page_size, order),
+            limit=None if filtered else limit,
+            prefetch=prefetch
+        )
+        build = (lambda item: item) if raw else mapper(target).build
+        ascending = order == 'asc'
+        yielded = 0
+        for item in items:
+            if limit is not None and yielded >= limit:
+                return
+            created_at = item['created_at'] if type(item) is dict else item.created_at
+            if created_after is not None and created_at < created_after:
+                if ascending:
+                    continue
+                return
+            if created_before is not None and created_at >= created_before:
+                if ascending:
+                    return
+                continue
+            yielded += 1
+            yield build(item)
+    except Exception as e:
+        raise APIError.from_exception(error, e) from e
 
-        try:
-            asisstants = client.beta.assistants.list(
-                order=order,
-                limit=limit,
-            )
-            return [Assistant(**assistant) for assistant in asisstants['data']]
-        except Exception as e:
-            raise ValueError("Failed to retrieve thread messages") from e
 
+def _walk(path: str, pattern: str, recursive: bool) -> Iterator[str]:
+    """
+    Lazily yields the files under path whose name matches pattern, in sorted order per directory.
+    """
+    for directory, subdirectories, names in os.walk(path):
+        subdirectories.sort()
+        if not recursive:
+            subdirectories.clear()
+        for name in sorted(names):
+            if fnmatch.fnmatch(name, pattern):
+                yield os.path.join(directory, name)
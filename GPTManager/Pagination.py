@@ -0,0 +1,169 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional
+
+
+MAX_PAGE_SIZE = 100
+
+_prefetch_pool = None
+_prefetch_pool_lock = threading.Lock()
+
+
+def _get_prefetch_pool() -> ThreadPoolExecutor:
+    global _prefetch_pool
+    with _prefetch_pool_lock:
+        if _prefetch_pool is None:
+            _prefetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='GPTManager-Prefetch')
+        return _prefetch_pool
+
+
+def page_params(
+    limit: Optional[int],
+    page_size: int,
+    order: Optional[str] = None,
+    after: Optional[str] = None,
+    before: Optional[str] = None
+) -> dict[str, Any]:
+    """
+    Builds the query parameters of the first page, leaving out unset cursors.
+    """
+    size = min(page_size, MAX_PAGE_SIZE)
+    if limit is not None:
+        size = max(1, min(size, limit))
+    params = {"limit": size}
+    if order is not None:
+        params["order"] = order
+    if after is not None:
+        params["after"] = after
+    if before is not None:
+        params["before"] = before
+    return params
+
+
+def paginate(
+    fetch: Callable[..., Any],
+    params: dict[str, Any],
+    limit: Optional[int] = None,
+    prefetch: bool = True,
+    on_page: Optional[Callable[[Any], None]] = None
+) -> Iterator[Any]:
+    """
+    Lazily yields the items of a cursor-paginated list endpoint.
+
+    Follows the `after` cursor until the endpoint reports no more pages or
+    `limit` items were yielded. A listing that starts from a `before` cursor
+    alone pages backwards instead, following `before` from the first item of
+    each page: every page keeps the requested order, but pages arrive from the
+    cursor towards the start of the list. With prefetch, the next page is requested in
+    the background while the current one is consumed, so at most two pages
+    are held in memory. Iteration also stops when a page does not report
+    has_more as exactly True or its cursor does not advance, so a malformed
+    response cannot loop forever.
+
+    Parameters:
+        fetch (Callable): Called with the query parameters, returns a page with `data` and `has_more`.
+        params (dict): The query parameters of the first page, see page_params().
+        limit (int): The maximum number of items to yield. None yields everything.
+        prefetch (bool): Request the next page while the current one is consumed.
+        on_page (Callable): Called with every page fetched, e.g. to count requests.
+
+    Returns:
+        Iterator: The items of all pages, in API order.
+    """
+    if on_page is not None:
+        fetch = _counted(fetch, on_page)
+    remaining = limit
+    page = fetch(**params)
+    upcoming = None
+    try:
+        while True:
+            data = page.data
+            next_params = _next_params(page, params, remaining)
+            if next_params is not None and prefetch:
+                upcoming = _get_prefetch_pool().submit(fetch, **next_params)
+
+            for item in data:
+                if remaining is not None:
+                    if remaining <= 0:
+                        return
+                    remaining -= 1
+                yield item
+
+            if next_params is None:
+                return
+            page = upcoming.result() if upcoming is not None else fetch(**next_params)
+            params = next_params
+            upcoming = None
+    finally:
+        if upcoming is not None:
+            upcoming.cancel()
+
+
+async def paginate_async(
+    fetch: Callable[..., Awaitable[Any]],
+    params: dict[str, Any],
+    limit: Optional[int] = None,
+    prefetch: bool = True,
+    on_page: Optional[Callable[[Any], None]] = None
+) -> AsyncIterator[Any]:
+    """
+    Asyncio variant of paginate. The next page is prefetched in a task.
+    """
+    if on_page is not None:
+        fetch = _counted_async(fetch, on_page)
+    remaining = limit
+    page = await fetch(**params)
+    upcoming = None
+    try:
+        while True:
+            data = page.data
+            next_params = _next_params(page, params, remaining)
+            if next_params is not None and prefetch:
+                upcoming = asyncio.ensure_future(fetch(**next_params))
+
+            for item in data:
+                if remaining is not None:
+                    if remaining <= 0:
+                        return
+                    remaining -= 1
+                yield item
+
+            if next_params is None:
+                return
+            page = await upcoming if upcoming is not None else await fetch(**next_params)
+            params = next_params
+            upcoming = None
+    finally:
+        if upcoming is not None:
+            upcoming.cancel()
+
+
+def _next_params(page: Any, params: dict[str, Any], remaining: Optional[int]) -> Optional[dict[str, Any]]:
+    data = page.data
+    if page.has_more is not True or not data:
+        return None
+    if remaining is not None and remaining <= len(data):
+        return None
+    direction = "before" if params.get("before") is not None and params.get("after") is None else "after"
+    cursor = data[0].id if direction == "before" else data[-1].id
+    if cursor == params.get(direction):
+        return None
+    return {**params, direction: cursor}
+
+
+def _counted(fetch: Callable[..., Any], on_page: Callable[[Any], None]) -> Callable[..., Any]:
+    def fetch_page(**params):
+        page = fetch(**params)
+        on_page(page)
+        return page
+    return fetch_page
+
+
+def _counted_async(fetch: Callable[..., Awaitable[Any]], on_page: Callable[[Any], None]) -> Callable[..., Awaitable[Any]]:
+    async def fetch_page(**params):
+        page = await fetch(**params)
+        on_page(page)
+        return page
+    return fetch_page
+
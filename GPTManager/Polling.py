@@ -0,0 +1,186 @@
+import asyncio
+import heapq
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+TERMINAL_STATUSES = frozenset({'completed', 'failed', 'cancelled', 'expired'})
+PENDING_STATUSES = frozenset({'queued', 'in_progress', 'cancelling'})
+
+
+@dataclass
+class PollBackoff:
+    """
+    Adaptive delays between two polls of the same run.
+
+    The first poll, and the first poll after any status change, happens after
+    `initial` seconds. While the status stays the same the delay grows by
+    `factor` up to `maximum`.
+
+    Attributes:
+        initial (float): Delay in seconds after a status change.
+        factor (float): Growth factor applied while the status is unchanged.
+        maximum (float): Upper bound of the delay in seconds.
+        jitter (float): Fraction of the delay randomly added or removed so that many runs do not poll in lockstep.
+    """
+    initial: float = 0.25
+    factor: float = 1.6
+    maximum: float = 5.0
+    jitter: float = 0.1
+
+    def next_delay(self, delay: Optional[float], status_changed: bool) -> float:
+        if delay is None or status_changed:
+            return self.initial
+        return min(delay * self.factor, self.maximum)
+
+    def jittered(self, delay: float) -> float:
+        if not self.jitter:
+            return delay
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+@dataclass
+class RunWaitResult:
+    """
+    Outcome of waiting on one or more runs.
+
+    Attributes:
+        runs (list[Run]): The runs that were waited on, with their latest state.
+        polls (dict[str, int]): Number of retrieve requests issued per run id.
+        requests (int): Total number of API requests the wait cost, listing included.
+        elapsed (float): Wall-clock seconds spent waiting.
+        timed_out (bool): True if the deadline passed while some runs were still pending.
+    """
+    runs: list[Any]
+    polls: dict[str, int]
+    requests: int
+    elapsed: float
+    timed_out: bool
+
+    @property
+    def pending(self) -> list[Any]:
+        return [run for run in self.runs if run.status in PENDING_STATUSES]
+
+
+class PollSchedule:
+    """
+    Orders pending runs by the time their next poll is due.
+
+    A run leaves the schedule as soon as it is recorded with a status that is
+    not pending (a terminal status or requires_action).
+    """
+
+    def __init__(self, runs: list[Any], backoff: PollBackoff):
+        self.backoff = backoff
+        self.polls = {run.id: 0 for run in runs}
+        self._runs = {run.id: run for run in runs}
+        self._delays = {}
+        self._statuses = {}
+        self._queue = []
+        now = time.monotonic()
+        for run in runs:
+            if run.status in PENDING_STATUSES:
+                self._push(run, now)
+
+    def __bool__(self) -> bool:
+        return bool(self._queue)
+
+    def _push(self, run: Any, now: float):
+        delay = self.backoff.next_delay(
+            self._delays.get(run.id),
+            self._statuses.get(run.id) != run.status
+        )
+        self._delays[run.id] = delay
+        self._statuses[run.id] = run.status
+        heapq.heappush(self._queue, (now + self.backoff.jittered(delay), run.id))
+
+    def pop(self) -> tuple[float, Any]:
+        due, run_id = heapq.heappop(self._queue)
+        return due, self._runs[run_id]
+
+    def record(self, run: Any):
+        self.polls[run.id] += 1
+        if run.status in PENDING_STATUSES:
+            self._push(run, time.monotonic())
+
+
+def wait_for_runs(
+    runs: list[Any],
+    timeout: Optional[float] = None,
+    backoff: Optional[PollBackoff] = None,
+    requests: int = 0
+) -> RunWaitResult:
+    """
+    Polls runs with Run.retrieve_run until none of them is pending.
+
+    Parameters:
+        runs (list[Run]): The runs to wait on.
+        timeout (float): Seconds after which to stop waiting. None waits indefinitely.
+        backoff (PollBackoff): The polling cadence. Defaults to PollBackoff().
+        requests (int): Requests already spent by the caller, added to the reported total.
+
+    Returns:
+        RunWaitResult: The runs with their latest state and the cost of the wait.
+
+    Raises:
+        ValueError: If a run retrieval fails.
+    """
+    start = time.monotonic()
+    deadline = None if timeout is None else start + timeout
+    schedule = PollSchedule(runs, backoff or PollBackoff())
+
+    while schedule:
+        due, run = schedule.pop()
+        now = time.monotonic()
+        if deadline is not None:
+            if now >= deadline:
+                break
+            due = min(due, deadline)
+        if due > now:
+            time.sleep(due - now)
+        run.retrieve_run()
+        schedule.record(run)
+
+    return _result(runs, schedule, requests, start, deadline)
+
+
+async def wait_for_runs_async(
+    runs: list[Any],
+    timeout: Optional[float] = None,
+    backoff: Optional[PollBackoff] = None,
+    requests: int = 0
+) -> RunWaitResult:
+    """
+    Asyncio variant of wait_for_runs for AsyncRun instances.
+    """
+    start = time.monotonic()
+    deadline = None if timeout is None else start + timeout
+    schedule = PollSchedule(runs, backoff or PollBackoff())
+
+    while schedule:
+        due, run = schedule.pop()
+        now = time.monotonic()
+        if deadline is not None:
+            if now >= deadline:
+                break
+            due = min(due, deadline)
+        if due > now:
+            await asyncio.sleep(due - now)
+        await run.retrieve_run()
+        schedule.record(run)
+
+    return _result(runs, schedule, requests, start, deadline)
+
+
+def _result(runs, schedule, requests, start, deadline) -> RunWaitResult:
+    result = RunWaitResult(
+        runs=runs,
+        polls=schedule.polls,
+        requests=requests + sum(schedule.polls.values()),
+        elapsed=time.monotonic() - start,
+        timed_out=False
+    )
+    result.timed_out = deadline is not None and bool(result.pending)
+    return result
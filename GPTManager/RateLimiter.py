@@ -0,0 +1,196 @@
+import asyncio
+import re
+import threading
+import time
+from typing import Any, Optional
+
+
+_DURATION = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+_UNITS = {'ms': 0.001, 's': 1.0, 'm': 60.0, 'h': 3600.0}
+
+
+class _Bucket:
+    """
+    A token bucket refilled continuously at limit per minute. The level may go
+    negative: every reservation is granted at once and the caller sleeps off the debt.
+    """
+
+    def __init__(self, limit: Optional[float]):
+        self.limit = limit
+        self.level = limit
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+
+
+    def reserve(self, cost: float, now: float) -> float:
+        delay = max(0.0, self.blocked_until - now)
+        if self.limit is None or self.limit <= 0:
+            return delay
+        rate = self.limit / 60.0
+        self.level = min(self.limit, self.level + (now - self.updated_at) * rate)
+        self.updated_at = now
+        self.level -= cost
+        if self.level < 0:
+            delay = max(delay, -self.level / rate)
+        return delay
+
+
+    def observe(self, limit: Optional[float], remaining: Optional[float], reset: Optional[float], now: float) -> None:
+        if limit is not None:
+            self.limit = limit
+        if remaining is not None:
+            self.level = remaining
+            self.updated_at = now
+            if remaining <= 0 and reset is not None:
+                self.blocked_until = max(self.blocked_until, now + reset)
+        elif self.level is None:
+            self.level = self.limit
+
+
+class RateLimiter:
+    """
+    A thread-safe client-side limiter for requests and tokens per minute.
+
+    Every request reserves one request and an estimate of its tokens before it
+    is sent. When a bucket is empty the caller sleeps, or awaits in async mode,
+    until the bucket has refilled, instead of sending and getting a 429 back.
+    Responses correct the buckets from the x-ratelimit-limit-*, remaining-* and
+    reset-* headers, and a 429 with Retry-After blocks both buckets for that long.
+    Limits that were not configured are learned from the first response.
+
+    One limiter is shared by every thread and coroutine using the same client, so
+    a whole worker process stays under its quota. Client installs it through httpx
+    event hooks, see ClientConfig.rate_limiter.
+
+    Attributes:
+        requests_per_minute (float): The request limit. None until configured or learned.
+        tokens_per_minute (float): The token limit. None until configured or learned.
+        waits (int): Number of requests that had to wait.
+        waited (float): Total seconds spent waiting.
+
+    Methods:
+        acquire(tokens): Blocks until a request costing tokens may be sent.
+        acquire_async(tokens): Asyncio variant of acquire.
+        observe(status_code, headers): Updates the buckets from a response.
+        hooks(): httpx event hooks for a sync client.
+        async_hooks(): httpx event hooks for an async client.
+    """
+
+    def __init__(self, requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None):
+        self._requests = _Bucket(requests_per_minute)
+        self._tokens = _Bucket(tokens_per_minute)
+        self._lock = threading.Lock()
+        self.waits = 0
+        self.waited = 0.0
+
+
+    @property
+    def requests_per_minute(self) -> Optional[float]:
+        return self._requests.limit
+
+
+    @property
+    def tokens_per_minute(self) -> Optional[float]:
+        return self._tokens.limit
+
+
+    def reserve(self, tokens: float = 0) -> float:
+        """
+        Reserves one request and tokens, and returns the seconds to wait before sending.
+        """
+        now = time.monotonic()
+        with self._lock:
+            delay = max(self._requests.reserve(1, now), self._tokens.reserve(tokens, now))
+            if delay > 0:
+                self.waits += 1
+                self.waited += delay
+        return delay
+
+
+    def acquire(self, tokens: float = 0) -> None:
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+
+    async def acquire_async(self, tokens: float = 0) -> None:
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+    def observe(self, status_code: int, headers: Any) -> None:
+        """
+        Updates the buckets from the rate-limit headers of a response.
+
+        Parameters:
+            status_code (int): The response status.
+            headers (Mapping): The response headers.
+        """
+        now = time.monotonic()
+        with self._lock:
+            for name, bucket in (('requests', self._requests), ('tokens', self._tokens)):
+                bucket.observe(
+                    _number(headers.get(f'x-ratelimit-limit-{name}')),
+                    _number(headers.get(f'x-ratelimit-remaining-{name}')),
+                    _duration(headers.get(f'x-ratelimit-reset-{name}')),
+                    now,
+                )
+            if status_code == 429:
+                retry_after = _number(headers.get('retry-after'))
+                if retry_after is not None:
+                    for bucket in (self._requests, self._tokens):
+                        bucket.blocked_until = max(bucket.blocked_until, now + retry_after)
+
+
+    def hooks(self) -> dict[str, list]:
+        def before(request):
+            self.acquire(_estimate_tokens(request))
+
+        def after(response):
+            self.observe(response.status_code, response.headers)
+
+        return {'request': [before], 'response': [after]}
+
+
+    def async_hooks(self) -> dict[str, list]:
+        async def before(request):
+            await self.acquire_async(_estimate_tokens(request))
+
+        async def after(response):
+            self.observe(response.status_code, response.headers)
+
+        return {'request': [before], 'response': [after]}
+
+
+def _estimate_tokens(request: Any) -> int:
+    # Roughly four bytes per token of request body; bodies of file uploads are streamed and count as zero.
+    try:
+        return len(request.content) // 4
+    except Exception:
+        return 0
+
+
+def _number(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return _duration(value)
+
+
+def _duration(value: Optional[str]) -> Optional[float]:
+    """
+    Parses reset durations such as '20ms', '1s' or '6m0s' into seconds.
+    """
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _UNITS[unit] for amount, unit in parts)
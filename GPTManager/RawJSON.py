@@ -0,0 +1,79 @@
+import json
+from typing import Any, Awaitable, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .Client import Client
+from .Mapper import mapper
+
+
+def loads(content: bytes) -> Any:
+    """
+    Decodes a JSON response body, with orjson when it is installed and the json module otherwise.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+class RawPage:
+    """
+    One page of a list endpoint, decoded straight from the response body.
+
+    The items are built into GPTManager objects from the decoded dicts in a
+    single mapper loop, without the SDK's pydantic models in between. Nested
+    fields such as Message.content or RunStep.step_details are therefore plain
+    dicts, as they are for objects read back from the Store.
+
+    Attributes:
+        data (list): The built objects of the page.
+        has_more (bool): Whether the endpoint has further pages.
+    """
+    __slots__ = ('data', 'has_more')
+
+    def __init__(self, data: list, has_more: Any):
+        self.data = data
+        self.has_more = has_more
+
+    @classmethod
+    def decode(cls, response: Any, target: type) -> 'RawPage':
+        """
+        Builds a page of target objects from a raw list response.
+
+        Parameters:
+            response: A response of a with_raw_response method, or anything with a `content` body.
+            target (type): The GPTManager class of the items, e.g. Message.
+
+        Returns:
+            RawPage: The decoded page.
+
+        Raises:
+            ValueError: If the body is not a list page.
+        """
+        body = loads(response.content)
+        if not isinstance(body, dict) or not isinstance(body.get('data'), list):
+            raise ValueError("Unexpected list response body")
+        return cls(mapper(target).build_many(body['data']), body.get('has_more'))
+
+
+def raw_fetch(list_method: Callable[..., Any], target: type, *args, **kwargs) -> Callable[..., RawPage]:
+    """
+    Returns a page fetcher for paginate() that calls a with_raw_response list method through Client.call.
+
+        fetch = raw_fetch(client.beta.threads.messages.with_raw_response.list, Message, thread_id)
+    """
+    def fetch(**params) -> RawPage:
+        return RawPage.decode(Client.call(list_method, *args, **kwargs, **params), target)
+    return fetch
+
+
+def raw_fetch_async(list_method: Callable[..., Awaitable[Any]], target: type, *args, **kwargs) -> Callable[..., Awaitable[RawPage]]:
+    """
+    Asyncio variant of raw_fetch, for paginate_async().
+    """
+    async def fetch(**params) -> RawPage:
+        return RawPage.decode(await Client.call_async(list_method, *args, **kwargs, **params), target)
+    return fetch
@@ -0,0 +1,201 @@
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from .Errors import APIError, CircuitOpenError, is_transient
+
+
+# SDK methods that can be sent twice without changing the outcome. Anything
+# else, e.g. create or submit_tool_outputs, is only retried when the API
+# rejected it before doing any work (429).
+IDEMPOTENT_OPERATIONS = {'retrieve', 'list', 'update', 'delete', 'cancel', 'content'}
+
+
+@dataclass
+class RetryPolicy:
+    """
+    When and how long to wait before sending a failed call again.
+
+    Attributes:
+        max_attempts (int): Attempts per call, including the first one.
+        base_delay (float): Seconds of the first backoff step. Each further step doubles it.
+        max_delay (float): Upper bound of one backoff wait, also applied to Retry-After.
+        jitter (bool): Waits a random time between 0 and the backoff step, so concurrent clients do not retry in lockstep.
+    """
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    jitter: bool = True
+
+    def delay(self, attempt: int, error: BaseException) -> float:
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        step = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, step) if self.jitter else step
+
+    def should_retry(self, attempt: int, error: BaseException, idempotent: bool) -> bool:
+        if attempt >= self.max_attempts or isinstance(error, CircuitOpenError):
+            return False
+        if idempotent:
+            return is_transient(error)
+        return getattr(error, 'status_code', None) == 429
+
+
+class CircuitBreaker:
+    """
+    Fails calls fast while the API is clearly degraded.
+
+    After failure_threshold consecutive 5xx, timeout or connection failures the
+    circuit opens, and calls raise CircuitOpenError without being sent. Once
+    reset_timeout seconds have passed, one trial call is let through: success
+    closes the circuit, failure opens it again. Client errors such as 400 or
+    404 show that the API is answering and count as successes.
+
+    Attributes:
+        failure_threshold (int): Consecutive upstream failures that open the circuit.
+        reset_timeout (float): Seconds the circuit stays open before a trial call.
+        state (str): 'closed', 'open' or 'half_open'.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+
+    def before_call(self) -> None:
+        """
+        Raises CircuitOpenError if the call must not be sent.
+        """
+        with self._lock:
+            if self.state == 'closed':
+                return
+            retry_at = self._opened_at + self.reset_timeout
+            if self.state == 'open' and time.monotonic() >= retry_at:
+                self.state = 'half_open'
+                self._trial_running = False
+            if self.state == 'half_open' and not self._trial_running:
+                self._trial_running = True
+                return
+        raise CircuitOpenError("Circuit open after repeated API failures", retry_at)
+
+
+    def record(self, error: Optional[BaseException]) -> None:
+        with self._lock:
+            if error is None or not _upstream_failure(error):
+                self.state = 'closed'
+                self._failures = 0
+                self._trial_running = False
+                return
+            self._failures += 1
+            if self.state == 'half_open' or self._failures >= self.failure_threshold:
+                self.state = 'open'
+                self._opened_at = time.monotonic()
+                self._trial_running = False
+
+
+def call(fn: Callable, args: tuple, kwargs: dict, policy: Optional[RetryPolicy], breaker: Optional[CircuitBreaker]) -> Any:
+    """
+    Calls fn(*args, **kwargs) under the retry policy and circuit breaker.
+
+    Raises:
+        APIError: With the HTTP status of the last failure, once the call is not retried any more.
+        CircuitOpenError: If the circuit breaker is open.
+    """
+    idempotent = _idempotent(fn)
+    files = _file_positions(args, kwargs)
+    attempt = 0
+    while True:
+        attempt += 1
+        if breaker is not None:
+            breaker.before_call()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            if breaker is not None:
+                breaker.record(e)
+            if policy is None or not policy.should_retry(attempt, e, idempotent):
+                raise APIError.from_exception(str(e) or type(e).__name__, e, attempt) from e
+            time.sleep(policy.delay(attempt, e))
+            _rewind(files)
+            continue
+        if breaker is not None:
+            breaker.record(None)
+        return result
+
+
+async def call_async(fn: Callable, args: tuple, kwargs: dict, policy: Optional[RetryPolicy], breaker: Optional[CircuitBreaker]) -> Any:
+    """
+    Asyncio variant of call. fn returns an awaitable, e.g. an AsyncOpenAI method.
+    """
+    idempotent = _idempotent(fn)
+    files = _file_positions(args, kwargs)
+    attempt = 0
+    while True:
+        attempt += 1
+        if breaker is not None:
+            breaker.before_call()
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception as e:
+            if breaker is not None:
+                breaker.record(e)
+            if policy is None or not policy.should_retry(attempt, e, idempotent):
+                raise APIError.from_exception(str(e) or type(e).__name__, e, attempt) from e
+            await asyncio.sleep(policy.delay(attempt, e))
+            _rewind(files)
+            continue
+        if breaker is not None:
+            breaker.record(None)
+        return result
+
+
+def _idempotent(fn: Callable) -> bool:
+    return getattr(fn, '__name__', None) in IDEMPOTENT_OPERATIONS
+
+
+def _file_positions(args: tuple, kwargs: dict) -> list[tuple[Any, int]]:
+    # Uploads pass open files, which a failed attempt may have read to the end.
+    positions = []
+    for value in (*args, *kwargs.values()):
+        if hasattr(value, 'seek') and hasattr(value, 'tell'):
+            try:
+                positions.append((value, value.tell()))
+            except (OSError, ValueError):
+                pass
+    return positions
+
+
+def _rewind(positions: list[tuple[Any, int]]) -> None:
+    for file, position in positions:
+        file.seek(position)
+
+
+def _upstream_failure(error: BaseException) -> bool:
+    status_code = getattr(error, 'status_code', None)
+    if isinstance(status_code, int):
+        return status_code >= 500 or status_code == 408
+    return is_transient(error)
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if headers is None:
+        return None
+    try:
+        value = headers.get('retry-after-ms')
+        if value is not None:
+            return float(value) / 1000.0
+        value = headers.get('retry-after')
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
@@ -1,17 +1,209 @@
 
-from dataclasses import dataclass, field
-from typing import Any, Optional
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Iterator, Optional, TYPE_CHECKING
 
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from GPTManager.Client import Client
+from GPTManager.Compact import CompactRun, CompactRunStep
+from GPTManager.Mapper import mapper
+from GPTManager.Errors import APIError
+from GPTManager.Polling import TERMINAL_STATUSES, PollBackoff, RunWaitResult, wait_for_runs
+from GPTManager.RunPoller import RunPoller
+from GPTManager.Pagination import MAX_PAGE_SIZE, page_params, paginate
+from GPTManager.RawJSON import raw_fetch
+from GPTManager.Store import read_through, write_through
+
+if TYPE_CHECKING:
+    from .RunStream import RunStream
 
 @dataclass
 class Tool:
     type: str
     function: object = None
-    
+
+
+class ToolRegistry:
+    """
+    Maps function tool names to Python callables and answers requires_action runs.
+
+    All tool calls of a step run concurrently: coroutine functions on an event
+    loop, plain functions on a thread pool created for the batch. Each call is
+    bounded by a timeout counted from the start of the batch, so a batch never
+    takes longer than its longest timeout, even when calls queue for a worker.
+    A call still queued at its deadline never runs. A call that fails, times
+    out or names an unknown function produces an error output for the model
+    instead of aborting the run, unless raise_errors is set.
+
+    Coroutine functions are cancelled on timeout. Plain functions cannot be
+    interrupted: a timed out call is abandoned and keeps its worker thread
+    until it returns. Since every batch gets its own pool, an abandoned call
+    never delays a later batch.
+
+    Attributes:
+        timeout (float): Default per-call timeout in seconds.
+        max_workers (int): Maximum number of plain functions running at once per batch.
+            None runs every call of a batch at once. With a cap, the remaining calls
+            queue behind the running ones and time out if no worker frees up in time.
+        raise_errors (bool): Raise a ValueError instead of reporting tool failures to the model.
+
+    Methods:
+        register(function=None, name=None, timeout=None): Registers a callable, usable as a decorator.
+        execute(tool_calls): Runs tool calls concurrently and returns the tool outputs.
+        execute_async(tool_calls): Asyncio variant of execute.
+    """
+
+    def __init__(self, timeout: float = 30.0, max_workers: Optional[int] = None, raise_errors: bool = False):
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.raise_errors = raise_errors
+        self._functions: dict[str, tuple[Callable, Optional[float]]] = {}
+
+
+    def register(self, function: Optional[Callable] = None, name: Optional[str] = None, timeout: Optional[float] = None):
+        """
+        Registers a callable under a function tool name.
+
+        Parameters:
+            function (Callable): The function or coroutine function. It receives the tool call arguments as keyword arguments.
+            name (str): The tool name. Defaults to the function name.
+            timeout (float): Overrides the registry timeout for this tool.
+
+        Returns:
+            The function, so that register can be used as a decorator with or without arguments.
+        """
+        def decorator(function: Callable) -> Callable:
+            self._functions[name or function.__name__] = (function, timeout)
+            return function
+
+        if function is None:
+            return decorator
+        return decorator(function)
+
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._functions
+
+
+    def execute(self, tool_calls: list[Any]) -> list[dict]:
+        """
+        Runs the tool calls of a step concurrently.
+
+        Parameters:
+            tool_calls (list): The tool calls from run.required_action.submit_tool_outputs.tool_calls.
+
+        Returns:
+            list[dict]: One {"tool_call_id", "output"} entry per tool call, in the same order.
+
+        Raises:
+            ValueError: If raise_errors is set and a tool call fails.
+        """
+        if not tool_calls:
+            return []
+
+        started = time.monotonic()
+        pool = self.__create_pool(len(tool_calls))
+        try:
+            calls = []
+            for tool_call in tool_calls:
+                deadline = started + self.__timeout(tool_call)
+                calls.append((tool_call, deadline, pool.submit(self.__call, tool_call, deadline)))
+
+            outputs = []
+            for tool_call, deadline, future in calls:
+                try:
+                    output = future.result(timeout=max(deadline - time.monotonic(), 0))
+                except Exception as e:
+                    # Drops the call if it is still queued; a running plain function is abandoned.
+                    future.cancel()
+                    output = self.__error_output(tool_call, e)
+                outputs.append({"tool_call_id": tool_call.id, "output": output})
+            return outputs
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+    async def execute_async(self, tool_calls: list[Any]) -> list[dict]:
+        """
+        Asyncio variant of execute. Coroutine functions run on the current event loop.
+        """
+        if not tool_calls:
+            return []
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        pool = self.__create_pool(len(tool_calls))
+
+        async def run(tool_call) -> dict:
+            try:
+                function, arguments = self.__resolve(tool_call)
+                if asyncio.iscoroutinefunction(function):
+                    call = function(**arguments)
+                else:
+                    call = loop.run_in_executor(pool, lambda: function(**arguments))
+                # Cancelling the executor future on timeout also drops the call if it is still queued.
+                remaining = started + self.__timeout(tool_call) - loop.time()
+                output = _format_output(await asyncio.wait_for(call, timeout=max(remaining, 0)))
+            except Exception as e:
+                output = self.__error_output(tool_call, e)
+            return {"tool_call_id": tool_call.id, "output": output}
+
+        try:
+            return list(await asyncio.gather(*(run(tool_call) for tool_call in tool_calls)))
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+    def __call(self, tool_call: Any, deadline: float) -> str:
+        function, arguments = self.__resolve(tool_call)
+        if asyncio.iscoroutinefunction(function):
+            # Bounded inside the worker's own loop, so the coroutine is cancelled at the deadline instead of abandoned.
+            remaining = max(deadline - time.monotonic(), 0)
+            return _format_output(asyncio.run(asyncio.wait_for(function(**arguments), timeout=remaining)))
+        return _format_output(function(**arguments))
+
+
+    def __resolve(self, tool_call: Any) -> tuple[Callable, dict]:
+        name = tool_call.function.name
+        if name not in self._functions:
+            raise KeyError(f"No tool registered under '{name}'")
+        arguments = json.loads(tool_call.function.arguments or "{}")
+        return self._functions[name][0], arguments
+
+
+    def __timeout(self, tool_call: Any) -> float:
+        registered = self._functions.get(tool_call.function.name)
+        if registered is not None and registered[1] is not None:
+            return registered[1]
+        return self.timeout
+
+
+    def __error_output(self, tool_call: Any, error: Exception) -> str:
+        if isinstance(error, (TimeoutError, asyncio.TimeoutError, FutureTimeoutError)):
+            message = f"Tool '{tool_call.function.name}' timed out"
+        else:
+            message = f"Tool '{tool_call.function.name}' failed: {error}"
+        if self.raise_errors:
+            raise ValueError(message) from error
+        return json.dumps({"error": message})
+
+
+    def __create_pool(self, calls: int) -> ThreadPoolExecutor:
+        workers = calls if self.max_workers is None else max(1, min(self.max_workers, calls))
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix='GPTManager-Tool')
+
+
+def _format_output(result: Any) -> str:
+    if isinstance(result, str):
+        return result
+    return json.dumps(result, default=str)
+
+
 @dataclass
 class RunStep:
     """
@@ -48,6 +240,19 @@ class RunStep:
     last_error: Optional[str]
     step_details: dict
 
+    def compact(self) -> CompactRunStep:
+        """
+        Returns a slotted copy of the step without SDK objects, for keeping many steps in memory.
+        """
+        return CompactRunStep.from_run_step(self)
+
+
+# The fields an API response refreshes on an existing Run: everything but its ids.
+RUN_STATE_FIELDS = (
+    'object', 'created_at', 'status', 'started_at', 'expires_at', 'cancelled_at', 'failed_at', 'completed_at',
+    'last_error', 'model', 'instructions', 'tools', 'file_ids', 'metadata', 'required_action',
+)
+
 
 @dataclass
 class Run:
@@ -72,6 +277,7 @@ class Run:
         tools (list[Tool]): The tools used for the run.
         file_ids (list[Any]): The file ids used for the run.
         metadata (dict[str, Any]): The metadata for the run.
+        required_action (Any): The tool calls the run is waiting for when its status is requires_action.
     """  
     id: str
     object: str
@@ -90,6 +296,7 @@ class Run:
     tools: list[Tool]
     file_ids: list[Any]
     metadata: dict[str, Any]
+    required_action: Optional[Any] = None
 
     def __init__(self, **kwargs) -> None:
         """
@@ -124,24 +331,16 @@ class Run:
         self.tools = kwargs.get("tools", None)
         self.file_ids = kwargs.get("file_ids", None)
         self.metadata = kwargs.get("metadata", None)
+        self.required_action = kwargs.get("required_action", None)
 
-        if (
-            self.id != None and
-            self.object != None and
-            self.created_at != None and
-            self.assistant_id != None and
-            self.thread_id != None and
-            self.status != None and
-            self.started_at != None and
-            self.completed_at != None and
-            self.model != None and
-            self.tools != None and
-            self.file_ids != None and
-            self.metadata != None
-        ): return
+        # Built from an API payload: queued or in_progress runs legitimately
+        # have no started_at/completed_at, so don't re-fetch them.
+        if self.id is not None and self.object is not None and self.status is not None:
+            return
            
         if self.id is not None and self.thread_id is not None:
-            self.retrieve_run()
+            if not self._load_stored():
+                self.retrieve_run()
         elif self.thread_id is not None and self.assistant_id is not None:
             self.create_run()
         
@@ -156,32 +355,21 @@ class Run:
         Raises:
             ValueError: If the thread_id or assistant_id is not set.
         """
-        client = Client.get_instance()
+        client = Client.get_instance(self.thread_id)
 
         try:
-            run = client.beta.threads.runs.create(
+            run = Client.call(client.beta.threads.runs.create,
                 thread_id=self.thread_id,
                 assistant_id=self.assistant_id,
             )
 
             self.id = run.id
-            self.object = run.object
-            self.created_at = run.created_at
-            self.status = run.status
-            self.started_at = run.started_at
-            self.expires_at = run.expires_at
-            self.cancelled_at = run.cancelled_at
-            self.failed_at = run.failed_at
-            self.completed_at = run.completed_at
-            self.last_error = run.last_error
-            self.model = run.model
-            self.instructions = run.instructions
-            self.tools = run.tools
-            self.file_ids = run.file_ids
-            self.metadata = run.metadata
-            
+            self._copy_from(run)
+
         except Exception as e:
-            raise ValueError("Failed to create run") from e
+            raise APIError.from_exception("Failed to create run", e) from e
+
+        write_through(self)
         
 
     def retrieve_run(self):
@@ -194,31 +382,20 @@ class Run:
         Raises:
             ValueError: If the thread_id or assistant_id is not set.
         """
-        client = Client.get_instance()
+        client = Client.get_instance(self.thread_id)
 
         try:
-            run = client.beta.threads.runs.retrieve(
+            run = Client.call_shared(client.beta.threads.runs.retrieve,
                 thread_id=self.thread_id,
                 run_id=self.id,
             )
 
-            self.object = run.object
-            self.created_at = run.created_at
-            self.status = run.status
-            self.started_at = run.started_at
-            self.expires_at = run.expires_at
-            self.cancelled_at = run.cancelled_at
-            self.failed_at = run.failed_at
-            self.completed_at = run.completed_at
-            self.last_error = run.last_error
-            self.model = run.model
-            self.instructions = run.instructions
-            self.tools = run.tools
-            self.file_ids = run.file_ids
-            self.metadata = run.metadata
+            self._copy_from(run)
 
         except Exception as e:
-            raise ValueError("Failed to retrieve run") from e
+            raise APIError.from_exception("Failed to retrieve run", e) from e
+
+        write_through(self)
 
 
     def modify_run(self, metadata) -> None:
@@ -234,10 +411,10 @@ class Run:
         Raises:
             ValueError: If the thread_id or assistant_id is not set.
         """
-        client = Client.get_instance()
+        client = Client.get_instance(self.thread_id)
 
         try:
-            run = client.beta.threads.runs.update(
+            run = Client.call(client.beta.threads.runs.update,
                 thread_id=self.thread_id,
                 run_id=self.id,
                 metadata=metadata
@@ -246,7 +423,7 @@ class Run:
             self.metadata = run.metadata
 
         except Exception as e:
-            raise ValueError("Failed to modify run") from e
+            raise APIError.from_exception("Failed to modify run", e) from e
         
       
     def submit_tool_outputs(self, tool_outputs: list[dict]) -> None:
@@ -259,30 +436,21 @@ class Run:
         Raises:
             ValueError: If the thread_id or assistant_id is not set.
         """
-        client = Client.get_instance()
+        client = Client.get_instance(self.thread_id)
 
         try:
-            run = client.beta.threads.runs.submit_tool_outputs(
+            run = Client.call(client.beta.threads.runs.submit_tool_outputs,
                 thread_id=self.thread_id,
                 run_id=self.id,
                 tool_outputs=tool_outputs
             )
 
-            self.status = run.status
-            self.started_at = run.started_at
-            self.expires_at = run.expires_at
-            self.cancelled_at = run.cancelled_at
-            self.failed_at = run.failed_at
-            self.completed_at = run.completed_at
-            self.last_error = run.last_error
-            self.model = run.model
-            self.instructions = run.instructions
-            self.tools = run.tools
-            self.file_ids = run.file_ids
-            self.metadata = run.metadata
+            self._copy_from(run)
 
         except Exception as e:
-            raise ValueError("Failed to submit tool outputs") from e
+            raise APIError.from_exception("Failed to submit tool outputs", e) from e
+
+        write_through(self)
 
 
     def cancel_run(self) -> None:
@@ -295,30 +463,20 @@ class Run:
         Raises:
             ValueError: If the thread_id or assistant_id is not set.
         """
-        client = Client.get_instance()
+        client = Client.get_instance(self.thread_id)
 
         try:
-            run = client.beta.threads.runs.cancel(
+            run = Client.call(client.beta.threads.runs.cancel,
                 thread_id=self.thread_id,
                 run_id=self.id,
             )
 
-            self.object = run.object
-            self.status = run.status
-            self.started_at = run.started_at
-            self.expires_at = run.expires_at
-            self.cancelled_at = run.cancelled_at
-            self.failed_at = run.failed_at
-            self.completed_at = run.completed_at
-            self.last_error = run.last_error
-            self.model = run.model
-            self.instructions = run.instructions
-            self.tools = run.tools
-            self.file_ids = run.file_ids
-            self.metadata = run.metadata
+            self._copy_from(run)
 
         except Exception as e:
-            raise ValueError("Failed to cancel run") from e
+            raise APIError.from_exception("Failed to cancel run", e) from e
+
+        write_through(self)
 
        
     def create_thread_and_run(self, messages: list[dict]):
@@ -331,10 +489,10 @@ class Run:
         Raises:
             ValueError: If the thread_id or assistant_id is not set.
         """
-        client = Client.get_instance()
+        client = Client.get_instance(self.assistant_id)
 
         try:
-            run = client.beta.threads.create_and_run(
+            run = Client.call(client.beta.threads.create_and_run,
                 assistant_id=self.assistant_id,
                 thread={
                     "messages": messages
@@ -342,86 +500,254 @@ class Run:
             )
 
             self.id = run.id
-            self.object = run.object
-            self.created_at = run.created_at
-            self.status = run.status
-            self.started_at = run.started_at
-            self.expires_at = run.expires_at
-            self.cancelled_at = run.cancelled_at
-            self.failed_at = run.failed_at
-            self.completed_at = run.completed_at
-            self.last_error = run.last_error
-            self.model = run.model
-            self.instructions = run.instructions
-            self.tools = run.tools
-            self.file_ids = run.file_ids
-            self.metadata = run.metadata
+            Client.pin(run.thread_id, client)
+            self._copy_from(run)
 
         except Exception as e:
-            raise ValueError("Failed to create thread and run") from e
+            raise APIError.from_exception("Failed to create thread and run", e) from e
+
+        write_through(self)
 
 
     def retrieve_run_step(self, step_id: str) -> RunStep:
-        client = Client.get_instance()
+        client = Client.get_instance(self.thread_id)
 
         try:
-            run_step = client.beta.threads.runs.steps.retrieve(
+            run_step = Client.call(client.beta.threads.runs.steps.retrieve,
                 thread_id=self.thread_id,
                 run_id=self.id,
                 step_id=step_id
             )
-            return RunStep(
-                id = run_step.id,
-                object = run_step.object,
-                created_at = run_step.created_at,
-                run_id = run_step.run_id,
-                assistant_id = run_step.assistant_id,
-                thread_id = run_step.thread_id,
-                type = run_step.type,
-                status = run_step.status,
-                cancelled_at = run_step.cancelled_at,
-                completed_at = run_step.completed_at,
-                expired_at = run_step.expired_at,
-                failed_at = run_step.failed_at,
-                last_error = run_step.last_error,
-                step_details = run_step.step_details
+            step = mapper(RunStep).build(run_step)
+
+        except Exception as e:
+            raise APIError.from_exception("Failed to retrive run step.", e) from e
+
+        write_through(step)
+        return step
+
+
+    def list_run_steps(
+        self,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        raw: bool = False
+    ) -> list[RunStep]:
+        """
+        Lists the steps of the run, following every page.
+
+        Parameters:
+            limit (int): The maximum number of steps to return. None returns all of them.
+            order (str): 'asc' or 'desc' by creation time.
+            page_size (int): The number of steps requested per page, at most 100.
+            raw (bool): Decode the response JSON directly into RunSteps, see iter_run_steps().
+
+        Returns:
+            list[RunStep]: The steps of the run.
+
+        Raises:
+            ValueError: If the API call fails.
+        """
+        run_steps = list(self.iter_run_steps(limit=limit, order=order, page_size=page_size, raw=raw))
+        write_through(*run_steps)
+        return run_steps
+
+
+    def iter_run_steps(
+        self,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = True,
+        raw: bool = False
+    ) -> Iterator[RunStep]:
+        """
+        Lazily yields the steps of the run, one page in memory at a time.
+
+        In raw mode each page body is decoded once and built into RunSteps
+        without the SDK's pydantic models, so step_details and last_error are dicts.
+
+        Parameters:
+            limit (int): The maximum number of steps to yield. None yields all of them.
+            order (str): 'asc' or 'desc' by creation time.
+            page_size (int): The number of steps requested per page, at most 100.
+            prefetch (bool): Whether to request the next page ahead of time.
+            raw (bool): Decode the response JSON directly into RunSteps.
+
+        Returns:
+            Iterator[RunStep]: The steps of the run.
+
+        Raises:
+            ValueError: If the API call fails.
+        """
+        client = Client.get_instance(self.thread_id)
+
+        try:
+            params = page_params(limit, page_size, order)
+            if raw:
+                fetch = raw_fetch(
+                    client.beta.threads.runs.steps.with_raw_response.list, RunStep, thread_id=self.thread_id, run_id=self.id
+                )
+                yield from paginate(fetch, params, limit=limit, prefetch=prefetch)
+                return
+            run_steps = paginate(
+                lambda **params: Client.call(client.beta.threads.runs.steps.list,
+                    thread_id=self.thread_id,
+                    run_id=self.id,
+                    **params
+                ),
+                params,
+                limit=limit,
+                prefetch=prefetch
             )
+            build = mapper(RunStep).build
+            for run_step in run_steps:
+                yield build(run_step)
 
         except Exception as e:
-            raise ValueError("Failed to retrive run step.") from e
+            raise APIError.from_exception("Failed to list run steps", e) from e
+
+
+    def wait_run(self, timeout: Optional[float] = None, backoff: Optional[PollBackoff] = None) -> RunWaitResult:
+        """
+        Polls the run until it leaves the queued, in_progress and cancelling states.
+
+        Polling starts fast and slows down while the status stays the same.
+
+        Parameters:
+            timeout (float): Seconds after which to stop waiting. None waits indefinitely.
+            backoff (PollBackoff): The polling cadence. Defaults to PollBackoff().
+
+        Returns:
+            RunWaitResult: The run with its latest state and the number of polls the wait cost.
+
+        Raises:
+            ValueError: If the run retrieval fails.
+        """
+        return wait_for_runs([self], timeout=timeout, backoff=backoff)
+
+
+    def watch_run(self, callback: Optional[Callable[['Run'], None]] = None) -> Future:
+        """
+        Hands the run over to the shared background RunPoller.
+
+        The run is refreshed together with the other watched runs of its thread,
+        so many watched runs cost far fewer requests than polling each one.
+
+        Parameters:
+            callback (Callable[[Run], None]): Called with the run once it is no longer pending.
+
+        Returns:
+            Future: Resolved with this run once it is in a terminal state or requires action.
+        """
+        return RunPoller.get_instance().register(self, callback)
 
 
-    def list_run_steps(self):
-        client = Client.get_instance()
+    def stream_run(self) -> 'RunStream':
+        """
+        Creates a new thread run for thread_id and assistant_id and streams its events.
+
+        Iterating the returned RunStream yields RunStatusEvent, MessageDeltaEvent,
+        MessageCompletedEvent, RunStepDeltaEvent and RequiresActionEvent objects.
+        This run is updated from the stream, so no retrieve calls are needed.
+
+        Returns:
+            RunStream: The stream of typed run events.
+
+        Raises:
+            ValueError: If the thread_id or assistant_id is not set, or if the run creation fails.
+        """
+        from .RunStream import RunStream  # RunStream depends on Thread, which imports this module
+
+        client = Client.get_instance(self.thread_id)
 
         try:
-            run_steps = client.beta.threads.runs.steps.list(
+            events = Client.call(client.beta.threads.runs.create,
                 thread_id=self.thread_id,
-                run_id=self.id
+                assistant_id=self.assistant_id,
+                stream=True
             )
-        
-            return [
-                RunStep(
-                    id = run_step.id,
-                    object = run_step.object,
-                    created_at = run_step.created_at,
-                    run_id = run_step.run_id,
-                    assistant_id = run_step.assistant_id,
-                    thread_id = run_step.thread_id,
-                    type = run_step.type,
-                    status = run_step.status,
-                    cancelled_at = run_step.cancelled_at,
-                    completed_at = run_step.completed_at,
-                    expired_at = run_step.expired_at,
-                    failed_at = run_step.failed_at,
-                    last_error = run_step.last_error,
-                    step_details = run_step.step_details
-                ) 
-                for run_step 
-                in run_steps.data
-            ]
-    
         except Exception as e:
-            raise ValueError("Failed to list run steps") from e
-        
+            raise APIError.from_exception("Failed to create run", e) from e
+
+        return RunStream(events, self)
+
+
+    def stream_tool_outputs(self, tool_outputs: list[dict]) -> 'RunStream':
+        """
+        Submits tool outputs for a thread run and streams the events of the resumed run.
+
+        Returns:
+            RunStream: The stream of typed run events.
+
+        Raises:
+            ValueError: If submitting the tool outputs fails.
+        """
+        from .RunStream import RunStream
+
+        client = Client.get_instance(self.thread_id)
+
+        try:
+            events = Client.call(client.beta.threads.runs.submit_tool_outputs,
+                thread_id=self.thread_id,
+                run_id=self.id,
+                tool_outputs=tool_outputs,
+                stream=True
+            )
+        except Exception as e:
+            raise APIError.from_exception("Failed to submit tool outputs", e) from e
+
+        return RunStream(events, self)
+
+
+    def _copy_from(self, run) -> None:
+        mapper(Run, RUN_STATE_FIELDS).update(self, run)
+
+
+    def _update_from(self, run) -> None:
+        # API methods copy inside their try and write through after it, so a
+        # failing Store never turns a request that succeeded into an APIError.
+        self._copy_from(run)
+        write_through(self)
+
+
+    def compact(self) -> CompactRun:
+        """
+        Returns a slotted copy of the run without SDK objects, for keeping many runs in memory.
+        """
+        return CompactRun.from_run(self)
+
+
+    def _load_stored(self) -> bool:
+        # Only finished runs are served from the store: their state can no longer
+        # change, and a stored required_action is a plain dict, not an SDK object.
+        stored = read_through('Run', self.id)
+        if stored is None or stored['status'] not in TERMINAL_STATUSES:
+            return False
+        mapper(Run).update(self, stored)
+        return True
+
+
+    def dispatch_tool_calls(self, registry: ToolRegistry) -> list[dict]:
+        """
+        Answers a requires_action run with the tools of a ToolRegistry.
+
+        All tool calls of the step run concurrently and their outputs are
+        submitted in a single submit_tool_outputs call.
+
+        Parameters:
+            registry (ToolRegistry): The registry mapping tool names to callables.
+
+        Returns:
+            list[dict]: The submitted tool outputs, or an empty list if the run does not require action.
+
+        Raises:
+            ValueError: If submitting the tool outputs fails.
+        """
+        if self.status != 'requires_action' or self.required_action is None:
+            return []
+        tool_outputs = registry.execute(self.required_action.submit_tool_outputs.tool_calls)
+        self.submit_tool_outputs(tool_outputs)
+        return tool_outputs
 
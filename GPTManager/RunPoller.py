@@ -0,0 +1,212 @@
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from GPTManager.Client import Client
+from .Polling import PENDING_STATUSES, PollBackoff
+
+
+@dataclass
+class _ThreadPolls:
+    thread_id: str
+    runs: dict[str, Any] = field(default_factory=dict)
+    futures: dict[str, list[Future]] = field(default_factory=dict)
+    delay: Optional[float] = None
+    due: float = 0.0
+    failures: int = 0
+
+
+class RunPoller:
+    """
+    Background service that polls runs on behalf of many waiters.
+
+    Runs are grouped by thread and the cadence is decided per thread: the
+    delay restarts from PollBackoff.initial whenever any run of the thread
+    changes status and grows while nothing changes. A thread with a single
+    pending run is refreshed with runs.retrieve; a thread with several pending
+    runs is refreshed with one runs.list call instead of one retrieve per run.
+
+    Registered Run objects are updated in place and their future is resolved
+    with the Run once it leaves the queued, in_progress and cancelling states.
+    Use asyncio.wrap_future() to await a future from an event loop.
+
+    Attributes:
+        backoff (PollBackoff): The polling cadence applied per thread.
+        page_size (int): The number of runs requested by a runs.list refresh.
+        max_failures (int): Consecutive failed refreshes after which the waiters of a thread receive the error.
+        requests (int): The number of API requests issued so far.
+        refreshes (int): The number of run refreshes obtained from those requests.
+
+    Methods:
+        get_instance(): Returns the process-wide poller.
+        register(run, callback=None): Starts polling a run and returns a Future resolved with it.
+        stop(): Stops the background worker.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, backoff: Optional[PollBackoff] = None, page_size: int = 100, max_failures: int = 5):
+        self.backoff = backoff or PollBackoff()
+        self.page_size = page_size
+        self.max_failures = max_failures
+        self.requests = 0
+        self.refreshes = 0
+        self._threads: dict[str, _ThreadPolls] = {}
+        self._condition = threading.Condition()
+        self._worker = None
+        self._stopped = False
+
+
+    @classmethod
+    def get_instance(cls) -> 'RunPoller':
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = RunPoller()
+            return cls._instance
+
+
+    def register(self, run: Any, callback: Optional[Callable[[Any], None]] = None) -> Future:
+        """
+        Starts polling a run in the background.
+
+        Parameters:
+            run (Run): The run to poll. It must have id and thread_id set.
+            callback (Callable[[Run], None]): Called with the run once it is no longer pending.
+
+        Returns:
+            Future: Resolved with the run once it is no longer pending, or with a
+            ValueError if polling keeps failing.
+        """
+        future = Future()
+        if callback is not None:
+            def notify(done: Future):
+                if done.exception() is None:
+                    callback(done.result())
+            future.add_done_callback(notify)
+
+        if run.status is not None and run.status not in PENDING_STATUSES:
+            future.set_result(run)
+            return future
+
+        with self._condition:
+            entry = self._threads.get(run.thread_id)
+            if entry is None:
+                entry = self._threads[run.thread_id] = _ThreadPolls(thread_id=run.thread_id)
+                entry.due = time.monotonic() + self.backoff.initial
+            else:
+                # A new run is likely to change soon: poll its thread at the fast cadence again.
+                entry.delay = None
+                entry.due = min(entry.due, time.monotonic() + self.backoff.initial)
+            entry.runs[run.id] = run
+            entry.futures.setdefault(run.id, []).append(future)
+            self._start()
+            self._condition.notify()
+        return future
+
+
+    def stop(self):
+        """
+        Stops the background worker. Pending futures are left unresolved.
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+
+    def _start(self):
+        self._stopped = False
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._loop, name='GPTManager-RunPoller', daemon=True)
+            self._worker.start()
+
+
+    def _loop(self):
+        while True:
+            with self._condition:
+                entry = None
+                while not self._stopped:
+                    if self._threads:
+                        entry = min(self._threads.values(), key=lambda polls: polls.due)
+                        wait = entry.due - time.monotonic()
+                        if wait <= 0:
+                            break
+                        entry = None
+                        self._condition.wait(wait)
+                    else:
+                        self._condition.wait()
+                if self._stopped:
+                    return
+                runs = dict(entry.runs)
+
+            try:
+                latest, requests = self._refresh(entry.thread_id, runs)
+                error = None
+            except Exception as e:
+                latest, requests, error = {}, 1, e
+
+            with self._condition:
+                self.requests += requests
+                self.refreshes += len(latest)
+                resolved = self._apply(entry, latest, error)
+
+            # Resolve outside the lock so callbacks may register new runs.
+            for future, outcome in resolved:
+                if isinstance(outcome, Exception):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+
+
+    def _refresh(self, thread_id: str, runs: dict[str, Any]) -> tuple[dict[str, Any], int]:
+        client = Client.get_instance(thread_id)
+        latest = {}
+        requests = 0
+
+        if len(runs) > 1:
+            page = Client.call(client.beta.threads.runs.list, thread_id=thread_id, limit=self.page_size)
+            requests += 1
+            latest = {run_data.id: run_data for run_data in page.data if run_data.id in runs}
+
+        for run_id in runs.keys() - latest.keys():
+            latest[run_id] = Client.call_shared(client.beta.threads.runs.retrieve, thread_id=thread_id, run_id=run_id)
+            requests += 1
+
+        return latest, requests
+
+
+    def _apply(self, entry: _ThreadPolls, latest: dict[str, Any], error: Optional[Exception]) -> list[tuple[Future, Any]]:
+        resolved = []
+        changed = False
+        if error is not None:
+            entry.failures += 1
+            if entry.failures >= self.max_failures:
+                failure = ValueError("Failed to poll runs")
+                failure.__cause__ = error
+                for futures in entry.futures.values():
+                    resolved.extend((future, failure) for future in futures)
+                entry.runs.clear()
+                entry.futures.clear()
+        else:
+            entry.failures = 0
+
+        for run_id, run_data in latest.items():
+            run = entry.runs.get(run_id)
+            if run is None:
+                continue
+            changed = changed or run.status != run_data.status
+            run._update_from(run_data)
+            if run.status not in PENDING_STATUSES:
+                del entry.runs[run_id]
+                resolved.extend((future, run) for future in entry.futures.pop(run_id, []))
+
+        if not entry.runs:
+            del self._threads[entry.thread_id]
+        else:
+            entry.delay = self.backoff.next_delay(entry.delay, changed)
+            entry.due = time.monotonic() + self.backoff.jittered(entry.delay)
+        return resolved
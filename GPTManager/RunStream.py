@@ -0,0 +1,195 @@
+import inspect
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterator, TYPE_CHECKING
+
+from .Thread import Message
+from .Mapper import mapper
+
+if TYPE_CHECKING:
+    from .Run import Run
+
+
+@dataclass
+class RunStatusEvent:
+    """
+    The run was created or changed status. `run` is updated in place from the stream.
+    """
+    status: str
+    run: 'Run'
+
+
+@dataclass
+class MessageDeltaEvent:
+    """
+    A piece of message text, in the order produced by the model.
+    """
+    message_id: str
+    index: int
+    text: str
+
+
+@dataclass
+class MessageCompletedEvent:
+    """
+    A message of the run is complete.
+    """
+    message: Message
+
+
+@dataclass
+class RunStepDeltaEvent:
+    """
+    Incremental details of a run step, e.g. partial tool call arguments.
+    """
+    step_id: str
+    step_details: Any
+
+
+@dataclass
+class RequiresActionEvent:
+    """
+    The run is waiting for the outputs of `tool_calls`.
+    """
+    run: 'Run'
+    tool_calls: list[Any]
+
+
+class RunStream:
+    """
+    Iterates the typed events of a streamed run.
+
+    The Run passed in is updated from every run event and completed messages
+    are collected in `messages`, so no retrieve calls are needed once the
+    stream is consumed.
+
+    Attributes:
+        run (Run): The streamed run.
+        messages (list[Message]): The messages completed during the stream.
+
+    Iteration closes the underlying HTTP stream when it ends, including when
+    the consumer breaks out of the loop or raises, so the connection goes back
+    to the pool.
+
+    Methods:
+        until_done(): Consumes the remaining events and returns the run.
+        close(): Closes the underlying HTTP stream.
+    """
+
+    def __init__(self, events: Any, run: 'Run'):
+        self.run = run
+        self.messages: list[Message] = []
+        self._events = events
+
+
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            for event in self._events:
+                yield from self._handle(event)
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError("Failed to stream run") from e
+        finally:
+            self.close()
+
+
+    def until_done(self) -> 'Run':
+        for _ in self:
+            pass
+        return self.run
+
+
+    def close(self) -> None:
+        """
+        Closes the underlying HTTP stream. Safe to call more than once.
+        """
+        close = getattr(self._events, 'close', None)
+        if close is not None:
+            close()
+
+
+    def _handle(self, event: Any) -> list[Any]:
+        name = event.event
+        data = event.data
+
+        if name == 'thread.message.delta':
+            return [
+                MessageDeltaEvent(message_id=data.id, index=content.index, text=content.text.value or '')
+                for content in (data.delta.content or [])
+                if content.type == 'text' and content.text is not None
+            ]
+
+        if name == 'thread.message.completed':
+            message = mapper(Message).build(data)
+            self.messages.append(message)
+            return [MessageCompletedEvent(message=message)]
+
+        if name == 'thread.run.step.delta':
+            return [RunStepDeltaEvent(step_id=data.id, step_details=data.delta.step_details)]
+
+        if name.startswith('thread.run.') and not name.startswith('thread.run.step.'):
+            self.run.id = data.id
+            self.run.thread_id = data.thread_id
+            self.run.assistant_id = data.assistant_id
+            previous = self.run.status
+            self.run._update_from(data)
+            events = []
+            if data.status != previous or name == 'thread.run.created':
+                events.append(RunStatusEvent(status=data.status, run=self.run))
+            if data.status == 'requires_action':
+                events.append(RequiresActionEvent(
+                    run=self.run,
+                    tool_calls=data.required_action.submit_tool_outputs.tool_calls
+                ))
+            return events
+
+        if name == 'error':
+            raise ValueError(f"Run stream failed: {getattr(data, 'message', data)}")
+
+        return []
+
+
+class AsyncRunStream(RunStream):
+    """
+    Asyncio counterpart of RunStream, consumed with `async for`.
+
+    An async generator left early is only finalized later by the event loop,
+    so call aclose() to release the connection right away.
+    """
+
+    def __iter__(self):
+        raise TypeError("AsyncRunStream must be consumed with 'async for'")
+
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        try:
+            async for event in self._events:
+                for typed_event in self._handle(event):
+                    yield typed_event
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError("Failed to stream run") from e
+        finally:
+            await self.aclose()
+
+
+    async def until_done(self) -> 'Run':
+        async for _ in self:
+            pass
+        return self.run
+
+
+    def close(self) -> None:
+        raise TypeError("AsyncRunStream must be closed with 'await aclose()'")
+
+
+    async def aclose(self) -> None:
+        """
+        Closes the underlying HTTP stream. Safe to call more than once.
+        """
+        close = getattr(self._events, 'close', None)
+        if close is not None:
+            closed = close()
+            if inspect.isawaitable(closed):
+                await closed
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls into one.
+
+    While a call for a key is in flight, further calls for the same key wait
+    for it and share its result or exception instead of starting their own.
+    Once it completes, the next call for the key starts a fresh one, so
+    nothing is cached beyond the lifetime of the request.
+
+    Threads and asyncio tasks are coalesced separately, and asyncio calls per
+    event loop. A task that is cancelled while waiting does not cancel the
+    shared call for the other waiters.
+
+    Attributes:
+        calls (int): Number of calls that were actually made.
+        coalesced (int): Number of calls answered by a call already in flight.
+
+    Methods:
+        do(key, fn): Calls fn(), or waits for the call in flight for key.
+        do_async(key, fn): Awaits fn(), or the call in flight for key.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self._calls: dict[Hashable, Future] = {}
+        self._tasks: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+        self._lock = threading.Lock()
+
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                self.calls += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self.__finish(key)
+            future.set_exception(e)
+            raise
+        self.__finish(key)
+        future.set_result(result)
+        return result
+
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._tasks.get((loop, key))
+            if task is not None:
+                self.coalesced += 1
+            else:
+                task = self._tasks[(loop, key)] = loop.create_task(fn())
+                task.add_done_callback(lambda done: self.__finish_task(loop, key, done))
+                self.calls += 1
+        return await asyncio.shield(task)
+
+
+    def __finish(self, key: Hashable) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
+
+
+    def __finish_task(self, loop: asyncio.AbstractEventLoop, key: Hashable, task: asyncio.Task) -> None:
+        with self._lock:
+            if self._tasks.get((loop, key)) is task:
+                del self._tasks[(loop, key)]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every waiter was cancelled.
+            task.exception()
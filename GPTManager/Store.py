@@ -0,0 +1,352 @@
+import dataclasses
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Iterable, Iterator, Optional
+
+
+# Object class name -> (table, indexed columns besides id and created_at).
+# Subclasses such as AsyncThread or AsyncRun are stored under their base class.
+_TABLES = {
+    'Thread': ('threads', ()),
+    'Message': ('messages', ('thread_id', 'run_id')),
+    'Run': ('runs', ('thread_id', 'assistant_id', 'status')),
+    'RunStep': ('run_steps', ('thread_id', 'run_id')),
+    'Assistant': ('assistants', ()),
+}
+
+_THREAD_FIELDS = ('id', 'object', 'created_at', 'metadata')
+
+_DEFAULT = object()
+
+
+class Store:
+    """
+    Optional write-through persistence for threads, messages, runs, run steps and assistants, backed by SQLite.
+
+    Once configured, every object the library creates, retrieves or lists is
+    upserted, and Thread(thread_id), Run(thread_id=..., id=...) and
+    Assistant(assistant_id=...) are served from the store when the stored copy
+    is younger than max_age instead of calling the API.
+
+        Store.configure("gptmanager.db", max_age=300)
+
+    Rows keep the indexed columns (id, created_at, thread_id, run_id, ...) next
+    to a JSON copy of every field. SDK objects nested in fields, such as
+    message content or tools, are stored as plain dicts and read back as dicts.
+    Stored messages are paged by (created_at, id) with indexes per thread and
+    per run, so large histories can be read without calling the API.
+
+    Attributes:
+        path (str): The SQLite database path, or ':memory:'.
+        max_age (float): Seconds a stored object is served without calling the API. None never expires.
+
+    Methods:
+        configure(path, max_age): Opens the shared store used by all objects.
+        get_instance(): Returns the shared store, or None when persistence is disabled.
+        put(obj): Upserts one object.
+        put_many(objects): Upserts objects in a single transaction.
+        get(kind, object_id, max_age): Returns the stored fields of an object if fresh enough.
+        delete(kind, object_id): Removes an object, and the rows of a deleted thread or run.
+        iter_rows(kind, ...): Yields stored objects of a kind, optionally by thread or run, in created_at order.
+        ids(kind): Yields the ids of every stored object of a kind.
+        close(): Closes the database connection.
+    """
+    _instance = None
+
+    def __init__(self, path: str = "gptmanager.db", max_age: Optional[float] = 60.0):
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ':memory:':
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self.__create_schema()
+
+
+    @classmethod
+    def configure(cls, path: str = "gptmanager.db", max_age: Optional[float] = 60.0) -> 'Store':
+        """
+        Opens the shared store used by Thread, Run, Assistant and their async variants.
+
+        Parameters:
+            path (str): The SQLite database path, or ':memory:'.
+            max_age (float): Seconds a stored object is served without calling the API. None never expires.
+
+        Returns:
+            Store: The shared store.
+        """
+        if cls._instance is not None:
+            cls._instance.close()
+        cls._instance = cls(path, max_age=max_age)
+        return cls._instance
+
+
+    @classmethod
+    def get_instance(cls) -> Optional['Store']:
+        return cls._instance
+
+
+    @classmethod
+    def disable(cls) -> None:
+        """
+        Closes the shared store and turns persistence off.
+        """
+        if cls._instance is not None:
+            cls._instance.close()
+        cls._instance = None
+
+
+    def put(self, obj: Any) -> None:
+        self.put_many([obj])
+
+
+    def put_many(self, objects: Iterable[Any]) -> None:
+        """
+        Upserts objects in a single transaction, one executemany per table.
+
+        Parameters:
+            objects (Iterable): Thread, Message, Run, RunStep or Assistant instances, or their subclasses.
+
+        Raises:
+            ValueError: If an object has no table or the write fails.
+        """
+        rows: dict[str, list[tuple]] = {}
+        synced_at = time.time()
+        for obj in objects:
+            kind = _kind(obj)
+            rows.setdefault(kind, []).append(_row(kind, obj, synced_at))
+        if not rows:
+            return
+
+        try:
+            with self._lock:
+                self._connection.execute("BEGIN")
+                try:
+                    for kind, values in rows.items():
+                        table, columns = _TABLES[kind]
+                        names = ('id', 'created_at', *columns, 'data', 'synced_at')
+                        self._connection.executemany(
+                            f"INSERT OR REPLACE INTO {table} ({', '.join(names)}) "
+                            f"VALUES ({', '.join('?' * len(names))})",
+                            values
+                        )
+                    self._connection.execute("COMMIT")
+                except BaseException:
+                    self._connection.execute("ROLLBACK")
+                    raise
+        except Exception as e:
+            raise ValueError("Failed to write to store") from e
+
+
+    def get(self, kind: str, object_id: str, max_age: Any = _DEFAULT) -> Optional[dict[str, Any]]:
+        """
+        Returns the stored fields of an object if it was synced within max_age seconds.
+
+        Parameters:
+            kind (str): 'Thread', 'Message', 'Run', 'RunStep' or 'Assistant'.
+            object_id (str): The object id.
+            max_age (float): Overrides the store max_age for this read. None accepts any age.
+
+        Returns:
+            dict: The object fields, or None if the object is missing or stale.
+        """
+        if max_age is _DEFAULT:
+            max_age = self.max_age
+        table, _ = _TABLES[kind]
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT data, synced_at FROM {table} WHERE id = ?", (object_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        if max_age is not None and row[1] < time.time() - max_age:
+            return None
+        return json.loads(row[0])
+
+
+    def delete(self, kind: str, object_id: str) -> None:
+        """
+        Removes an object. Deleting a thread also removes its messages, runs and
+        run steps, and deleting a run removes its steps.
+        """
+        table, _ = _TABLES[kind]
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                self._connection.execute(f"DELETE FROM {table} WHERE id = ?", (object_id,))
+                if kind == 'Thread':
+                    for child in ('messages', 'runs', 'run_steps'):
+                        self._connection.execute(f"DELETE FROM {child} WHERE thread_id = ?", (object_id,))
+                elif kind == 'Run':
+                    self._connection.execute("DELETE FROM run_steps WHERE run_id = ?", (object_id,))
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+
+    def iter_rows(
+        self,
+        kind: str,
+        thread_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        order: str = 'asc',
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        page_size: int = 1000
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yields stored objects ordered by (created_at, id), one page of rows in memory at a time.
+
+        Pages are read with a keyset on (created_at, id), so every page is an
+        index range scan however deep the iteration goes.
+
+        Parameters:
+            kind (str): 'Thread', 'Message', 'Run', 'RunStep' or 'Assistant'.
+            thread_id (str): Only yield objects of this thread.
+            run_id (str): Only yield objects of this run.
+            order (str): 'asc' or 'desc' by creation time.
+            after (str): Only yield objects that come after this object id in the given order.
+            limit (int): The maximum number of objects to yield. None yields all of them.
+            page_size (int): The number of rows read per query.
+
+        Returns:
+            Iterator[dict]: The stored fields of each object.
+        """
+        table, _ = _TABLES[kind]
+        direction = 'DESC' if order == 'desc' else 'ASC'
+        comparison = '<' if order == 'desc' else '>'
+        filters, values = [], []
+        if thread_id is not None:
+            filters.append("thread_id = ?")
+            values.append(thread_id)
+        if run_id is not None:
+            filters.append("run_id = ?")
+            values.append(run_id)
+
+        cursor = None
+        if after is not None:
+            with self._lock:
+                cursor = self._connection.execute(
+                    f"SELECT created_at, id FROM {table} WHERE id = ?", (after,)
+                ).fetchone()
+            if cursor is None:
+                return
+
+        remaining = limit
+        while remaining is None or remaining > 0:
+            page_filters, page_values = list(filters), list(values)
+            if cursor is not None:
+                page_filters.append(f"(created_at, id) {comparison} (?, ?)")
+                page_values.extend(cursor)
+            size = page_size if remaining is None else min(page_size, remaining)
+            where = f"WHERE {' AND '.join(page_filters)} " if page_filters else ""
+            with self._lock:
+                rows = self._connection.execute(
+                    f"SELECT created_at, id, data FROM {table} {where}"
+                    f"ORDER BY created_at {direction}, id {direction} LIMIT ?",
+                    (*page_values, size)
+                ).fetchall()
+            for row in rows:
+                yield json.loads(row[2])
+            if len(rows) < size:
+                return
+            cursor = rows[-1][:2]
+            if remaining is not None:
+                remaining -= len(rows)
+
+
+    def ids(self, kind: str) -> Iterator[str]:
+        """
+        Yields the ids of every stored object of a kind, in created_at order.
+        """
+        for row in self.iter_rows(kind):
+            yield row['id']
+
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+    def __create_schema(self) -> None:
+        with self._lock:
+            for table, columns in _TABLES.values():
+                extra = ''.join(f"{column} TEXT, " for column in columns)
+                self._connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} ("
+                    f"id TEXT PRIMARY KEY, created_at INTEGER, {extra}"
+                    f"data TEXT NOT NULL, synced_at REAL NOT NULL)"
+                )
+                self._connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {table}_created_at ON {table} (created_at, id)"
+                )
+                for column in ('thread_id', 'run_id'):
+                    if column in columns:
+                        self._connection.execute(
+                            f"CREATE INDEX IF NOT EXISTS {table}_{column} ON {table} ({column}, created_at, id)"
+                        )
+
+
+def write_through(*objects: Any) -> None:
+    """
+    Upserts objects into the shared store, if one is configured.
+    """
+    store = Store.get_instance()
+    if store is not None and objects:
+        store.put_many(objects)
+
+
+def read_through(kind: str, object_id: str) -> Optional[dict[str, Any]]:
+    """
+    Returns the fresh stored fields of an object from the shared store, if one is configured.
+    """
+    store = Store.get_instance()
+    if store is None or object_id is None:
+        return None
+    return store.get(kind, object_id)
+
+
+def evict(kind: str, object_id: str) -> None:
+    """
+    Removes an object from the shared store, if one is configured.
+    """
+    store = Store.get_instance()
+    if store is not None:
+        store.delete(kind, object_id)
+
+
+def _kind(obj: Any) -> str:
+    for cls in type(obj).__mro__:
+        if cls.__name__ in _TABLES:
+            return cls.__name__
+    raise ValueError(f"Cannot store objects of type {type(obj).__name__}")
+
+
+def _fields(kind: str, obj: Any) -> Iterable[str]:
+    if kind == 'Thread':
+        return _THREAD_FIELDS
+    return [field.name for field in dataclasses.fields(obj)]
+
+
+def _row(kind: str, obj: Any, synced_at: float) -> tuple:
+    _, columns = _TABLES[kind]
+    data = {name: getattr(obj, name, None) for name in _fields(kind, obj)}
+    return (
+        obj.id,
+        getattr(obj, 'created_at', None),
+        *(getattr(obj, column, None) for column in columns),
+        json.dumps(data, default=_encode),
+        synced_at,
+    )
+
+
+def _encode(value: Any) -> Any:
+    if hasattr(type(value), 'model_dump'):
+        return value.model_dump()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    return str(value)
@@ -1,14 +1,25 @@
 from openai import OpenAI
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, Optional, TYPE_CHECKING
 
 
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from GPTManager.Client import Client
+from .Compact import CompactMessage
+from .Mapper import mapper
 from .Run import Run
-from .Assistant import Assistant
+from .Polling import PollBackoff, RunWaitResult, wait_for_runs
+from .Pagination import MAX_PAGE_SIZE, page_params, paginate
+from .RawJSON import raw_fetch
+from .Store import Store, evict, read_through, write_through
+from .Errors import APIError, BulkCreateError
+
+if TYPE_CHECKING:
+    from .Assistant import Assistant
+    from .RunStream import RunStream
 
 
 import openai
@@ -16,6 +27,10 @@ import os
 from dotenv import load_dotenv
 load_dotenv()
 
+
+_THREAD_FIELDS = ('id', 'object', 'created_at', 'metadata')
+
+
 @dataclass
 class Message_Base:
     role: str
@@ -49,6 +64,12 @@ class Message(Message_Base):
     run_id: str
     metadata: dict[str, Any]   
 
+    def compact(self) -> CompactMessage:
+        """
+        Returns a slotted copy of the message without SDK objects, for keeping many messages in memory.
+        """
+        return CompactMessage.from_message(self)
+
 
 @dataclass
 class MessageFile:
@@ -77,47 +98,108 @@ class Thread:
         object (str): The type of object, always 'thread'.
         created_at (int): The timestamp of thread creation.
         metadata (dict): A dictionary containing the metadata of the thread.
+        messages (list[Message]): The local message store filled by sync_messages(), oldest first.
+        last_message_id (str): The newest message id seen by sync_messages().
     
     Methods:
+        ref(): Creates a handle from an id without calling the API; attributes are fetched on first access.
         create_thread(): Creates a new thread using the OpenAI client and sets the id, object, created_at and metadata attributes.
         retrieve_thread(): Retrieves the thread from id using the OpenAI client and sets the id, object, created_at and metadata attributes.
         modify_thread(): Modifies the thread  using the OpenAI client and sets the metadata attribute.
         delete_thread(): Deletes the thread using the OpenAI client and sets the thread to None.
         create_message(): Creates a message for the thread, either from a Message or by specifying individual parameters.
+        create_messages(): Creates several messages with a bounded number of requests in flight.
         retrieve_message(): Retrieves a message from the thread using the message ID.
         modify_message_metadata(): Modifies the metadata of a specific message identified by its ID.
         list_thread_messages(): Retrieves a list of messages from the current thread.
+        iter_thread_messages(): Lazily yields the messages of the current thread, page by page.
+        sync_messages(): Fetches only the messages newer than the last sync into the local message store.
+        iter_stored_messages(): Yields the messages kept in the configured Store without calling the API.
         retrieve_message_file(): Retrieves a specific file associated with a message in the thread.
         list_message_files(): Lists all files associated with a specific message in the thread.
+        iter_message_files(): Lazily yields the files associated with a specific message.
+        list_runs(): Lists all thread runs.
+        iter_runs(): Lazily yields the thread runs, page by page.
         upload_file(): Uploads a file to the thread.
         wait_runs(): Waits for all runs in the thread to complete.
+        stream_run(): Creates a run and streams its status changes, message deltas and run step deltas.
     """
     id: str
     object: str
     created_at: int
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any]
 
 
-    def __init__(self, thread_id: str|None = None) -> 'Thread':
+    def __init__(self, thread_id: str|None = None, messages: Optional[list[Message_Base]] = None) -> 'Thread':
         """
         Initializes a new thread object.
         Parameters:
             thread_id (str): The id of the thread to be retrieved.
+            messages (list[Message_Base]): Messages to create with a new thread, in one request.
         Returns:
             None
         """
+        self._init_messages()
         if thread_id is not None:
             self.id = thread_id
-            self.retrieve_thread()
+            if not self._load_stored():
+                self.retrieve_thread()
         else:
-            self.create_thread()
+            self.create_thread(messages=messages)
 
 
-    def create_thread(self):
+    @classmethod
+    def ref(cls, thread_id: str) -> 'Thread':
+        """
+        Creates a handle for an existing thread without calling the API.
+
+        The handle is enough to create messages and runs, which only need the id.
+        The other attributes are retrieved on first access, from the Store when
+        it holds a fresh copy and from the API otherwise.
+
+        Parameters:
+            thread_id (str): The id of the thread.
+
+        Returns:
+            Thread: The thread handle.
+        """
+        thread = cls.__new__(cls)
+        thread.id = thread_id
+        thread._init_messages()
+        thread._lazy = True
+        return thread
+
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes that are not set yet, i.e. on a ref() handle before hydration.
+        if name in ('object', 'created_at', 'metadata') and self.__dict__.get('_lazy'):
+            if not self._load_stored():
+                self.retrieve_thread()
+            self._lazy = False
+            return getattr(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+
+    def _is_loaded(self) -> bool:
+        # A ref() handle only holds its id until its other attributes are loaded.
+        return 'created_at' in self.__dict__
+
+
+    def _init_messages(self) -> None:
+        self.messages: list[Message] = []
+        self.last_message_id: Optional[str] = None
+        self._message_positions: dict[str, int] = {}
+
+
+    def create_thread(self, messages: Optional[list[Message_Base]] = None):
         """
         Creates a new thread using the OpenAI client and sets the id, object, created_at and metadata attributes.
+
+        Messages passed here are created by the same request, in order, and then
+        loaded into `messages` with one list request, as sync_messages() does.
+
         Parameters:
-            None
+            messages (list[Message_Base]): Messages to create with the thread.
         Returns:
             None
 
@@ -126,13 +208,19 @@ class Thread:
         """
         try:
             client = Client.get_instance()
-            thread_data = client.beta.threads.create()
-            self.id = thread_data.id
-            self.object = thread_data.object
-            self.created_at = thread_data.created_at
-            self.metadata = thread_data.metadata
+            if messages:
+                thread_data = Client.call(client.beta.threads.create, messages=_message_params(messages))
+            else:
+                thread_data = Client.call(client.beta.threads.create)
+            mapper(Thread, _THREAD_FIELDS).update(self, thread_data)
         except Exception as e:
-            raise ValueError("Failed to create thread") from e
+            raise APIError.from_exception("Failed to create thread", e) from e
+
+        Client.pin(self.id, client)
+
+        write_through(self)
+        if messages:
+            self.sync_messages()
 
 
     def retrieve_thread(self):
@@ -146,13 +234,13 @@ class Thread:
             ValueError: If the thread retrieval fails or returns invalid data.
         """
         try:
-            client = Client.get_instance()
-            thread_data = client.beta.threads.retrieve(self.id)
-            self.object = thread_data.object
-            self.created_at = thread_data.created_at
-            self.metadata = thread_data.metadata
+            client = Client.get_instance(self.id)
+            thread_data = Client.call_shared(client.beta.threads.retrieve, self.id)
+            mapper(Thread, _THREAD_FIELDS).update(self, thread_data)
         except Exception as e:
-            raise ValueError("Failed to retreive thread") from e
+            raise APIError.from_exception("Failed to retreive thread", e) from e
+
+        write_through(self)
 
 
     def modify_thread(self, metadata: dict):   
@@ -166,14 +254,20 @@ class Thread:
             ValueError: If the thread modification fails or returns invalid data.
         """
         try:
-            client = Client.get_instance()
-            thread_data = client.beta.threads.update(
+            client = Client.get_instance(self.id)
+            thread_data = Client.call(client.beta.threads.update,
                 thread_id = self.id, 
                 metadata = metadata
             )
             self.metadata = thread_data.metadata
         except Exception as e:
-            raise ValueError("Failed to modify thread metadata") from e
+            raise APIError.from_exception("Failed to modify thread metadata", e) from e
+
+        if self._is_loaded():
+            write_through(self)
+        else:
+            # Storing a ref() handle would read, and so retrieve, its other fields; drop the stale row instead.
+            evict('Thread', self.id)
 
 
     def delete_thread(self) -> dict: 
@@ -189,10 +283,14 @@ class Thread:
             ValueError: If the thread modification fails or returns invalid data.
         """
         try:
-            client = Client.get_instance()
-            return client.beta.threads.delete(self.id)
+            client = Client.get_instance(self.id)
+            response = Client.call(client.beta.threads.delete, self.id)
         except Exception as e:
-            raise ValueError("Failed to delete thread") from e
+            raise APIError.from_exception("Failed to delete thread", e) from e
+
+        evict('Thread', self.id)
+        Client.unpin(self.id)
+        return response
 
    
     def create_message(self, **kwargs) -> Message:
@@ -215,11 +313,57 @@ class Thread:
             ValueError: If message creation fails or returns invalid data.
         """
         if 'message' in kwargs:
-            return self.__create_message_from_message_object(message=kwargs['message'])
+            message = self.__create_message_from_message_object(message=kwargs['message'])
         elif 'role' in kwargs and 'content' in kwargs:
             file_ids = kwargs.get('file_ids', [])
-            return self.__create_message_from_params(role=kwargs['role'], content=kwargs['content'], file_ids=file_ids)
-        return None
+            message = self.__create_message_from_params(role=kwargs['role'], content=kwargs['content'], file_ids=file_ids)
+        else:
+            return None
+        write_through(message)
+        return message
+
+
+    def create_messages(self, messages: list[Message_Base], max_concurrency: int = 1) -> list[Message]:
+        """
+        Creates several messages, keeping up to max_concurrency create requests in flight.
+
+        The returned list follows the input order. By default each create starts
+        after the previous one was accepted, so the messages also land in the
+        thread in input order. A higher max_concurrency is faster, but concurrent
+        requests may complete out of order and created_at has one second
+        resolution, so it only suits messages whose order in the thread does not
+        matter. To seed a brand new thread, pass the messages to
+        Thread(messages=...) instead: they are created in order by the thread
+        creation request itself.
+
+        Parameters:
+            messages (list[Message_Base]): The messages to create.
+            max_concurrency (int): The maximum number of create requests in flight.
+                Values above 1 do not preserve the order of the messages in the thread.
+
+        Returns:
+            list[Message]: The created messages, in input order.
+
+        Raises:
+            BulkCreateError: If some messages could not be created. Its results hold the
+                created messages (None for failures) and its errors the exception per index.
+        """
+        if not messages:
+            return []
+
+        results: list[Optional[Message]] = [None] * len(messages)
+        errors: dict[int, Exception] = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(messages)))) as pool:
+            futures = [pool.submit(self.create_message, message=message) for message in messages]
+            for index, future in enumerate(futures):
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    errors[index] = e
+
+        if errors:
+            raise BulkCreateError(f"Failed to create {len(errors)} of {len(messages)} messages", results, errors)
+        return results
 
 
     def __create_message_from_message_object(self, message: Message_Base) -> Message:
@@ -236,28 +380,17 @@ class Thread:
             ValueError: If message creation fails or returns invalid data.
         """
         try:
-            client = Client.get_instance()
-            message_data = client.beta.threads.messages.create(
+            client = Client.get_instance(self.id)
+            message_data = Client.call(client.beta.threads.messages.create,
                 thread_id=self.id,
                 role=message.role,
                 content=message.content,
                 file_ids=message.file_ids
             )
             
-            return Message(
-                id=message_data.id,
-                role=message_data.role,
-                object=message_data.object,
-                created_at=message_data.created_at,
-                thread_id=message_data.thread_id,
-                content=message_data.content,
-                file_ids=message_data.file_ids,
-                assistant_id=message_data.assistant_id,
-                run_id=message_data.run_id,
-                metadata=message_data.metadata,
-            )
+            return mapper(Message).build(message_data)
         except Exception as e:
-            raise ValueError("Failed to create message from Message") from e
+            raise APIError.from_exception("Failed to create message from Message", e) from e
 
 
     def __create_message_from_params(self, role: str, content: str, file_ids = []) -> Message:
@@ -276,28 +409,17 @@ class Thread:
             ValueError: If message creation fails or returns invalid data.
         """
         try:
-            client = Client.get_instance()
-            message_data = client.beta.threads.messages.create(
+            client = Client.get_instance(self.id)
+            message_data = Client.call(client.beta.threads.messages.create,
                 self.id,
                 role=role,
                 content=content,
                 file_ids=file_ids 
             )
 
-            return Message(
-                id=message_data.id,
-                role=message_data.role,
-                object=message_data.object,
-                created_at=message_data.created_at,
-                thread_id=message_data.thread_id,
-                content=message_data.content,
-                file_ids=message_data.file_ids,
-                assistant_id=message_data.assistant_id,
-                run_id=message_data.run_id,
-                metadata=message_data.metadata,
-            )
+            return mapper(Message).build(message_data)
         except Exception as e:
-            raise ValueError("Failed to create message") from e
+            raise APIError.from_exception("Failed to create message", e) from e
     
 
     def retrieve_message(self, message_id: str) -> Message:
@@ -314,26 +436,18 @@ class Thread:
             ValueError: If message retrieval fails or returns invalid data.
         """
         try:
-            client = Client.get_instance()
-            message_data = client.beta.threads.messages.retrieve(
+            client = Client.get_instance(self.id)
+            message_data = Client.call(client.beta.threads.messages.retrieve,
                 message_id=message_id,
                 thread_id=self.id
             )
 
-            return Message(
-                id=message_data.id,
-                role=message_data.role,
-                object=message_data.object,
-                created_at=message_data.created_at,
-                thread_id=message_data.thread_id,
-                content=message_data.content,
-                file_ids=message_data.file_ids,
-                assistant_id=message_data.assistant_id,
-                run_id=message_data.run_id,
-                metadata=message_data.metadata,
-            )
+            message = mapper(Message).build(message_data)
         except Exception as e:
-            raise ValueError("Failed to retrieve message") from e
+            raise APIError.from_exception("Failed to retrieve message", e) from e
+
+        write_through(message)
+        return message
 
 
     def modify_message_metadata(self, message_id: str, metadata: dict) -> Message:
@@ -351,60 +465,181 @@ class Thread:
             ValueError: If message metadata modification fails or returns invalid data.
         """
         try:
-            client = Client.get_instance()
-            message_data = client.beta.threads.messages.update(
+            client = Client.get_instance(self.id)
+            message_data = Client.call(client.beta.threads.messages.update,
                 message_id=message_id,
                 thread_id=self.id,
                 metadata=metadata
             )
             
-            return Message(
-                id=message_data.id,
-                role=message_data.role,
-                object=message_data.object,
-                created_at=message_data.created_at,
-                thread_id=message_data.thread_id,
-                content=message_data.content,
-                file_ids=message_data.file_ids,
-                assistant_id=message_data.assistant_id,
-                run_id=message_data.run_id,
-                metadata=message_data.metadata,
-            )
+            message = mapper(Message).build(message_data)
         except Exception as e:
-            raise ValueError("Failed to modify message metadata") from e
+            raise APIError.from_exception("Failed to modify message metadata", e) from e
+
+        write_through(message)
+        return message
 
 
-    def list_thread_messages(self) -> list[Message]:
+    def list_thread_messages(
+        self,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        raw: bool = False
+    ) -> list[Message]:
         """
-        Retrieves a list of messages from the current thread.
+        Retrieves a list of messages from the current thread, following every page.
+
+        Parameters:
+            limit (int): The maximum number of messages to return. None returns all of them.
+            order (str): 'asc' or 'desc' by creation time. Defaults to the API order (desc).
+            page_size (int): The number of messages requested per page, at most 100.
+            after (str): Only return messages after this message id.
+            before (str): Only return messages before this message id.
+            raw (bool): Decode the response JSON directly into Messages, skipping the SDK models, see iter_thread_messages().
 
         Returns:
             list[Message]: A list of Message instances representing the messages in the thread.
 
+        Raises:
+            ValueError: If the retrieval of thread messages fails or returns invalid data.
+        """
+        messages = list(self.iter_thread_messages(limit=limit, order=order, page_size=page_size, after=after, before=before, raw=raw))
+        write_through(*messages)
+        return messages
+
+
+    def iter_thread_messages(
+        self,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        prefetch: bool = True,
+        raw: bool = False
+    ) -> Iterator[Message]:
+        """
+        Lazily yields the messages of the current thread, one page in memory at a time.
+
+        The next page is fetched in the background while the current one is consumed.
+        In raw mode each page body is decoded once, with orjson when installed, and
+        built into Messages without the SDK's pydantic models. Their content is then
+        a list of dicts instead of SDK objects, as for messages read from the Store.
+
+        Parameters:
+            limit (int): The maximum number of messages to yield. None yields all of them.
+            order (str): 'asc' or 'desc' by creation time. Defaults to the API order (desc).
+            page_size (int): The number of messages requested per page, at most 100.
+            after (str): Only yield messages after this message id.
+            before (str): Only yield messages before this message id.
+            prefetch (bool): Whether to request the next page ahead of time.
+            raw (bool): Decode the response JSON directly into Messages.
+
+        Returns:
+            Iterator[Message]: The messages of the thread.
+
         Raises:
             ValueError: If the retrieval of thread messages fails or returns invalid data.
         """
         try:
-            client = Client.get_instance()
-            messages_data = client.beta.threads.messages.list(self.id)
-            return  [
-                        Message(
-                            id=message.id,
-                            role=message.role,
-                            object=message.object,
-                            created_at=message.created_at,
-                            thread_id=message.thread_id,
-                            content=message.content,
-                            file_ids=message.file_ids,
-                            assistant_id=message.assistant_id,
-                            run_id=message.run_id,
-                            metadata=message.metadata,
-                        ) 
-                        for message 
-                        in messages_data.data
-                    ]
+            client = Client.get_instance(self.id)
+            params = page_params(limit, page_size, order, after, before)
+            if raw:
+                fetch = raw_fetch(client.beta.threads.messages.with_raw_response.list, Message, self.id)
+                yield from paginate(fetch, params, limit=limit, prefetch=prefetch)
+                return
+            messages_data = paginate(
+                lambda **params: Client.call(client.beta.threads.messages.list, self.id, **params),
+                params,
+                limit=limit,
+                prefetch=prefetch
+            )
+            build = mapper(Message).build
+            for message in messages_data:
+                yield build(message)
         except Exception as e:
-            raise ValueError("Failed to retrieve thread messages") from e
+            raise APIError.from_exception("Failed to retrieve thread messages", e) from e
+
+
+    def sync_messages(self, page_size: int = MAX_PAGE_SIZE, prefetch: bool = True) -> list[Message]:
+        """
+        Fetches the messages created since the last sync and merges them into `messages`.
+
+        Only messages after `last_message_id` are requested, oldest first, so each
+        call costs requests and Message objects proportional to the new messages
+        rather than to the thread length. The first call loads the whole thread.
+        Messages already in the store are replaced in place, keeping the order.
+
+        Parameters:
+            page_size (int): The number of messages requested per page, at most 100.
+            prefetch (bool): Whether to request the next page ahead of time.
+
+        Returns:
+            list[Message]: The messages added by this sync, oldest first.
+
+        Raises:
+            ValueError: If the retrieval of thread messages fails.
+        """
+        new_messages = list(self.iter_thread_messages(
+            order='asc',
+            page_size=page_size,
+            after=self.last_message_id,
+            prefetch=prefetch
+        ))
+        self._merge_messages(new_messages)
+        write_through(*new_messages)
+        return new_messages
+
+
+    def _merge_messages(self, new_messages: list[Message]) -> None:
+        for message in new_messages:
+            position = self._message_positions.get(message.id)
+            if position is None:
+                self._message_positions[message.id] = len(self.messages)
+                self.messages.append(message)
+            else:
+                self.messages[position] = message
+        if new_messages:
+            self.last_message_id = new_messages[-1].id
+
+
+    def iter_stored_messages(
+        self,
+        order: str = 'asc',
+        after: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[Message]:
+        """
+        Yields the messages of the thread kept in the configured Store, without calling the API.
+
+        Parameters:
+            order (str): 'asc' or 'desc' by creation time.
+            after (str): Only yield messages that come after this message id in the given order.
+            limit (int): The maximum number of messages to yield. None yields all of them.
+
+        Returns:
+            Iterator[Message]: The stored messages of the thread.
+
+        Raises:
+            ValueError: If no Store is configured.
+        """
+        store = Store.get_instance()
+        if store is None:
+            raise ValueError("No store configured, call Store.configure() first")
+        build = mapper(Message).build
+        for stored in store.iter_rows('Message', thread_id=self.id, order=order, after=after, limit=limit):
+            yield build(stored)
+
+
+    def _load_stored(self) -> bool:
+        stored = read_through('Thread', self.id)
+        if stored is None:
+            return False
+        mapper(Thread, _THREAD_FIELDS).update(self, stored)
+        return True
 
 
     def retrieve_message_file(self, message_id: str, file_id: str) -> MessageFile:
@@ -422,98 +657,150 @@ class Thread:
             ValueError: If file retrieval fails or returns invalid data.
         """
         try:
-            client = Client.get_instance()
-            file_data = client.beta.threads.messages.files.retrieve(
+            client = Client.get_instance(self.id)
+            file_data = Client.call(client.beta.threads.messages.files.retrieve,
                 thread_id=self.id,
                 message_id=message_id,
                 file_id=file_id
             )
 
-            return MessageFile(
-                id=file_data.id,
-                object=file_data.object,                
-                created_at=file_data.created_at,
-                message_id=file_data.message_id
-            )
+            return mapper(MessageFile).build(file_data)
         except Exception as e:
-            raise ValueError("Failed to retrieve message file") from e
+            raise APIError.from_exception("Failed to retrieve message file", e) from e
 
 
-    def list_message_files(self, message_id: str) -> list[MessageFile]:
+    def list_message_files(
+        self,
+        message_id: str,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE
+    ) -> list[MessageFile]:
         """
-        Lists all files associated with a specific message in the thread.
+        Lists all files associated with a specific message in the thread, following every page.
 
         Parameters:
             message_id (str): The unique identifier of the message whose files are to be listed.
+            limit (int): The maximum number of files to return. None returns all of them.
+            order (str): 'asc' or 'desc' by creation time.
+            page_size (int): The number of files requested per page, at most 100.
 
         Returns:
             list[MessageFile]: A list of MessageFile instances representing the files associated with the message.
 
+        Raises:
+            ValueError: If file listing fails or returns invalid data.
+        """
+        return list(self.iter_message_files(message_id, limit=limit, order=order, page_size=page_size))
+
+
+    def iter_message_files(
+        self,
+        message_id: str,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = True
+    ) -> Iterator[MessageFile]:
+        """
+        Lazily yields the files associated with a specific message in the thread.
+
+        Parameters:
+            message_id (str): The unique identifier of the message whose files are to be listed.
+            limit (int): The maximum number of files to yield. None yields all of them.
+            order (str): 'asc' or 'desc' by creation time.
+            page_size (int): The number of files requested per page, at most 100.
+            prefetch (bool): Whether to request the next page ahead of time.
+
+        Returns:
+            Iterator[MessageFile]: The files associated with the message.
+
         Raises:
             ValueError: If file listing fails or returns invalid data.
         """
         try:
-            client = Client.get_instance()
-            files_data = client.beta.threads.messages.files.list(
-                thread_id=self.id,
-                message_id=message_id
+            client = Client.get_instance(self.id)
+            files_data = paginate(
+                lambda **params: Client.call(client.beta.threads.messages.files.list,
+                    thread_id=self.id,
+                    message_id=message_id,
+                    **params
+                ),
+                page_params(limit, page_size, order),
+                limit=limit,
+                prefetch=prefetch
             )
-            return [
-                        MessageFile(
-                            id=message_file.id,
-                            object=message_file.object,
-                            created_at=message_file.created_at,
-                            message_id=message_file.message_id
-                        ) 
-                        for message_file 
-                        in files_data.data
-                    ]
+            build = mapper(MessageFile).build
+            for message_file in files_data:
+                yield build(message_file)
         except Exception as e:
-            raise ValueError("Failed to list message files") from e
-        
-    
-    def list_runs(self) -> list[Run]:
+            raise APIError.from_exception("Failed to list message files", e) from e
+
+
+    def list_runs(
+        self,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        on_page: Optional[Callable[[Any], None]] = None
+    ) -> list[Run]:
         """
-        Lists all thread runs.
+        Lists all thread runs, following every page.
+        Parameters:
+            limit (int): The maximum number of runs to return. None returns all of them.
+            order (str): 'asc' or 'desc' by creation time.
+            page_size (int): The number of runs requested per page, at most 100.
+            on_page (Callable): Called with every page fetched, e.g. to count requests.
         Returns:
             list[RunObject]: A list of RunObject instances representing each run.
         Raises:
             ValueError: If the thread_id or assistant_id is not set, or if the API call fails.
         """
-        client = Client.get_instance()
+        runs = list(self.iter_runs(limit=limit, order=order, page_size=page_size, on_page=on_page))
+        write_through(*runs)
+        return runs
+
+
+    def iter_runs(
+        self,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = True,
+        on_page: Optional[Callable[[Any], None]] = None
+    ) -> Iterator[Run]:
+        """
+        Lazily yields the thread runs, one page in memory at a time.
+        Parameters:
+            limit (int): The maximum number of runs to yield. None yields all of them.
+            order (str): 'asc' or 'desc' by creation time.
+            page_size (int): The number of runs requested per page, at most 100.
+            prefetch (bool): Whether to request the next page ahead of time.
+            on_page (Callable): Called with every page fetched, e.g. to count requests.
+        Returns:
+            Iterator[Run]: The runs of the thread.
+        Raises:
+            ValueError: If the API call fails.
+        """
+        client = Client.get_instance(self.id)
 
         try:
-            runs_data = client.beta.threads.runs.list(
-                thread_id=self.id
+            runs_data = paginate(
+                lambda **params: Client.call(client.beta.threads.runs.list, thread_id=self.id, **params),
+                page_params(limit, page_size, order),
+                limit=limit,
+                prefetch=prefetch,
+                on_page=on_page
             )
-            return [
-                Run(
-                    id = run_data.id,
-                    object = run_data.object,
-                    created_at = run_data.created_at,
-                    status = run_data.status,
-                    started_at = run_data.started_at,
-                    expires_at = run_data.expires_at,
-                    cancelled_at = run_data.cancelled_at,
-                    failed_at = run_data.failed_at,
-                    completed_at = run_data.completed_at,
-                    last_error = run_data.last_error,
-                    model = run_data.model,
-                    instructions = run_data.instructions,
-                    tools = run_data.tools,
-                    file_ids = run_data.file_ids,
-                    metadata = run_data.metadata,
-                    thread_id=run_data.thread_id,
-                    assistant_id=run_data.assistant_id
-                ) 
-                for run_data 
-                in runs_data.data
-            ]
+            build = mapper(Run).build
+            for run_data in runs_data:
+                yield build(run_data)
 
         except Exception as e:
-            raise ValueError("Failed to list runs") from e
+            raise APIError.from_exception("Failed to list runs", e) from e
+
 
-    def create_run(self, assistant: Assistant) -> Run:
+    def create_run(self, assistant: 'Assistant') -> Run:
         """
         Creates a new run for the thread.
         Returns:
@@ -521,32 +808,65 @@ class Thread:
         Raises:
             ValueError: If the thread_id or assistant_id is not set, or if the API call fails.
         """
-        client = Client.get_instance()
+        client = Client.get_instance(self.id)
 
         try:
-            run_data = client.beta.threads.runs.create(
+            run_data = Client.call(client.beta.threads.runs.create,
                 thread_id=self.id,
                 assistant_id=assistant.id
             )
-            return Run(
-                id = run_data.id,
-                object = run_data.object,
-                created_at = run_data.created_at,
-                status = run_data.status,
-                started_at = run_data.started_at,
-                expires_at = run_data.expires_at,
-                cancelled_at = run_data.cancelled_at,
-                failed_at = run_data.failed_at,
-                completed_at = run_data.completed_at,
-                last_error = run_data.last_error,
-                model = run_data.model,
-                instructions = run_data.instructions,
-                tools = run_data.tools,
-                file_ids = run_data.file_ids,
-                metadata = run_data.metadata,
-                thread_id=run_data.thread_id,
-                assistant_id=run_data.assistant_id
-            )
+            run = mapper(Run).build(run_data)
         except Exception as e:
-            raise ValueError("Failed to create run") from e
+            raise APIError.from_exception("Failed to create run", e) from e
+
+        write_through(run)
+        return run
+
+
+    def wait_runs(self, timeout: Optional[float] = None, backoff: Optional[PollBackoff] = None) -> RunWaitResult:
+        """
+        Waits for all runs in the thread to complete.
+
+        Lists the thread runs once, following every page, then polls each pending
+        run with Run.retrieve_run.
+        Polling starts fast and slows down while a run stays queued or in_progress.
+        The wait returns once every run is in a terminal state or requires action.
+
+        Parameters:
+            timeout (float): Seconds after which to stop waiting. None waits indefinitely.
+            backoff (PollBackoff): The polling cadence. Defaults to PollBackoff().
+
+        Returns:
+            RunWaitResult: The runs with their latest state, the polls spent per run
+            and the total number of requests, including one per listed page.
+
+        Raises:
+            ValueError: If listing or retrieving the runs fails.
+        """
+        pages = []
+        runs = self.list_runs(on_page=pages.append)
+        return wait_for_runs(runs, timeout=timeout, backoff=backoff, requests=len(pages))
+
+
+    def stream_run(self, assistant: 'Assistant') -> 'RunStream':
+        """
+        Creates a new run for the thread and streams its events.
+
+        Message text is yielded as it is generated, and the final Run and Message
+        objects are built from the stream without extra retrieve calls.
+
+        Returns:
+            RunStream: The stream of typed run events. Its run attribute holds the Run.
+        Raises:
+            ValueError: If the API call fails.
+        """
+        run = Run(thread_id=self.id)
+        run.assistant_id = assistant.id
+        return run.stream_run()
+
 
+def _message_params(messages: list[Message_Base]) -> list[dict[str, Any]]:
+    return [
+        {"role": message.role, "content": message.content, "file_ids": message.file_ids}
+        for message in messages
+    ]
@@ -1,7 +1,28 @@
 from .Assistant import Assistant, AssistantFile, Tool
 from .Thread import Thread, Message, MessageFile, Message_Base
-from .Run import Run, Tool, RunStep
+from .Run import Run, Tool, RunStep, ToolRegistry
 from .File import File
-from .Organization import Organization
+from .ChunkedUpload import ChunkedUpload, UploadCheckpoint
+from .Organization import Organization, FileUploadReport, Inventory
 from .Image import Image
-from .Client import Client
\ No newline at end of file
+from .Client import Client, ClientConfig
+from .ClientPool import ClientPool
+from .RateLimiter import RateLimiter
+from .Errors import APIError, BulkCreateError, CircuitOpenError
+from .Retry import CircuitBreaker, RetryPolicy
+from .Store import Store
+from .FileIndex import FileIndex
+from .Cache import TTLCache
+from .SingleFlight import SingleFlight
+from .Compact import CompactMessage, CompactRun, CompactRunStep
+from .Mapper import Mapper, mapper
+from .RawJSON import RawPage
+from .Polling import PollBackoff, RunWaitResult
+from .RunPoller import RunPoller
+from .RunStream import RunStream, AsyncRunStream, RunStatusEvent, MessageDeltaEvent, MessageCompletedEvent, RunStepDeltaEvent, RequiresActionEvent
+from .AsyncThread import AsyncThread
+from .AsyncRun import AsyncRun
+from .AsyncAssistant import AsyncAssistant
+from .AsyncFile import AsyncFile
+from .AsyncImage import AsyncImage
+from .GarbageCollector import GarbageCollector, CollectionReport
@@ -0,0 +1,117 @@
+"""
+Memory per object of Message, Run and RunStep against their compact variants.
+
+    python benchmarks/compact_memory.py [count]
+
+Objects are built the way the API returns them: SDK content, tool and step
+detail objects, and a fresh id string per object, spread over a few threads
+and assistants.
+"""
+import gc
+import sys
+import os
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openai.types.beta import CodeInterpreterTool, FunctionTool
+from openai.types.beta.threads import Text, TextContentBlock
+from openai.types.beta.threads.runs import MessageCreationStepDetails
+from openai.types.beta.threads.runs.message_creation_step_details import MessageCreation
+from openai.types.shared import FunctionDefinition
+
+from GPTManager.Thread import Message
+from GPTManager.Run import Run, RunStep
+
+
+THREADS = 20
+
+
+def _parsed(value: str) -> str:
+    # Parsed JSON gives every object its own copy of repeated strings.
+    return "".join(list(value))
+
+
+def _ids(prefix: str, index: int) -> str:
+    return _parsed(f"{prefix}_{index % THREADS:024d}")
+
+
+def make_message(index: int) -> Message:
+    return Message(
+        id=f"msg_{index:024d}",
+        object="thread.message",
+        created_at=1700000000 + index,
+        thread_id=_ids("thread", index),
+        role="assistant" if index % 2 else "user",
+        content=[TextContentBlock(type="text", text=Text(value=f"Message number {index} about the weather.", annotations=[]))],
+        file_ids=[],
+        assistant_id=_ids("asst", index),
+        run_id=_ids("run", index),
+        metadata={},
+    )
+
+
+def make_run(index: int) -> Run:
+    return Run(
+        id=f"run_{index:024d}",
+        object="thread.run",
+        created_at=1700000000 + index,
+        assistant_id=_ids("asst", index),
+        thread_id=_ids("thread", index),
+        status=_parsed("completed"),
+        started_at=1700000001 + index,
+        completed_at=1700000009 + index,
+        model=_parsed("gpt-4-turbo"),
+        instructions="You are a helpful assistant.",
+        tools=[
+            CodeInterpreterTool(type="code_interpreter"),
+            FunctionTool(type="function", function=FunctionDefinition(name="get_weather", parameters={"type": "object"})),
+        ],
+        file_ids=[],
+        metadata={},
+    )
+
+
+def make_run_step(index: int) -> RunStep:
+    return RunStep(
+        id=f"step_{index:024d}",
+        object="thread.run.step",
+        created_at=1700000000 + index,
+        run_id=_ids("run", index),
+        assistant_id=_ids("asst", index),
+        thread_id=_ids("thread", index),
+        type="message_creation",
+        status="completed",
+        cancelled_at=None,
+        completed_at=1700000005 + index,
+        expired_at=None,
+        failed_at=None,
+        last_error=None,
+        step_details=MessageCreationStepDetails(
+            type="message_creation", message_creation=MessageCreation(message_id=f"msg_{index:024d}")
+        ),
+    )
+
+
+def bytes_per_object(build, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build(count)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def main(count: int = 10_000) -> None:
+    print(f"{'object':<10} {'full B/obj':>12} {'compact B/obj':>14} {'saved':>7}")
+    for name, make in (("Message", make_message), ("Run", make_run), ("RunStep", make_run_step)):
+        full = bytes_per_object(lambda n: [make(i) for i in range(n)], count)
+        compact = bytes_per_object(lambda n: [make(i).compact() for i in range(n)], count)
+        print(f"{name:<10} {full:>12.0f} {compact:>14.0f} {1 - compact / full:>7.0%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
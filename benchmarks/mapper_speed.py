@@ -0,0 +1,85 @@
+"""
+Time to convert one 100-item page of messages and runs, with the former
+per-attribute constructors against the shared field-table Mapper.
+
+    python benchmarks/mapper_speed.py [repeat]
+"""
+import sys
+import os
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openai.types.beta.threads import Text, TextContentBlock
+
+from GPTManager.Mapper import mapper
+from GPTManager.Run import Run
+from GPTManager.Thread import Message
+
+
+PAGE_SIZE = 100
+
+
+class _SDKMessage:
+    # Plain attribute access, like the SDK models once validated.
+    def __init__(self, index: int):
+        self.id = f"msg_{index}"
+        self.object = "thread.message"
+        self.created_at = 1700000000 + index
+        self.thread_id = "thread_1"
+        self.role = "user"
+        self.content = [TextContentBlock(type="text", text=Text(value=f"hello {index}", annotations=[]))]
+        self.file_ids = []
+        self.assistant_id = None
+        self.run_id = None
+        self.metadata = {}
+
+
+def _run_payload(index: int) -> dict:
+    return {
+        "id": f"run_{index}", "object": "thread.run", "created_at": 1700000000 + index,
+        "assistant_id": "asst_1", "thread_id": "thread_1", "status": "completed",
+        "started_at": 1, "expires_at": None, "cancelled_at": None, "failed_at": None,
+        "completed_at": 2, "last_error": None, "model": "gpt-4", "instructions": "",
+        "tools": [], "file_ids": [], "metadata": {}, "required_action": None,
+    }
+
+
+def messages_per_attribute(page):
+    return [
+        Message(
+            id=message.id,
+            role=message.role,
+            object=message.object,
+            created_at=message.created_at,
+            thread_id=message.thread_id,
+            content=message.content,
+            file_ids=message.file_ids,
+            assistant_id=message.assistant_id,
+            run_id=message.run_id,
+            metadata=message.metadata,
+        )
+        for message in page
+    ]
+
+
+def runs_per_attribute(page):
+    return [Run(**payload) for payload in page]
+
+
+def main(repeat: int = 2000) -> None:
+    messages = [_SDKMessage(index) for index in range(PAGE_SIZE)]
+    runs = [_run_payload(index) for index in range(PAGE_SIZE)]
+    cases = (
+        ("messages, SDK objects", lambda: messages_per_attribute(messages), lambda: mapper(Message).build_many(messages)),
+        ("runs, JSON dicts", lambda: runs_per_attribute(runs), lambda: mapper(Run).build_many(runs)),
+    )
+    print(f"{'page of ' + str(PAGE_SIZE):<24} {'before us':>10} {'mapper us':>10} {'speedup':>8}")
+    for name, before, after in cases:
+        before_time = min(timeit.repeat(before, number=repeat, repeat=3)) / repeat * 1e6
+        after_time = min(timeit.repeat(after, number=repeat, repeat=3)) / repeat * 1e6
+        print(f"{name:<24} {before_time:>10.1f} {after_time:>10.1f} {before_time / after_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,57 @@
+"""
+Time to turn one 100-message response body into Messages, through the SDK's
+pydantic models against the raw JSON mode of iter_thread_messages.
+
+    python benchmarks/raw_pages.py [repeat]
+"""
+import sys
+import os
+import json
+import timeit
+from types import SimpleNamespace
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openai.pagination import SyncCursorPage
+from openai.types.beta.threads import Message as SDKMessage
+
+from GPTManager.Mapper import mapper
+from GPTManager.RawJSON import RawPage, orjson
+from GPTManager.Thread import Message
+
+
+PAGE_SIZE = 100
+
+
+def _message_payload(index: int) -> dict:
+    return {
+        "id": f"msg_{index}", "object": "thread.message", "created_at": 1700000000 + index,
+        "thread_id": "thread_1", "role": "assistant", "status": "completed",
+        "content": [{"type": "text", "text": {"value": f"hello {index} " * 20, "annotations": []}}],
+        "attachments": [], "file_ids": [], "assistant_id": "asst_1", "run_id": "run_1", "metadata": {},
+    }
+
+
+def through_sdk(body: bytes) -> list:
+    page = SyncCursorPage[SDKMessage].model_validate(json.loads(body))
+    return mapper(Message).build_many(page.data)
+
+
+def through_raw(body: bytes) -> list:
+    return RawPage.decode(SimpleNamespace(content=body), Message).data
+
+
+def main(repeat: int = 500) -> None:
+    body = json.dumps({
+        "object": "list", "data": [_message_payload(index) for index in range(PAGE_SIZE)],
+        "first_id": "msg_0", "last_id": f"msg_{PAGE_SIZE - 1}", "has_more": False,
+    }).encode()
+    sdk_time = min(timeit.repeat(lambda: through_sdk(body), number=repeat, repeat=3)) / repeat * 1e6
+    raw_time = min(timeit.repeat(lambda: through_raw(body), number=repeat, repeat=3)) / repeat * 1e6
+    print(f"decoder: {'orjson' if orjson is not None else 'json'}, body {len(body)} bytes")
+    print(f"{'page of ' + str(PAGE_SIZE):<24} {'SDK us':>10} {'raw us':>10} {'speedup':>8}")
+    print(f"{'messages':<24} {sdk_time:>10.1f} {raw_time:>10.1f} {sdk_time / raw_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,68 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GPTManager.Client import Client
+from GPTManager.Cache import TTLCache
+from GPTManager.Assistant import Assistant
+
+
+class TestAssistant(unittest.TestCase):
+    mock_assistant_data = MagicMock(
+        id = "test_assistant_id",
+        object = "assistant",
+        created_at = 123456789,
+        description = None,
+        model = "gpt-4-1106-preview",
+        instructions = "You are an assistant",
+        tools = [],
+        file_ids = [],
+        metadata = {}
+    )
+    mock_assistant_data.name = "test_assistant"
+
+    def setUp(self):
+        Client._instance = None
+        Assistant.cache = TTLCache(ttl=300, maxsize=16)
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_ref_fetches_on_first_attribute_access(self, mock_openai):
+        retrieve = mock_openai.return_value.beta.assistants.retrieve
+        retrieve.return_value = self.mock_assistant_data
+
+        assistant = Assistant.ref("test_assistant_id")
+        self.assertEqual(assistant.id, "test_assistant_id")
+        retrieve.assert_not_called()
+
+        self.assertEqual(assistant.model, "gpt-4-1106-preview")
+        self.assertEqual(assistant.file_ids, [])
+        retrieve.assert_called_once_with("test_assistant_id")
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_ref_hydrates_from_cache(self, mock_openai):
+        retrieve = mock_openai.return_value.beta.assistants.retrieve
+        retrieve.return_value = self.mock_assistant_data
+        Assistant(assistant_id="test_assistant_id")
+
+        self.assertEqual(Assistant.ref("test_assistant_id").name, "test_assistant")
+        retrieve.assert_called_once()
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_ref_repr_and_eq_do_not_fetch(self, mock_openai):
+        retrieve = mock_openai.return_value.beta.assistants.retrieve
+
+        assistant = Assistant.ref("test_assistant_id")
+
+        self.assertEqual(repr(assistant), "Assistant.ref('test_assistant_id')")
+        self.assertEqual(assistant, Assistant.ref("test_assistant_id"))
+        self.assertNotEqual(assistant, Assistant.ref("other_assistant_id"))
+        retrieve.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
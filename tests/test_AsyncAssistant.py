@@ -0,0 +1,131 @@
+import unittest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GPTManager.Client import Client
+from GPTManager.Cache import TTLCache
+from GPTManager.Assistant import Assistant, AssistantFile, Tool
+from GPTManager.AsyncAssistant import AsyncAssistant
+from GPTManager.Errors import APIError
+
+
+class TestAsyncAssistant(unittest.IsolatedAsyncioTestCase):
+    mock_assistant_data = MagicMock(
+        id="test_assistant_id",
+        object="assistant",
+        created_at=123456789,
+        description=None,
+        model="gpt-4-1106-preview",
+        instructions="You are a helpful assistant.",
+        tools=[],
+        file_ids=[],
+        metadata={},
+    )
+    mock_assistant_data.name = "test_assistant"
+
+    mock_assistant_file_data = MagicMock(
+        id="test_file_id",
+        object="assistant.file",
+        created_at=123456789,
+        assistant_id="test_assistant_id",
+    )
+
+
+    def setUp(self):
+        patcher = patch('GPTManager.Client.AsyncOpenAI')
+        self.mock_openai = patcher.start()
+        self.addCleanup(patcher.stop)
+        Client._async_instance = None
+        Assistant.cache = TTLCache(ttl=300, maxsize=16)
+
+        assistants = self.mock_openai.return_value.beta.assistants
+        assistants.create = AsyncMock(return_value=self.mock_assistant_data)
+        assistants.retrieve = AsyncMock(return_value=self.mock_assistant_data)
+        assistants.update = AsyncMock(return_value=self.mock_assistant_data)
+        assistants.delete = AsyncMock(return_value={"id": "test_assistant_id", "object": "assistant.deleted", "deleted": True})
+        assistants.files.create = AsyncMock(return_value=self.mock_assistant_file_data)
+        assistants.files.retrieve = AsyncMock(return_value=self.mock_assistant_file_data)
+        assistants.files.delete = AsyncMock(return_value={"id": "test_file_id", "object": "assistant.file.deleted", "deleted": True})
+        assistants.files.list = AsyncMock(return_value=MagicMock(data=[self.mock_assistant_file_data]))
+
+
+    def tearDown(self):
+        Client._async_instance = None
+
+
+    def test_construction_does_not_call_api(self):
+        AsyncAssistant(assistant_id="test_assistant_id")
+        AsyncAssistant.ref("test_assistant_id")
+        self.mock_openai.return_value.beta.assistants.retrieve.assert_not_called()
+
+
+    async def test_create_assistant(self):
+        assistant = await AsyncAssistant(instructions="You are a helpful assistant.", name="test_assistant", model="gpt-4-1106-preview")
+
+        self.assertEqual(assistant.id, "test_assistant_id")
+        self.assertEqual(assistant.name, "test_assistant")
+        self.mock_openai.return_value.beta.assistants.create.assert_awaited_once_with(
+            instructions="You are a helpful assistant.", name="test_assistant", tools=[], model="gpt-4-1106-preview"
+        )
+
+
+    async def test_retrieve_assistant_is_cached(self):
+        assistant = await AsyncAssistant(assistant_id="test_assistant_id")
+        again = await AsyncAssistant(assistant_id="test_assistant_id")
+
+        self.assertEqual(assistant.model, "gpt-4-1106-preview")
+        self.assertEqual(again.name, "test_assistant")
+        self.mock_openai.return_value.beta.assistants.retrieve.assert_awaited_once_with("test_assistant_id")
+
+
+    async def test_modify_assistant(self):
+        assistant = await AsyncAssistant(assistant_id="test_assistant_id")
+
+        await assistant.modify_assistant(
+            instructions="Be brief.", name="test_assistant", tools=[Tool(type="code_interpreter")], model="gpt-4-1106-preview"
+        )
+
+        self.mock_openai.return_value.beta.assistants.update.assert_awaited_once_with(
+            assistant_id="test_assistant_id", instructions="Be brief.", name="test_assistant",
+            tools=[{"type": "code_interpreter"}], model="gpt-4-1106-preview", file_ids=[]
+        )
+
+
+    async def test_delete_assistant_drops_cache_entry(self):
+        assistant = await AsyncAssistant(assistant_id="test_assistant_id")
+
+        response = await assistant.delete_assistant()
+
+        self.assertTrue(response["deleted"])
+        self.assertIsNone(Assistant.cache.get("test_assistant_id"))
+
+
+    async def test_assistant_files(self):
+        assistant = await AsyncAssistant(assistant_id="test_assistant_id")
+
+        created = await assistant.create_assistant_file("test_file_id")
+        retrieved = await assistant.retrieve_assistant_file("test_file_id")
+        listed = await assistant.list_assistant_files()
+        deleted = await assistant.delete_assistant_file("test_file_id")
+
+        self.assertIsInstance(created, AssistantFile)
+        self.assertEqual(retrieved.assistant_id, "test_assistant_id")
+        self.assertEqual([assistant_file.id for assistant_file in listed], ["test_file_id"])
+        self.assertTrue(deleted["deleted"])
+
+
+    async def test_errors_are_wrapped(self):
+        assistants = self.mock_openai.return_value.beta.assistants
+        assistants.retrieve.side_effect = ValueError("No assistant found")
+        assistants.delete.side_effect = ValueError("No assistant found")
+
+        with self.assertRaisesRegex(APIError, "Failed to retrieve assistant"):
+            await AsyncAssistant(assistant_id="missing_assistant_id")
+        with self.assertRaisesRegex(APIError, "Failed to delete assistant"):
+            await AsyncAssistant.ref("missing_assistant_id").delete_assistant()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock, AsyncMock
+
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GPTManager.Client import Client
+from GPTManager.AsyncFile import AsyncFile
+from GPTManager.Errors import APIError
+from GPTManager.FileIndex import FileIndex
+
+
+def _file_object(file_id="file_1"):
+    return SimpleNamespace(id=file_id, object="file", bytes=11, created_at=1, filename="paper.pdf", purpose="assistants")
+
+
+def _empty_file():
+    return AsyncFile(id=None, object=None, bytes=None, created_at=None, filename=None, purpose=None)
+
+
+class TestAsyncFile(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        patcher = patch('GPTManager.Client.AsyncOpenAI')
+        self.mock_openai = patcher.start()
+        self.addCleanup(patcher.stop)
+        Client._async_instance = None
+
+        files = self.mock_openai.return_value.files
+        files.create = AsyncMock(return_value=_file_object())
+        files.retrieve = AsyncMock(return_value=_file_object())
+        files.delete = AsyncMock(return_value={"id": "file_1", "object": "file", "deleted": True})
+        files.content = AsyncMock(return_value=MagicMock(text="hello world"))
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "paper.pdf")
+        with open(self.path, "wb") as target:
+            target.write(b"hello world")
+
+
+    def tearDown(self):
+        Client._async_instance = None
+        FileIndex.disable()
+        self.directory.cleanup()
+
+
+    async def test_upload_file(self):
+        file = _empty_file()
+
+        await file.upload_file(self.path, "assistants")
+
+        self.assertEqual((file.id, file.bytes, file.filename, file.purpose), ("file_1", 11, "paper.pdf", "assistants"))
+        self.mock_openai.return_value.files.create.assert_awaited_once()
+
+
+    async def test_upload_file_reuses_indexed_file(self):
+        FileIndex.configure(":memory:")
+        first, second = _empty_file(), _empty_file()
+
+        await first.upload_file(self.path, "assistants")
+        await second.upload_file(self.path, "assistants")
+
+        self.assertEqual(second.id, "file_1")
+        self.mock_openai.return_value.files.create.assert_awaited_once()
+        self.mock_openai.return_value.files.retrieve.assert_awaited_once_with("file_1")
+
+
+    async def test_retrieve_file(self):
+        file = _empty_file()
+        file.id = "file_1"
+
+        await file.retrieve_file()
+
+        self.assertEqual((file.object, file.bytes, file.created_at), ("file", 11, 1))
+        self.assertEqual(await file.retrieve_file_content(), "hello world")
+
+
+    async def test_delete_file(self):
+        file = _empty_file()
+        file.id = "file_1"
+
+        deleted = await file.delete_file()
+
+        self.assertTrue(deleted["deleted"])
+        self.mock_openai.return_value.files.delete.assert_awaited_once_with("file_1")
+
+
+    async def test_errors_are_wrapped(self):
+        files = self.mock_openai.return_value.files
+        files.create.side_effect = ValueError("Invalid purpose")
+        files.retrieve.side_effect = ValueError("No such file")
+        files.delete.side_effect = ValueError("No such file")
+        file = _empty_file()
+
+        with self.assertRaisesRegex(APIError, "Unable to create file"):
+            await file.upload_file(self.path, "assistants")
+        file.id = "missing_file_id"
+        with self.assertRaisesRegex(APIError, "Unable to retrieve file"):
+            await file.retrieve_file()
+        with self.assertRaisesRegex(APIError, "Unable to delete file"):
+            await file.delete_file()
+
+
+if __name__ == '__main__':
+    unittest.main()
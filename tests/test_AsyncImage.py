@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GPTManager.Client import Client
+from GPTManager.AsyncImage import AsyncImage
+from GPTManager.Errors import APIError
+
+
+def _images_response(url="https://example.com/image.png"):
+    return MagicMock(data=[MagicMock(b64_json=None, url=url, revised_prompt="a red circle")])
+
+
+class TestAsyncImage(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        patcher = patch('GPTManager.Client.AsyncOpenAI')
+        self.mock_openai = patcher.start()
+        self.addCleanup(patcher.stop)
+        Client._async_instance = None
+
+        images = self.mock_openai.return_value.images
+        images.generate = AsyncMock(return_value=_images_response())
+        images.edit = AsyncMock(return_value=_images_response("https://example.com/edit.png"))
+        images.create_variation = AsyncMock(return_value=_images_response("https://example.com/variation.png"))
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.image_path = os.path.join(self.directory.name, "image.png")
+        self.mask_path = os.path.join(self.directory.name, "mask.png")
+        for path in (self.image_path, self.mask_path):
+            with open(path, "wb") as target:
+                target.write(b"\x89PNG")
+        self.image = AsyncImage(b64_json=None, url=None, revised_prompt=None)
+
+
+    def tearDown(self):
+        Client._async_instance = None
+        self.directory.cleanup()
+
+
+    async def test_create_image(self):
+        await self.image.create_image("a circle", model="dall-e-3", size="1024x1024")
+
+        self.assertEqual(self.image.url, "https://example.com/image.png")
+        self.assertEqual(self.image.b64_json, "")
+        self.assertEqual(self.image.revised_prompt, "a red circle")
+        self.mock_openai.return_value.images.generate.assert_awaited_once_with(prompt="a circle", model="dall-e-3", size="1024x1024")
+
+
+    async def test_create_image_edit(self):
+        await self.image.create_image_edit(self.image_path, self.mask_path, "make it blue", n=1, size="256x256")
+
+        self.assertEqual(self.image.url, "https://example.com/edit.png")
+        kwargs = self.mock_openai.return_value.images.edit.call_args.kwargs
+        self.assertEqual((kwargs["prompt"], kwargs["n"], kwargs["size"]), ("make it blue", 1, "256x256"))
+
+
+    async def test_create_image_variation(self):
+        await self.image.create_image_variation(self.image_path, n=1, size="256x256")
+
+        self.assertEqual(self.image.url, "https://example.com/variation.png")
+        self.mock_openai.return_value.images.create_variation.assert_awaited_once()
+
+
+    async def test_errors_are_wrapped(self):
+        self.mock_openai.return_value.images.generate.side_effect = ValueError("Invalid prompt")
+
+        with self.assertRaisesRegex(APIError, "Unable to create image"):
+            await self.image.create_image("a circle")
+        with self.assertRaisesRegex(APIError, "Unable to create image"):
+            await self.image.create_image_variation(os.path.join(self.directory.name, "missing.png"), n=1, size="256x256")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+import unittest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GPTManager.Client import Client
+from GPTManager.AsyncThread import AsyncThread
+from GPTManager.AsyncRun import AsyncRun
+from GPTManager.Thread import Message
+from GPTManager.Run import Run
+
+
+class TestAsyncThread(unittest.IsolatedAsyncioTestCase):
+    mock_thread_data = MagicMock(
+        id = "test_thread_id",
+        object = "thread",
+        created_at = 123456789,
+        metadata = {"key": "value"}
+    )
+
+    mock_message_data = MagicMock(
+        id= "test_message_id",
+        role= 'user',
+        file_ids= [],
+        object= "thread.message",
+        created_at= 123456789,
+        thread_id= "test_thread_id",
+        content= [
+            {
+                "type": "text",
+                "text": {
+                    "value": "Hello",
+                    "annotations": []
+                }
+            }
+        ],
+        assistant_id= None,
+        run_id= None,
+        metadata= {}
+    )
+
+    mock_run_data = MagicMock(
+        id= 'test_run_id',
+        object= 'thread.run',
+        created_at= 123456789,
+        assistant_id= 'test_assistant_id',
+        thread_id= 'test_thread_id',
+        status= 'queued',
+        started_at= None,
+        expires_at= None,
+        cancelled_at= None,
+        failed_at= None,
+        completed_at= None,
+        last_error= None,
+        model= 'gpt-4-1106-preview',
+        instructions= None,
+        tools= [],
+        file_ids= [],
+        metadata= {},
+    )
+
+
+    def setUp(self):
+        patcher = patch('GPTManager.Client.AsyncOpenAI')
+        self.mock_openai = patcher.start()
+        self.addCleanup(patcher.stop)
+        Client._async_instance = None
+
+        threads = self.mock_openai.return_value.beta.threads
+        threads.create = AsyncMock(return_value=self.mock_thread_data)
+        threads.retrieve = AsyncMock(return_value=self.mock_thread_data)
+        threads.messages.create = AsyncMock(return_value=self.mock_message_data)
+        threads.messages.list = AsyncMock(return_value=MagicMock(data=[self.mock_message_data] * 2, has_more=False))
+        threads.runs.create = AsyncMock(return_value=self.mock_run_data)
+        threads.runs.retrieve = AsyncMock(return_value=self.mock_run_data)
+        threads.runs.list = AsyncMock(return_value=MagicMock(data=[self.mock_run_data] * 2, has_more=False))
+
+
+    def tearDown(self):
+        Client._async_instance = None
+
+
+    def test_construction_does_not_call_api(self):
+        AsyncThread("test_thread_id")
+        AsyncRun(thread_id="test_thread_id", id="test_run_id")
+        self.mock_openai.return_value.beta.threads.retrieve.assert_not_called()
+        self.mock_openai.return_value.beta.threads.runs.retrieve.assert_not_called()
+
+
+    async def test_create_thread(self):
+        thread = await AsyncThread()
+        self.assertEqual(thread.id, "test_thread_id")
+        self.assertEqual(thread.object, "thread")
+        self.assertEqual(thread.metadata, {"key": "value"})
+
+
+    async def test_retrieve_thread(self):
+        thread = await AsyncThread("test_thread_id")
+        self.mock_openai.return_value.beta.threads.retrieve.assert_awaited_once_with("test_thread_id")
+        self.assertEqual(thread.created_at, 123456789)
+
+
+    async def test_create_message(self):
+        thread = await AsyncThread("test_thread_id")
+        result = await thread.create_message(role='user', content='Hello')
+        self.assertIsInstance(result, Message)
+        self.assertEqual(result.id, "test_message_id")
+
+
+    async def test_list_thread_messages(self):
+        thread = await AsyncThread("test_thread_id")
+        result = await thread.list_thread_messages()
+        self.assertEqual(len(result), 2)
+        self.assertTrue(all(isinstance(message, Message) for message in result))
+
+
+    async def test_sync_messages(self):
+        thread = await AsyncThread("test_thread_id")
+        messages_list = self.mock_openai.return_value.beta.threads.messages.list
+        messages_list.return_value = MagicMock(data=[MagicMock(id='msg_1'), MagicMock(id='msg_2')], has_more=False)
+        await thread.sync_messages()
+        messages_list.return_value = MagicMock(data=[MagicMock(id='msg_3')], has_more=False)
+        new_messages = await thread.sync_messages()
+
+        self.assertEqual([message.id for message in new_messages], ['msg_3'])
+        self.assertEqual([message.id for message in thread.messages], ['msg_1', 'msg_2', 'msg_3'])
+        self.assertEqual(messages_list.call_args.kwargs['after'], 'msg_2')
+
+
+    async def test_list_runs_returns_runs_without_retrieving(self):
+        thread = await AsyncThread("test_thread_id")
+        runs = await thread.list_runs()
+        self.assertEqual(len(runs), 2)
+        self.assertIsInstance(runs[0], Run)
+        self.assertEqual(runs[0].status, 'queued')
+        self.mock_openai.return_value.beta.threads.runs.retrieve.assert_not_called()
+
+
+    async def test_await_run(self):
+        run = await AsyncRun(thread_id="test_thread_id", id="test_run_id")
+        self.assertEqual(run.status, 'queued')
+        self.assertEqual(run.model, 'gpt-4-1106-preview')
+
+
+    async def test_stream_run_closes_stream_when_left_early(self):
+        delta = MagicMock(index=0, type='text', text=MagicMock(value='Hel'))
+        event = MagicMock(event='thread.message.delta', data=MagicMock(id='test_message_id', delta=MagicMock(content=[delta])))
+
+        class Events:
+            close = AsyncMock()
+
+            async def __aiter__(self):
+                for _ in range(3):
+                    yield event
+
+        events = Events()
+        self.mock_openai.return_value.beta.threads.runs.create = AsyncMock(return_value=events)
+
+        thread = AsyncThread("test_thread_id")
+        stream = await thread.stream_run(MagicMock(id='test_assistant_id'))
+        iterator = stream.__aiter__()
+        received = await iterator.__anext__()
+        await iterator.aclose()
+
+        self.assertEqual(received.text, 'Hel')
+        events.close.assert_awaited_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GPTManager.Client import Client
+from GPTManager.Cache import TTLCache
+from GPTManager.Assistant import Assistant
+
+
+class TestTTLCache(unittest.TestCase):
+
+    @patch('GPTManager.Cache.time.monotonic')
+    def test_entries_expire_after_ttl(self, mock_monotonic):
+        cache = TTLCache(ttl=10, maxsize=2)
+        mock_monotonic.return_value = 100.0
+        cache.put('a', 1)
+
+        mock_monotonic.return_value = 109.0
+        self.assertEqual(cache.get('a'), 1)
+        mock_monotonic.return_value = 110.0
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = TTLCache(ttl=None, maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.evictions, 1)
+
+
+class TestAssistantCache(unittest.TestCase):
+    mock_assistant_data = MagicMock(
+        id = "test_assistant_id",
+        object = "assistant",
+        created_at = 123456789,
+        description = None,
+        model = "gpt-4-1106-preview",
+        instructions = "You are an assistant",
+        tools = [],
+        file_ids = [],
+        metadata = {}
+    )
+    mock_assistant_data.name = "test_assistant"
+
+    def setUp(self):
+        Client._instance = None
+        Assistant.cache = TTLCache(ttl=300, maxsize=16)
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_retrieval_is_cached_until_modified(self, mock_openai):
+        assistants = mock_openai.return_value.beta.assistants
+        assistants.retrieve.return_value = self.mock_assistant_data
+        assistants.update.return_value = self.mock_assistant_data
+
+        first = Assistant(assistant_id="test_assistant_id")
+        second = Assistant(assistant_id="test_assistant_id")
+
+        assistants.retrieve.assert_called_once()
+        self.assertEqual(second.name, "test_assistant")
+        self.assertEqual((Assistant.cache.hits, Assistant.cache.misses), (1, 1))
+        second.tools.append("mutated")
+        self.assertEqual(Assistant(assistant_id="test_assistant_id").tools, [])
+
+        first.modify_assistant(instructions="New", name="test_assistant", tools=[], model="gpt-4-1106-preview")
+        Assistant(assistant_id="test_assistant_id")
+        assistants.retrieve.assert_called_once()
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_delete_and_file_changes_invalidate(self, mock_openai):
+        assistants = mock_openai.return_value.beta.assistants
+        assistants.retrieve.return_value = self.mock_assistant_data
+        assistants.files.create.return_value = {
+            "id": "file_1", "object": "assistant.file", "created_at": 1, "assistant_id": "test_assistant_id"
+        }
+
+        assistant = Assistant(assistant_id="test_assistant_id")
+        assistant.create_assistant_file("file_1")
+        self.assertNotIn("test_assistant_id", Assistant.cache)
+
+        assistant = Assistant(assistant_id="test_assistant_id")
+        assistant.delete_assistant()
+        self.assertNotIn("test_assistant_id", Assistant.cache)
+        self.assertEqual(assistants.retrieve.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
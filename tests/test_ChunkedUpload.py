@@ -0,0 +1,121 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock, AsyncMock
+
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GPTManager.Client import Client
+from GPTManager.ChunkedUpload import ChunkedUpload, UploadCheckpoint
+from GPTManager.File import File
+
+
+CONTENT = bytes(range(256)) * 40
+
+
+def _file_object(size):
+    return SimpleNamespace(id="file_1", object="file", bytes=size, created_at=1, filename="data.jsonl", purpose="assistants")
+
+
+class TestChunkedUpload(unittest.TestCase):
+
+    def setUp(self):
+        Client._instance = None
+        Client._async_instance = None
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "data.jsonl")
+        with open(self.path, "wb") as target:
+            target.write(CONTENT)
+        self.checkpoint_path = os.path.join(self.directory.name, "data.upload.json")
+
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+    def _client(self):
+        client = MagicMock()
+        client.uploads.create.return_value = SimpleNamespace(id="upload_1", expires_at=None)
+        client.uploads.parts.create.side_effect = lambda upload_id, data: SimpleNamespace(id=f"part_{data[:1].hex()}_{len(data)}")
+        client.uploads.complete.return_value = SimpleNamespace(id="upload_1", status="completed", file=_file_object(len(CONTENT)))
+        return client
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_uploads_parts_and_completes_in_order(self, mock_openai):
+        client = mock_openai.return_value = self._client()
+        progress = []
+
+        file = File(id=None, object=None, bytes=None, created_at=None, filename=None, purpose=None)
+        file.upload_file_in_parts(self.path, "assistants", part_size=4096, max_concurrency=2, on_progress=lambda sent, total: progress.append((sent, total)))
+
+        self.assertEqual(file.id, "file_1")
+        self.assertEqual(client.uploads.create.call_args.kwargs["bytes"], len(CONTENT))
+        sent = sorted(call.kwargs["data"] for call in client.uploads.parts.create.call_args_list)
+        self.assertEqual([len(data) for data in sent], [2048, 4096, 4096])
+        complete = client.uploads.complete.call_args
+        self.assertEqual(complete.kwargs["part_ids"], ["part_00_4096", "part_00_4096", "part_00_2048"])
+        self.assertEqual(complete.kwargs["md5"], hashlib.md5(CONTENT).hexdigest())
+        self.assertEqual(progress[-1], (len(CONTENT), len(CONTENT)))
+
+
+    def test_resumes_only_missing_parts_from_checkpoint(self):
+        client = self._client()
+        sends = []
+
+        def failing_part(upload_id, data):
+            sends.append(len(data))
+            if len(sends) == 2:
+                raise ValueError("connection reset")
+            return SimpleNamespace(id=f"part_{len(sends)}")
+
+        client.uploads.parts.create.side_effect = failing_part
+        with self.assertRaises(ValueError):
+            ChunkedUpload(self.path, "assistants", part_size=4096, max_concurrency=1, checkpoint_path=self.checkpoint_path).run(client)
+        self.assertEqual(UploadCheckpoint.load(self.checkpoint_path).parts, {0: "part_1"})
+
+        client.uploads.parts.create.side_effect = lambda upload_id, data: SimpleNamespace(id=f"part_{len(data)}")
+        ChunkedUpload(self.path, "assistants", part_size=4096, max_concurrency=1, checkpoint_path=self.checkpoint_path).run(client)
+
+        client.uploads.create.assert_called_once()
+        self.assertEqual(client.uploads.complete.call_args.kwargs["part_ids"], ["part_1", "part_4096", "part_2048"])
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+
+    def test_changed_file_starts_a_new_upload(self):
+        client = self._client()
+        client.uploads.parts.create.side_effect = ValueError("connection reset")
+        with self.assertRaises(ValueError):
+            ChunkedUpload(self.path, "assistants", part_size=4096, checkpoint_path=self.checkpoint_path).run(client)
+
+        with open(self.path, "ab") as target:
+            target.write(b"more")
+        client.uploads.parts.create.side_effect = lambda upload_id, data: SimpleNamespace(id="part")
+        ChunkedUpload(self.path, "assistants", part_size=4096, checkpoint_path=self.checkpoint_path).run(client)
+
+        self.assertEqual(client.uploads.create.call_count, 2)
+        self.assertEqual(client.uploads.create.call_args.kwargs["bytes"], len(CONTENT) + 4)
+
+
+    def test_run_async(self):
+        client = MagicMock()
+        client.uploads.create = AsyncMock(return_value=SimpleNamespace(id="upload_1", expires_at=None))
+        client.uploads.parts.create = AsyncMock(side_effect=lambda upload_id, data: SimpleNamespace(id=f"part_{len(data)}"))
+        client.uploads.complete = AsyncMock(return_value=SimpleNamespace(id="upload_1", status="completed", file=_file_object(len(CONTENT))))
+
+        file_object = asyncio.run(ChunkedUpload(self.path, "assistants", part_size=8192).run_async(client))
+
+        self.assertEqual(file_object.id, "file_1")
+        self.assertEqual(client.uploads.complete.call_args.kwargs["part_ids"], ["part_8192", "part_2048"])
+
+
+    def test_rejects_parts_over_the_api_limit(self):
+        with self.assertRaises(ValueError):
+            ChunkedUpload(self.path, "assistants", part_size=65 * 1024 * 1024)
+
+
+if __name__ == '__main__':
+    unittest.main()
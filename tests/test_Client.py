@@ -0,0 +1,69 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GPTManager.Client import Client
+from GPTManager.Organization import Organization
+
+
+class TestClient(unittest.TestCase):
+
+    def setUp(self):
+        Client._instance = None
+        Client._async_instance = None
+
+
+    def tearDown(self):
+        Client.configure()
+
+
+    @patch('GPTManager.Client.DefaultHttpxClient')
+    @patch('GPTManager.Client.OpenAI')
+    def test_configure_applies_pool_settings(self, mock_openai, mock_http_client):
+        Client.configure(max_connections=50, max_keepalive_connections=10, connect_timeout=2, options={"max_retries": 0})
+
+        client = Client.get_instance()
+
+        self.assertIs(client, Client.get_instance())
+        mock_openai.assert_called_once()
+        http_kwargs = mock_http_client.call_args.kwargs
+        self.assertEqual(http_kwargs['limits'].max_connections, 50)
+        self.assertEqual(http_kwargs['limits'].max_keepalive_connections, 10)
+        self.assertEqual(http_kwargs['timeout'].connect, 2)
+        self.assertFalse(http_kwargs['http2'])
+        openai_kwargs = mock_openai.call_args.kwargs
+        self.assertIs(openai_kwargs['http_client'], mock_http_client.return_value)
+        self.assertEqual(openai_kwargs['max_retries'], 0)
+
+
+    @patch('GPTManager.Client.DefaultHttpxClient')
+    @patch('GPTManager.Client.OpenAI')
+    def test_custom_http_client_is_used_as_is(self, mock_openai, mock_http_client):
+        custom = MagicMock()
+        Client.configure(http_client=custom)
+
+        Client.get_instance()
+
+        mock_http_client.assert_not_called()
+        self.assertIs(mock_openai.call_args.kwargs['http_client'], custom)
+
+
+    def test_unknown_setting_is_rejected(self):
+        with self.assertRaises(ValueError):
+            Client.configure(max_conections=10)
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_organization_reuses_shared_client(self, mock_openai):
+        mock_openai.return_value.files.list.return_value = MagicMock(data=[], has_more=False)
+
+        Organization.list_files()
+        Organization.list_files()
+
+        mock_openai.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
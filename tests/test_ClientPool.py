@@ -0,0 +1,144 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+import httpx
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GPTManager.Client import Client, ClientConfig
+from GPTManager.Errors import APIError, CircuitOpenError
+from GPTManager.Retry import CircuitBreaker, RetryPolicy
+from GPTManager.ClientPool import ClientPool, PoolMember, _CountingTransport
+from GPTManager.Thread import Thread
+
+
+class TestClientPool(unittest.TestCase):
+
+    def setUp(self):
+        Client._instance = None
+        Client._async_instance = None
+        self.pool = ClientPool({
+            "a": ClientConfig(options={"api_key": "key-a"}),
+            "b": ClientConfig(options={"api_key": "key-b"}),
+        })
+
+
+    def tearDown(self):
+        Client.use_pool(None)
+
+
+    def test_routes_to_least_outstanding_member(self):
+        self.pool.members["a"].outstanding = 3
+        self.pool.members["b"].outstanding = 1
+
+        self.assertEqual(self.pool.route().name, "b")
+
+
+    def test_ties_go_to_member_with_most_budget(self):
+        self.pool.members["a"].remaining_requests = 10
+        self.pool.members["b"].remaining_requests = 500
+
+        self.assertEqual(self.pool.route().name, "b")
+
+
+    def test_explicit_member_and_pins_win_over_load(self):
+        self.pool.members["a"].outstanding = 5
+        self.pool.pin("thread_b", "b")
+
+        with self.pool.member("a"):
+            self.assertEqual(self.pool.route().name, "a")
+            self.assertEqual(self.pool.route("thread_b").name, "b")
+        self.assertEqual(self.pool.route().name, "b")
+
+        with self.assertRaises(ValueError):
+            with self.pool.member("c"):
+                pass
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_created_thread_is_pinned_to_its_member(self, mock_openai):
+        clients = {"key-a": MagicMock(), "key-b": MagicMock()}
+        mock_openai.side_effect = lambda **kwargs: clients[kwargs["api_key"]]
+        clients["key-b"].beta.threads.create.return_value = MagicMock(
+            id="thread_1", object="thread", created_at=1, metadata={}
+        )
+        Client.use_pool(self.pool)
+
+        with self.pool.member("b"):
+            thread = Thread()
+        self.pool.members["b"].outstanding = 10
+        thread.retrieve_thread()
+
+        clients["key-a"].beta.threads.retrieve.assert_not_called()
+        clients["key-b"].beta.threads.retrieve.assert_called_once_with("thread_1")
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_deleted_thread_is_unpinned(self, mock_openai):
+        client = mock_openai.return_value
+        client.beta.threads.create.return_value = MagicMock(id="thread_1", object="thread", created_at=1, metadata={})
+        Client.use_pool(self.pool)
+
+        with self.pool.member("b"):
+            thread = Thread()
+        self.assertEqual(self.pool.route("thread_1").name, "b")
+
+        thread.delete_thread()
+
+        self.assertEqual(self.pool._pins, {})
+
+
+    def test_failing_member_does_not_open_the_circuit_of_others(self):
+        def handler(status):
+            return lambda request: httpx.Response(status, json={"object": "list", "data": []}, request=request)
+
+        def config(status):
+            return ClientConfig(
+                http_client=httpx.Client(transport=httpx.MockTransport(handler(status))),
+                options={"api_key": "key", "max_retries": 0},
+                retry_policy=RetryPolicy(max_attempts=1),
+                circuit_breaker=CircuitBreaker(failure_threshold=2),
+            )
+
+        pool = ClientPool({"failing": config(500), "healthy": config(200)})
+        Client.use_pool(pool)
+        failing = pool.members["failing"].get_client()
+        healthy = pool.members["healthy"].get_client()
+
+        for _ in range(2):
+            with self.assertRaises(APIError):
+                Client.call(failing.models.list)
+        with self.assertRaises(CircuitOpenError):
+            Client.call(failing.models.list)
+        with self.assertRaises(CircuitOpenError):
+            Client.call(failing.models.with_raw_response.list)
+
+        self.assertEqual(pool.members["failing"].circuit_breaker.state, "open")
+        self.assertEqual(pool.members["healthy"].circuit_breaker.state, "closed")
+        Client.call(healthy.models.list)
+
+
+    def test_transport_counts_requests_and_reads_budget(self):
+        member = PoolMember("a", ClientConfig())
+        seen = []
+
+        def handler(request):
+            seen.append(member.outstanding)
+            return httpx.Response(200, headers={
+                "x-ratelimit-remaining-requests": "42",
+                "x-ratelimit-remaining-tokens": "9000",
+            })
+
+        with httpx.Client(transport=_CountingTransport(httpx.MockTransport(handler), member)) as client:
+            client.get("https://api.openai.com/v1/models")
+
+        self.assertEqual(seen, [1])
+        self.assertEqual(member.outstanding, 0)
+        self.assertEqual(member.requests, 1)
+        self.assertEqual(member.remaining_requests, 42)
+        self.assertEqual(member.remaining_tokens, 9000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from openai.types.beta import CodeInterpreterTool, FunctionTool
+from openai.types.beta.threads import Text, TextContentBlock
+from openai.types.beta.threads.runs import MessageCreationStepDetails
+from openai.types.beta.threads.runs.message_creation_step_details import MessageCreation
+from openai.types.shared import FunctionDefinition
+
+from GPTManager.Compact import CompactMessage, CompactRun
+from GPTManager.Thread import Message
+from GPTManager.Run import Run, RunStep
+
+
+def _message(index, thread_id):
+    return Message(
+        id=f"msg_{index}",
+        object="thread.message",
+        created_at=index,
+        thread_id=thread_id,
+        role="user",
+        content=[TextContentBlock(type="text", text=Text(value=f"hello {index}", annotations=[]))],
+        file_ids=[],
+        assistant_id=None,
+        run_id=None,
+        metadata={},
+    )
+
+
+class TestCompact(unittest.TestCase):
+
+    def test_message_is_slotted_and_interns_ids(self):
+        first = _message(1, "".join(["thread_", "abc"])).compact()
+        second = _message(2, "".join(["thread_", "abc"])).compact()
+
+        self.assertFalse(hasattr(first, '__dict__'))
+        self.assertIs(first.thread_id, second.thread_id)
+        self.assertEqual(first.content, (('text', 'hello 1'),))
+        self.assertEqual(first.text, 'hello 1')
+        self.assertEqual(first.file_ids, ())
+        self.assertIsNone(first.metadata)
+
+
+    def test_message_from_stored_dicts(self):
+        message = _message(1, "thread_abc")
+        message.content = [
+            {"type": "text", "text": {"value": "hi", "annotations": []}},
+            {"type": "image_file", "image_file": {"file_id": "file-1"}},
+        ]
+
+        self.assertEqual(CompactMessage.from_message(message).content, (('text', 'hi'), ('image_file', 'file-1')))
+
+
+    def test_run_keeps_tool_names_and_error_text(self):
+        run = Run(
+            id="run_1", object="thread.run", created_at=1, assistant_id="asst_1", thread_id="thread_1",
+            status="failed", model="gpt-4", last_error={"code": "server_error", "message": "boom"},
+            tools=[
+                CodeInterpreterTool(type="code_interpreter"),
+                FunctionTool(type="function", function=FunctionDefinition(name="get_weather")),
+            ],
+            file_ids=["file-1"], metadata={"k": "v"},
+        )
+
+        compact = run.compact()
+
+        self.assertIsInstance(compact, CompactRun)
+        self.assertFalse(hasattr(compact, '__dict__'))
+        self.assertEqual(compact.tools, ('code_interpreter', 'function:get_weather'))
+        self.assertEqual(compact.last_error, 'boom')
+        self.assertEqual(compact.file_ids, ('file-1',))
+        self.assertEqual(compact.metadata, {"k": "v"})
+
+
+    def test_run_step_keeps_created_message_id(self):
+        step = RunStep(
+            id="step_1", object="thread.run.step", created_at=1, run_id="run_1", assistant_id="asst_1",
+            thread_id="thread_1", type="message_creation", status="completed", cancelled_at=None,
+            completed_at=2, expired_at=None, failed_at=None, last_error=None,
+            step_details=MessageCreationStepDetails(type="message_creation", message_creation=MessageCreation(message_id="msg_1")),
+        )
+
+        self.assertEqual(step.compact().details, ("msg_1",))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+import httpx
+
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GPTManager.Client import Client
+from GPTManager.File import File
+
+
+CONTENT = b"".join(f"line {index}\n".encode() for index in range(1000))
+
+
+def _streaming(content, fail_after=None, ignore_range=False):
+    """
+    Fakes files.with_streaming_response.content, serving Range requests from content.
+    """
+    requests = []
+
+    @contextmanager
+    def open_stream(file_id, extra_headers=None):
+        requests.append(extra_headers)
+        start = 0
+        if extra_headers and not ignore_range:
+            start = int(extra_headers["Range"][len("bytes="):-1])
+        body = content[start:]
+
+        def iter_bytes(chunk_size):
+            for offset in range(0, len(body), chunk_size):
+                if fail_after is not None and len(requests) == 1 and offset >= fail_after:
+                    raise httpx.ReadError("connection reset")
+                yield body[offset:offset + chunk_size]
+
+        yield SimpleNamespace(
+            status_code=206 if start else 200,
+            headers={"content-length": str(len(body))},
+            iter_bytes=iter_bytes,
+        )
+
+    return open_stream, requests
+
+
+class TestDownload(unittest.TestCase):
+
+    def setUp(self):
+        Client._instance = None
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "output.jsonl")
+        self.file = File(id="file_1", object="file", bytes=len(CONTENT), created_at=1, filename="output.jsonl", purpose="assistants")
+
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_streams_to_path_in_chunks(self, mock_openai):
+        mock_openai.return_value.files.with_streaming_response.content, requests = _streaming(CONTENT)
+        progress = []
+
+        size = self.file.download_content(self.path, chunk_size=1000, on_progress=lambda written, total: progress.append((written, total)))
+
+        self.assertEqual(size, len(CONTENT))
+        with open(self.path, "rb") as result:
+            self.assertEqual(result.read(), CONTENT)
+        self.assertEqual(progress[0], (1000, len(CONTENT)))
+        self.assertEqual(requests, [None])
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_resumes_partial_file_with_range(self, mock_openai):
+        with open(self.path, "wb") as partial:
+            partial.write(CONTENT[:3000])
+        mock_openai.return_value.files.with_streaming_response.content, requests = _streaming(CONTENT)
+
+        self.file.download_content(self.path)
+
+        self.assertEqual(requests, [{"Range": "bytes=3000-"}])
+        with open(self.path, "rb") as result:
+            self.assertEqual(result.read(), CONTENT)
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_restarts_when_range_is_ignored(self, mock_openai):
+        with open(self.path, "wb") as partial:
+            partial.write(b"stale")
+        mock_openai.return_value.files.with_streaming_response.content, requests = _streaming(CONTENT, ignore_range=True)
+
+        self.file.download_content(self.path)
+
+        with open(self.path, "rb") as result:
+            self.assertEqual(result.read(), CONTENT)
+
+
+    @patch('GPTManager.Download.time.sleep')
+    @patch('GPTManager.Client.OpenAI')
+    def test_broken_stream_continues_from_written_bytes(self, mock_openai, mock_sleep):
+        mock_openai.return_value.files.with_streaming_response.content, requests = _streaming(CONTENT, fail_after=4096)
+        target = io.BytesIO()
+
+        self.file.download_content(target, chunk_size=1024)
+
+        self.assertEqual(target.getvalue(), CONTENT)
+        self.assertEqual(requests, [None, {"Range": "bytes=4096-"}])
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_complete_file_is_not_requested_again(self, mock_openai):
+        with open(self.path, "wb") as complete:
+            complete.write(CONTENT)
+        mock_openai.return_value.files.with_streaming_response.content, requests = _streaming(CONTENT)
+
+        mapped = self.file.map_content(self.path)
+
+        self.assertEqual(requests, [])
+        self.assertEqual(mapped[:7], b"line 0\n")
+        self.assertEqual(len(mapped), len(CONTENT))
+        mapped.close()
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_retrieve_file_content_returns_content(self, mock_openai):
+        mock_openai.return_value.files.content.return_value = MagicMock(text="hello")
+
+        self.assertEqual(self.file.retrieve_file_content(), "hello")
+        mock_openai.return_value.files.content.assert_called_once_with("file_1")
+
+
+if __name__ == '__main__':
+    unittest.main()
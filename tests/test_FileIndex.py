@@ -0,0 +1,93 @@
+import hashlib
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GPTManager.Client import Client
+from GPTManager.File import File
+from GPTManager.FileIndex import FileIndex, file_digest
+
+
+class _NotFound(Exception):
+    status_code = 404
+
+
+def _file_object(file_id, purpose="assistants"):
+    return SimpleNamespace(id=file_id, object="file", bytes=11, created_at=1, filename="paper.pdf", purpose=purpose)
+
+
+def _empty_file():
+    return File(id=None, object=None, bytes=None, created_at=None, filename=None, purpose=None)
+
+
+class TestFileIndex(unittest.TestCase):
+
+    def setUp(self):
+        Client._instance = None
+        self.index = FileIndex.configure(':memory:')
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "paper.pdf")
+        with open(self.path, "wb") as target:
+            target.write(b"hello world")
+
+
+    def tearDown(self):
+        FileIndex.disable()
+        self.directory.cleanup()
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_same_content_is_uploaded_once_per_purpose(self, mock_openai):
+        client = mock_openai.return_value
+        client.files.create.side_effect = [_file_object("file_1"), _file_object("file_2", "fine-tune")]
+        client.files.retrieve.return_value = _file_object("file_1")
+
+        first, second, other_purpose = _empty_file(), _empty_file(), _empty_file()
+        first.upload_file(self.path, "assistants")
+        second.upload_file(self.path, "assistants")
+        other_purpose.upload_file(self.path, "fine-tune")
+
+        self.assertEqual(second.id, "file_1")
+        self.assertEqual(other_purpose.id, "file_2")
+        self.assertEqual(client.files.create.call_count, 2)
+        client.files.retrieve.assert_called_once_with("file_1")
+        self.assertEqual(self.index.hits, 1)
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_deleted_upstream_file_is_uploaded_again(self, mock_openai):
+        client = mock_openai.return_value
+        self.index.put(file_digest(self.path), "assistants", "file_gone")
+        client.files.retrieve.side_effect = _NotFound("No such file")
+        client.files.create.return_value = _file_object("file_new")
+
+        file = _empty_file()
+        file.upload_file(self.path, "assistants")
+
+        self.assertEqual(file.id, "file_new")
+        self.assertEqual(self.index.get(file_digest(self.path), "assistants"), "file_new")
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_delete_file_evicts_its_entries(self, mock_openai):
+        client = mock_openai.return_value
+        client.files.create.return_value = _file_object("file_1")
+        client.files.delete.return_value = {"id": "file_1", "object": "file", "deleted": True}
+
+        file = _empty_file()
+        file.upload_file(self.path, "assistants")
+        file.delete_file()
+
+        self.assertIsNone(self.index.get(file_digest(self.path), "assistants"))
+
+
+    def test_file_digest_is_sha256_of_content(self):
+        self.assertEqual(file_digest(self.path), hashlib.sha256(b"hello world").hexdigest())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import tempfile
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GPTManager.Client import Client
+from GPTManager.GarbageCollector import GarbageCollector
+from GPTManager.Store import Store
+from GPTManager.Thread import Thread
+
+
+OLD = int(time.time()) - 30 * 86400
+NEW = int(time.time())
+
+
+class _NotFound(Exception):
+    status_code = 404
+
+
+def _file(file_id, created_at):
+    return SimpleNamespace(id=file_id, object="file", bytes=1, created_at=created_at, filename="f", purpose="assistants")
+
+
+def _assistant(assistant_id, created_at, metadata=None, file_ids=()):
+    return SimpleNamespace(
+        id=assistant_id, object="assistant", created_at=created_at, name=None, description=None, model="gpt-4",
+        instructions=None, tools=[], file_ids=list(file_ids), metadata=metadata or {},
+    )
+
+
+def _page(items):
+    return MagicMock(data=items, has_more=False)
+
+
+class TestGarbageCollector(unittest.TestCase):
+
+    def setUp(self):
+        Client._instance = None
+        self.store = Store.configure(":memory:", max_age=None)
+        self.directory = tempfile.TemporaryDirectory()
+        self.checkpoint_path = os.path.join(self.directory.name, "gc.log")
+
+
+    def tearDown(self):
+        Store.disable()
+        self.directory.cleanup()
+
+
+    def _client(self, mock_openai):
+        client = mock_openai.return_value
+        client.files.list.return_value = _page([_file("file_used", OLD), _file("file_orphan", OLD), _file("file_new", NEW)])
+        client.beta.assistants.list.return_value = _page([
+            _assistant("asst_test", OLD, {"env": "test"}, ["file_used"]),
+            _assistant("asst_prod", OLD, {"env": "prod"}),
+            _assistant("asst_fresh", NEW, {"env": "test"}),
+        ])
+        for thread_id, created_at, metadata in (("thread_old", OLD, {"env": "test"}), ("thread_new", NEW, {"env": "test"})):
+            thread = Thread.ref(thread_id)
+            thread.object, thread.created_at, thread.metadata = "thread", created_at, metadata
+            self.store.put(thread)
+        return client
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_dry_run_selects_by_age_tags_and_references(self, mock_openai):
+        client = self._client(mock_openai)
+
+        report = GarbageCollector(older_than=86400, metadata={"env": "test"}, unreferenced=True).run(dry_run=True)
+
+        self.assertEqual(report.selected, {"file": ["file_orphan"], "assistant": ["asst_test"], "thread": ["thread_old"]})
+        client.files.delete.assert_not_called()
+        client.beta.assistants.delete.assert_not_called()
+        client.beta.threads.delete.assert_not_called()
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_deletes_and_resumes_from_checkpoint(self, mock_openai):
+        client = self._client(mock_openai)
+        client.beta.threads.delete.side_effect = ValueError("server error")
+        collector = GarbageCollector(older_than=86400, metadata={"env": "test"}, unreferenced=True, checkpoint_path=self.checkpoint_path)
+
+        first = collector.run()
+
+        self.assertEqual(first.deleted["file"], ["file_orphan"])
+        self.assertEqual(first.deleted["assistant"], ["asst_test"])
+        self.assertEqual(list(first.errors), ["thread_old"])
+
+        client.beta.threads.delete.side_effect = None
+        second = collector.run()
+
+        self.assertEqual(second.resumed, 2)
+        self.assertEqual(second.deleted["thread"], ["thread_old"])
+        self.assertEqual(client.files.delete.call_count, 1)
+        self.assertIsNone(self.store.get("Thread", "thread_old"))
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_already_deleted_objects_count_as_deleted(self, mock_openai):
+        client = self._client(mock_openai)
+        client.beta.threads.delete.side_effect = _NotFound("No thread found")
+
+        report = GarbageCollector(kinds=["thread"], older_than=86400).run()
+
+        self.assertEqual(report.deleted["thread"], ["thread_old"])
+        self.assertEqual(report.errors, {})
+        self.assertIsNone(self.store.get("Thread", "thread_old"))
+
+
+    def test_refuses_to_select_everything(self):
+        with self.assertRaises(ValueError):
+            GarbageCollector()
+        with self.assertRaises(ValueError):
+            GarbageCollector(kinds=["message"], older_than=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GPTManager.Client import Client
+from GPTManager.Mapper import Mapper, mapper
+from GPTManager.Run import Run, RUN_STATE_FIELDS
+from GPTManager.Thread import Message
+
+
+def _message_fields(index):
+    return {
+        "id": f"msg_{index}", "object": "thread.message", "created_at": index, "thread_id": "thread_1",
+        "role": "user", "content": [], "file_ids": [], "assistant_id": None, "run_id": None, "metadata": {},
+    }
+
+
+class TestMapper(unittest.TestCase):
+
+    def setUp(self):
+        Client._instance = None
+
+
+    def test_builds_from_objects_and_dicts(self):
+        from_object = mapper(Message).build(SimpleNamespace(**_message_fields(1)))
+        from_dict = mapper(Message).build(_message_fields(1))
+
+        self.assertIsInstance(from_object, Message)
+        self.assertEqual(from_object, from_dict)
+        self.assertEqual(from_object.id, "msg_1")
+
+
+    def test_missing_fields_become_none(self):
+        fields = _message_fields(1)
+        del fields["file_ids"]
+
+        self.assertIsNone(mapper(Message).build(SimpleNamespace(**fields)).file_ids)
+        self.assertIsNone(mapper(Message).build(fields).file_ids)
+
+
+    def test_build_many_converts_a_mixed_page(self):
+        page = [_message_fields(1), SimpleNamespace(**_message_fields(2))]
+
+        messages = mapper(Message).build_many(page)
+
+        self.assertEqual([message.id for message in messages], ["msg_1", "msg_2"])
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_building_and_updating_runs_never_calls_the_api(self, mock_openai):
+        payload = {"id": "run_1", "thread_id": "thread_1", "assistant_id": "asst_1", "status": "queued"}
+
+        run = mapper(Run).build(payload)
+        mapper(Run, RUN_STATE_FIELDS).update(run, {"id": "other", "status": "completed"})
+
+        mock_openai.assert_not_called()
+        self.assertEqual(run.id, "run_1")
+        self.assertEqual(run.status, "completed")
+        self.assertIsNone(run.required_action)
+
+
+    def test_mappers_are_shared_and_reject_bad_fields(self):
+        self.assertIs(mapper(Message), mapper(Message))
+        with self.assertRaises(ValueError):
+            Mapper(Run, ("id", "not a field"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,10 @@
 import unittest
+import tempfile
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 from GPTManager.Organization import Organization  
+from GPTManager.Client import Client
+from GPTManager.Errors import BulkCreateError
 import openai
 import os
 from dotenv import load_dotenv
@@ -33,16 +37,17 @@ class TestOrganization(unittest.TestCase):
 
     def setUp(self):
         openai.api_key = os.getenv('OPENAI_API_KEY')
+        Client._instance = None
 
 
-    @patch('GPTManager.Organization.OpenAI')
+    @patch('GPTManager.Client.OpenAI')
     def test_list_files(self, mock_openai):
         mock_files_data = [
             {**self.mock_file_data, 'id': 'file_1' },
             {**self.mock_file_data, 'id': 'file_2'},
         ]
 
-        mock_openai.return_value.files.list.return_value = {'data': mock_files_data}
+        mock_openai.return_value.files.list.return_value = MagicMock(data=mock_files_data, has_more=False)
 
         # Call method
         result = Organization.list_files()
@@ -53,7 +58,7 @@ class TestOrganization(unittest.TestCase):
         self.assertEqual(result[1].id, 'file_2')
 
 
-    @patch('GPTManager.Organization.OpenAI')
+    @patch('GPTManager.Client.OpenAI')
     def test_list_assistants(self, mock_openai):
         # Mock response
         mock_assistants_data = [
@@ -61,7 +66,7 @@ class TestOrganization(unittest.TestCase):
             {**self.mock_assistant_data, 'id': 'assistant_2'},
         ]
         
-        mock_openai.return_value.beta.assistants.list.return_value = {'data': mock_assistants_data}
+        mock_openai.return_value.beta.assistants.list.return_value = MagicMock(data=mock_assistants_data, has_more=False)
 
         # Call method
         result = Organization.list_assistants(order='asc', limit='10')
@@ -69,6 +74,116 @@ class TestOrganization(unittest.TestCase):
         self.assertEqual(len(result), 2)
         self.assertEqual(result[0].object, 'assistant')
         self.assertEqual(result[1].object, 'assistant')
+        mock_openai.return_value.beta.assistants.retrieve.assert_not_called()
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_iter_files_follows_pages_and_filters(self, mock_openai):
+        def file(file_id, created_at):
+            return SimpleNamespace(**{**self.mock_file_data, 'id': file_id, 'created_at': created_at})
+
+        pages = [
+            MagicMock(data=[file('file_3', 300), file('file_2', 200)], has_more=True),
+            MagicMock(data=[file('file_1', 100), file('file_0', 50)], has_more=True),
+            MagicMock(data=[file('file_old', 10)], has_more=False),
+        ]
+        files_list = mock_openai.return_value.files.list
+        files_list.side_effect = pages
+
+        files = list(Organization.iter_files(purpose='assistants', created_after=100, created_before=300, page_size=2, prefetch=False))
+
+        self.assertEqual([file.id for file in files], ['file_2', 'file_1'])
+        self.assertEqual(files_list.call_count, 2)
+        self.assertEqual(files_list.call_args_list[0].kwargs, {'purpose': 'assistants', 'limit': 2})
+        self.assertEqual(files_list.call_args_list[1].kwargs['after'], 'file_2')
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_inventory_lists_files_and_assistants(self, mock_openai):
+        mock_openai.return_value.files.list.return_value = MagicMock(data=[self.mock_file_data], has_more=False)
+        mock_openai.return_value.beta.assistants.list.return_value = MagicMock(data=[self.mock_assistant_data], has_more=False)
+
+        inventory = Organization.inventory()
+
+        self.assertEqual([file.id for file in inventory.files], ['test_file_id'])
+        self.assertEqual([assistant.name for assistant in inventory.assistants], ['Math Tutor'])
+
+
+
+    def _knowledge_base(self):
+        directory = tempfile.TemporaryDirectory()
+        for relative in ('a.pdf', 'b.txt', 'nested/c.pdf', 'nested/deeper/d.pdf'):
+            full_path = os.path.join(directory.name, relative)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, 'wb') as target:
+                target.write(relative.encode())
+        return directory
+
+
+    def _created_file(self, file, purpose):
+        name = os.path.basename(file.name)
+        return SimpleNamespace(id=f'file_{name}', object='file', bytes=1, created_at=1, filename=name, purpose=purpose)
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_upload_directory(self, mock_openai):
+        directory = self._knowledge_base()
+        self.addCleanup(directory.cleanup)
+        mock_openai.return_value.files.create.side_effect = self._created_file
+        reports = []
+
+        files = Organization.upload_directory(directory.name, 'assistants', pattern='*.pdf', concurrency=2, on_file=reports.append)
+
+        self.assertEqual([file.id for file in files], ['file_a.pdf', 'file_c.pdf', 'file_d.pdf'])
+        self.assertEqual(len(reports), 3)
+        self.assertEqual(reports[-1].completed, 3)
+        self.assertEqual(reports[-1].failed, 0)
+        self.assertGreater(reports[-1].bytes_uploaded, 0)
+
+        top_level = Organization.upload_directory(directory.name, 'assistants', pattern='*.pdf', recursive=False)
+        self.assertEqual([file.id for file in top_level], ['file_a.pdf'])
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_upload_directory_reports_failures_and_attaches(self, mock_openai):
+        directory = self._knowledge_base()
+        self.addCleanup(directory.cleanup)
+
+        def create(file, purpose):
+            if file.name.endswith('c.pdf'):
+                raise ValueError('bad file')
+            return self._created_file(file, purpose)
+
+        mock_openai.return_value.files.create.side_effect = create
+        assistant = MagicMock()
+        reports = []
+
+        with self.assertRaises(BulkCreateError) as raised:
+            Organization.upload_directory(directory.name, 'assistants', pattern='*.pdf', assistant=assistant, on_file=reports.append)
+
+        self.assertEqual([file and file.id for file in raised.exception.results], ['file_a.pdf', None, 'file_d.pdf'])
+        self.assertEqual(list(raised.exception.errors), [1])
+        self.assertEqual(sorted(call.args[0] for call in assistant.create_assistant_file.call_args_list), ['file_a.pdf', 'file_d.pdf'])
+        self.assertEqual([report.error is not None for report in sorted(reports, key=lambda report: report.path)], [False, True, False])
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_upload_directory_surfaces_unreadable_files_and_callback_errors(self, mock_openai):
+        directory = self._knowledge_base()
+        self.addCleanup(directory.cleanup)
+        os.symlink(os.path.join(directory.name, 'missing.pdf'), os.path.join(directory.name, 'broken.pdf'))
+        mock_openai.return_value.files.create.side_effect = self._created_file
+
+        def on_file(report):
+            if report.path.endswith('d.pdf'):
+                raise RuntimeError('callback failed')
+
+        with self.assertRaises(BulkCreateError) as raised:
+            Organization.upload_directory(directory.name, 'assistants', pattern='*.pdf', concurrency=2, on_file=on_file)
+
+        paths = ['a.pdf', 'broken.pdf', 'c.pdf', 'd.pdf']
+        failed = {paths[index]: type(error) for index, error in raised.exception.errors.items()}
+        self.assertEqual(failed, {'broken.pdf': FileNotFoundError, 'd.pdf': RuntimeError})
 
 
 if __name__ == '__main__':
@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GPTManager.Client import Client
+from GPTManager.RateLimiter import RateLimiter, _duration
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def setUp(self):
+        Client._instance = None
+        Client._async_instance = None
+
+
+    def tearDown(self):
+        Client.configure()
+
+
+    def test_waits_once_the_bucket_is_spent(self):
+        limiter = RateLimiter(requests_per_minute=60)
+
+        delays = [limiter.reserve() for _ in range(62)]
+
+        self.assertEqual(delays[:60], [0.0] * 60)
+        self.assertAlmostEqual(delays[60], 1.0, delta=0.05)
+        self.assertAlmostEqual(delays[61], 2.0, delta=0.05)
+        self.assertEqual(limiter.waits, 2)
+
+
+    def test_reservations_are_shared_across_threads(self):
+        limiter = RateLimiter(requests_per_minute=600)
+        delays = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(100):
+                delay = limiter.reserve()
+                with lock:
+                    delays.append(delay)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sum(1 for delay in delays if delay == 0), 600)
+        self.assertAlmostEqual(max(delays), 20.0, delta=0.5)
+
+
+    def test_headers_update_budget_and_reset(self):
+        limiter = RateLimiter()
+
+        limiter.observe(200, {
+            'x-ratelimit-limit-requests': '500',
+            'x-ratelimit-remaining-requests': '0',
+            'x-ratelimit-reset-requests': '1m30s',
+            'x-ratelimit-limit-tokens': '150000',
+            'x-ratelimit-remaining-tokens': '149000',
+            'x-ratelimit-reset-tokens': '400ms',
+        })
+
+        self.assertEqual(limiter.requests_per_minute, 500)
+        self.assertEqual(limiter.tokens_per_minute, 150000)
+        self.assertAlmostEqual(limiter.reserve(), 90.0, delta=0.1)
+
+
+    def test_retry_after_blocks_requests(self):
+        limiter = RateLimiter()
+
+        limiter.observe(429, {'retry-after': '2'})
+
+        self.assertAlmostEqual(limiter.reserve(), 2.0, delta=0.05)
+
+
+    def test_duration_parsing(self):
+        self.assertAlmostEqual(_duration('20ms'), 0.02)
+        self.assertEqual(_duration('6m0s'), 360.0)
+        self.assertEqual(_duration('1.5'), 1.5)
+        self.assertIsNone(_duration('soon'))
+
+
+    def test_async_acquire_awaits_instead_of_blocking(self):
+        limiter = RateLimiter(requests_per_minute=60)
+        for _ in range(60):
+            limiter.reserve()
+
+        with patch('GPTManager.RateLimiter.asyncio.sleep') as mock_sleep, patch('GPTManager.RateLimiter.time.sleep') as mock_time_sleep:
+            asyncio.run(limiter.acquire_async())
+
+        mock_time_sleep.assert_not_called()
+        self.assertAlmostEqual(mock_sleep.call_args.args[0], 1.0, delta=0.05)
+
+
+    def test_hooks_throttle_an_httpx_client(self):
+        limiter = RateLimiter()
+        responses = iter([
+            httpx.Response(200, headers={'x-ratelimit-remaining-requests': '0', 'x-ratelimit-reset-requests': '3s'}),
+            httpx.Response(200),
+        ])
+
+        with patch('GPTManager.RateLimiter.time.sleep') as mock_sleep:
+            with httpx.Client(transport=httpx.MockTransport(lambda request: next(responses)), event_hooks=limiter.hooks()) as client:
+                client.get('https://api.openai.com/v1/models')
+                client.get('https://api.openai.com/v1/models')
+
+        mock_sleep.assert_called_once()
+        self.assertAlmostEqual(mock_sleep.call_args.args[0], 3.0, delta=0.05)
+
+
+    @patch('GPTManager.Client.DefaultHttpxClient')
+    @patch('GPTManager.Client.OpenAI')
+    def test_client_installs_configured_limiter(self, mock_openai, mock_http_client):
+        limiter = RateLimiter(requests_per_minute=500)
+        Client.configure(rate_limiter=limiter)
+
+        Client.get_instance()
+
+        hooks = mock_http_client.call_args.kwargs['event_hooks']
+        self.assertEqual(len(hooks['request']), 1)
+        self.assertEqual(len(hooks['response']), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
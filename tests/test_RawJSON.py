@@ -0,0 +1,95 @@
+import asyncio
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock, AsyncMock
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GPTManager.Client import Client
+from GPTManager.RawJSON import RawPage
+from GPTManager.AsyncThread import AsyncThread
+from GPTManager.Run import Run, RunStep
+from GPTManager.Thread import Thread, Message
+
+
+def _message(index):
+    return {
+        "id": f"msg_{index}", "object": "thread.message", "created_at": index, "thread_id": "thread_1",
+        "role": "user", "content": [{"type": "text", "text": {"value": f"hello {index}", "annotations": []}}],
+        "file_ids": [], "assistant_id": None, "run_id": None, "metadata": {}, "status": "completed",
+    }
+
+
+def _response(items, has_more):
+    body = {"object": "list", "data": items, "has_more": has_more}
+    return SimpleNamespace(content=json.dumps(body).encode())
+
+
+class TestRawJSON(unittest.TestCase):
+
+    def setUp(self):
+        Client._instance = None
+        Client._async_instance = None
+
+
+    def test_decode_builds_target_objects(self):
+        page = RawPage.decode(_response([_message(1), _message(2)], True), Message)
+
+        self.assertTrue(page.has_more)
+        self.assertEqual([message.id for message in page.data], ["msg_1", "msg_2"])
+        self.assertIsInstance(page.data[0], Message)
+        self.assertEqual(page.data[0].content[0]["text"]["value"], "hello 1")
+
+
+    def test_decode_rejects_non_list_bodies(self):
+        with self.assertRaises(ValueError):
+            RawPage.decode(SimpleNamespace(content=b'{"id": "msg_1"}'), Message)
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_raw_messages_follow_pages_without_sdk_models(self, mock_openai):
+        client = mock_openai.return_value
+        client.beta.threads.create.return_value = MagicMock(id="thread_1", object="thread", created_at=1, metadata={})
+        raw_list = client.beta.threads.messages.with_raw_response.list
+        raw_list.side_effect = [_response([_message(1), _message(2)], True), _response([_message(3)], False)]
+
+        thread = Thread()
+        messages = thread.list_thread_messages(page_size=2, raw=True)
+
+        self.assertEqual([message.id for message in messages], ["msg_1", "msg_2", "msg_3"])
+        self.assertEqual(raw_list.call_args_list[1].kwargs["after"], "msg_2")
+        client.beta.threads.messages.list.assert_not_called()
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_raw_run_steps(self, mock_openai):
+        step = {
+            "id": "step_1", "object": "thread.run.step", "created_at": 1, "run_id": "run_1",
+            "assistant_id": "asst_1", "thread_id": "thread_1", "type": "message_creation",
+            "status": "completed", "step_details": {"type": "message_creation", "message_creation": {"message_id": "msg_1"}},
+        }
+        mock_openai.return_value.beta.threads.runs.steps.with_raw_response.list.return_value = _response([step], False)
+        run = Run(thread_id="thread_1", id="run_1", object="thread.run", status="completed")
+
+        steps = run.list_run_steps(raw=True)
+
+        self.assertIsInstance(steps[0], RunStep)
+        self.assertEqual(steps[0].step_details["message_creation"]["message_id"], "msg_1")
+        self.assertEqual(steps[0].compact().details, ("msg_1",))
+
+
+    @patch('GPTManager.Client.AsyncOpenAI')
+    def test_raw_async_messages(self, mock_async_openai):
+        raw_list = mock_async_openai.return_value.beta.threads.messages.with_raw_response.list = AsyncMock()
+        raw_list.return_value = _response([_message(1)], False)
+        thread = AsyncThread(thread_id="thread_1")
+
+        messages = asyncio.run(thread.list_thread_messages(raw=True))
+
+        self.assertEqual([message.id for message in messages], ["msg_1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GPTManager.Client import Client
+from GPTManager.Errors import APIError, CircuitOpenError
+from GPTManager.Retry import CircuitBreaker, RetryPolicy, call, call_async
+from GPTManager.Thread import Thread
+
+
+class _StatusError(Exception):
+
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+def _failing(name, *errors, result='ok'):
+    outcomes = list(errors)
+
+    def fn(*args, **kwargs):
+        fn.calls += 1
+        if outcomes:
+            raise outcomes.pop(0)
+        return result
+
+    fn.__name__ = name
+    fn.calls = 0
+    return fn
+
+
+class TestRetry(unittest.TestCase):
+
+    def setUp(self):
+        Client._instance = None
+        Client._async_instance = None
+        self.policy = RetryPolicy(max_attempts=4, base_delay=0.5, max_delay=30.0)
+
+
+    def tearDown(self):
+        Client.configure()
+
+
+    @patch('GPTManager.Retry.time.sleep')
+    def test_reads_are_retried_with_retry_after(self, mock_sleep):
+        retrieve = _failing('retrieve', _StatusError(503, {'retry-after': '2'}), TimeoutError())
+
+        self.assertEqual(call(retrieve, (), {}, self.policy, None), 'ok')
+
+        self.assertEqual(retrieve.calls, 3)
+        self.assertEqual(mock_sleep.call_args_list[0].args[0], 2.0)
+        self.assertLessEqual(mock_sleep.call_args_list[1].args[0], 1.0)
+
+
+    @patch('GPTManager.Retry.time.sleep')
+    def test_creates_are_only_retried_on_429(self, mock_sleep):
+        create = _failing('create', _StatusError(429), _StatusError(500))
+
+        with self.assertRaises(APIError) as context:
+            call(create, (), {}, self.policy, None)
+
+        self.assertEqual(create.calls, 2)
+        self.assertEqual(context.exception.status_code, 500)
+        self.assertEqual(context.exception.attempts, 2)
+        self.assertTrue(context.exception.retryable)
+
+
+    @patch('GPTManager.Retry.time.sleep')
+    def test_client_errors_are_not_retried(self, mock_sleep):
+        retrieve = _failing('retrieve', _StatusError(404))
+
+        with self.assertRaises(APIError) as context:
+            call(retrieve, (), {}, self.policy, None)
+
+        self.assertEqual(retrieve.calls, 1)
+        self.assertEqual(context.exception.status_code, 404)
+        self.assertFalse(context.exception.retryable)
+        mock_sleep.assert_not_called()
+
+
+    @patch('GPTManager.Retry.time.sleep')
+    def test_gives_up_after_max_attempts(self, mock_sleep):
+        retrieve = _failing('retrieve', *[_StatusError(502)] * 10)
+
+        with self.assertRaises(APIError):
+            call(retrieve, (), {}, self.policy, None)
+
+        self.assertEqual(retrieve.calls, 4)
+        for attempt, sleep in enumerate(mock_sleep.call_args_list, start=1):
+            self.assertLessEqual(sleep.args[0], 0.5 * 2 ** (attempt - 1))
+
+
+    @patch('GPTManager.Retry.time.sleep')
+    def test_uploaded_files_are_rewound_between_attempts(self, mock_sleep):
+        positions = []
+        file = MagicMock()
+        file.tell.return_value = 0
+
+        def create(file):
+            positions.append(file.seek.call_count)
+            if len(positions) == 1:
+                raise _StatusError(429)
+            return 'ok'
+
+        call(create, (), {'file': file}, self.policy, None)
+
+        file.seek.assert_called_once_with(0)
+
+
+    @patch('GPTManager.Retry.time.monotonic')
+    def test_circuit_opens_and_lets_a_trial_through(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30.0)
+        retrieve = _failing('retrieve', _StatusError(500), _StatusError(500))
+
+        for _ in range(2):
+            with self.assertRaises(APIError):
+                call(retrieve, (), {}, None, breaker)
+        with self.assertRaises(CircuitOpenError):
+            call(retrieve, (), {}, None, breaker)
+        self.assertEqual(retrieve.calls, 2)
+
+        mock_monotonic.return_value = 131.0
+        self.assertEqual(call(retrieve, (), {}, None, breaker), 'ok')
+        self.assertEqual(breaker.state, 'closed')
+
+
+    def test_async_call_retries(self):
+        outcomes = [_StatusError(503)]
+
+        async def retrieve():
+            if outcomes:
+                raise outcomes.pop()
+            return 'ok'
+
+        with patch('GPTManager.Retry.asyncio.sleep') as mock_sleep:
+            self.assertEqual(asyncio.run(call_async(retrieve, (), {}, self.policy, None)), 'ok')
+        mock_sleep.assert_called_once()
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_methods_raise_api_error_with_status(self, mock_openai):
+        mock_openai.return_value.beta.threads.retrieve.side_effect = _StatusError(404)
+
+        thread = Thread.ref("thread_1")
+        with self.assertRaises(APIError) as context:
+            thread.retrieve_thread()
+
+        self.assertEqual(context.exception.status_code, 404)
+        self.assertEqual(str(context.exception), "Failed to retreive thread")
+
+
+if __name__ == '__main__':
+    unittest.main()
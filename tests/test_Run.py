@@ -1,6 +1,13 @@
+import asyncio
+import json
+import threading
+import time
 import unittest
 from unittest.mock import patch, MagicMock
-from GPTManager.Run import Run, RunStep
+from GPTManager.Client import Client
+from GPTManager.Run import Run, RunStep, ToolRegistry
+from GPTManager.Polling import PollBackoff
+from GPTManager.RunPoller import RunPoller
 from GPTManager.Thread import Thread
 from GPTManager.Assistant import Assistant
 import openai
@@ -184,6 +191,7 @@ class TestRun(unittest.TestCase):
     @patch('GPTManager.Client.OpenAI')
     def setUp(self, mock_openai):
         openai.api_key = os.getenv('OPENAI_API_KEY')
+        Client._instance = None
         self.thread = Thread()
         self.assistant = Assistant(
             instructions='You are an assistant', 
@@ -304,5 +312,208 @@ class TestRun(unittest.TestCase):
         self.assertEqual(run_steps[0].object, 'thread.run.step')
 
 
+    @patch('GPTManager.Client.OpenAI')
+    def test_list_run_steps_follows_pages(self, mock_openai):
+        steps_list = Client.get_instance().beta.threads.runs.steps.list
+        steps_list.side_effect = [
+            MagicMock(data=[MagicMock(id='step_1'), MagicMock(id='step_2')], has_more=True),
+            MagicMock(data=[MagicMock(id='step_3')], has_more=False),
+        ]
+
+        run_steps = self._run.list_run_steps(order='asc', page_size=2)
+
+        self.assertEqual([run_step.id for run_step in run_steps], ['step_1', 'step_2', 'step_3'])
+        self.assertEqual(
+            [call.kwargs['after'] for call in steps_list.call_args_list if 'after' in call.kwargs],
+            ['step_2']
+        )
+        self.assertTrue(all(call.kwargs['order'] == 'asc' for call in steps_list.call_args_list))
+
+
+    @patch('GPTManager.Pagination._get_prefetch_pool')
+    @patch('GPTManager.Client.OpenAI')
+    def test_iter_run_steps_cancels_prefetch_on_early_stop(self, mock_openai, mock_pool):
+        Client.get_instance().beta.threads.runs.steps.list.return_value = MagicMock(
+            data=[MagicMock(id='step_1'), MagicMock(id='step_2')], has_more=True
+        )
+        upcoming = mock_pool.return_value.submit.return_value
+
+        run_steps = self._run.iter_run_steps(page_size=2)
+        self.assertEqual(next(run_steps).id, 'step_1')
+        run_steps.close()
+
+        self.assertEqual(mock_pool.return_value.submit.call_args.kwargs['after'], 'step_2')
+        upcoming.cancel.assert_called_once()
+        upcoming.result.assert_not_called()
+
+
+    @patch('GPTManager.Polling.time.sleep')
+    @patch('GPTManager.Client.OpenAI')
+    def test_wait_run(self, mock_openai, mock_sleep):
+        statuses = ['queued', 'in_progress', 'in_progress', 'completed']
+        Client.get_instance().beta.threads.runs.retrieve.side_effect = [
+            MagicMock(status=status) for status in statuses
+        ]
+        self._run.status = 'queued'
+
+        result = self._run.wait_run(backoff=PollBackoff(initial=0.1, factor=2, maximum=1, jitter=0))
+
+        self.assertEqual(self._run.status, 'completed')
+        self.assertEqual(result.requests, 4)
+        self.assertEqual(result.polls[self._run.id], 4)
+        self.assertFalse(result.timed_out)
+        # The delay resets on status changes and grows while the status is unchanged.
+        delays = [round(call.args[0], 1) for call in mock_sleep.call_args_list]
+        self.assertEqual(delays, [0.1, 0.2, 0.1, 0.2])
+
+
+    @patch('GPTManager.Polling.time.sleep')
+    @patch('GPTManager.Client.OpenAI')
+    def test_wait_run_timeout(self, mock_openai, mock_sleep):
+        Client.get_instance().beta.threads.runs.retrieve.return_value = MagicMock(status='in_progress')
+        self._run.status = 'in_progress'
+
+        result = self._run.wait_run(timeout=0)
+
+        self.assertTrue(result.timed_out)
+        self.assertEqual(result.requests, 0)
+        self.assertEqual(result.pending, [self._run])
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_run_poller_refreshes_thread_with_one_list_call(self, mock_openai):
+        client = Client.get_instance()
+        client.beta.threads.runs.retrieve.reset_mock()
+        client.beta.threads.runs.list.return_value = MagicMock(data=[
+            MagicMock(id='run_1', status='completed'),
+            MagicMock(id='run_2', status='failed'),
+            MagicMock(id='run_other', status='in_progress'),
+        ])
+        runs = [
+            Run(id=run_id, object='thread.run', status='queued', thread_id='test_thread_id')
+            for run_id in ('run_1', 'run_2')
+        ]
+        notified = []
+        poller = RunPoller(backoff=PollBackoff(initial=0.05, jitter=0))
+        try:
+            futures = [poller.register(run, callback=notified.append) for run in runs]
+            results = [future.result(timeout=5) for future in futures]
+        finally:
+            poller.stop()
+
+        self.assertEqual([run.status for run in results], ['completed', 'failed'])
+        self.assertEqual(poller.requests, 1)
+        self.assertEqual(poller.refreshes, 2)
+        self.assertCountEqual(notified, runs)
+        client.beta.threads.runs.retrieve.assert_not_called()
+
+
+    def _tool_call(self, call_id, name, arguments):
+        function = MagicMock(arguments=arguments)
+        function.name = name
+        return MagicMock(id=call_id, function=function)
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_dispatch_tool_calls(self, mock_openai):
+        registry = ToolRegistry(timeout=5)
+        # Both tools only get past the barrier if they run at the same time.
+        barrier = threading.Barrier(2, timeout=5)
+        release = threading.Event()
+
+        @registry.register
+        def get_weather(location):
+            barrier.wait()
+            return {"location": location, "temperature": 21}
+
+        @registry.register(name='get_time')
+        async def current_time(city):
+            barrier.wait()
+            return f"12:00 in {city}"
+
+        @registry.register(timeout=0.05)
+        def slow_tool():
+            release.wait(5)
+
+        self._run.status = 'requires_action'
+        self._run.required_action = MagicMock()
+        self._run.required_action.submit_tool_outputs.tool_calls = [
+            self._tool_call('call_1', 'get_weather', '{"location": "Paris"}'),
+            self._tool_call('call_2', 'get_time', '{"city": "Paris"}'),
+            self._tool_call('call_3', 'slow_tool', '{}'),
+            self._tool_call('call_4', 'missing_tool', '{}'),
+        ]
+
+        try:
+            outputs = self._run.dispatch_tool_calls(registry)
+        finally:
+            release.set()
+
+        self.assertEqual([output['tool_call_id'] for output in outputs], ['call_1', 'call_2', 'call_3', 'call_4'])
+        self.assertEqual(json.loads(outputs[0]['output']), {"location": "Paris", "temperature": 21})
+        self.assertEqual(outputs[1]['output'], "12:00 in Paris")
+        self.assertIn('timed out', outputs[2]['output'])
+        self.assertIn('missing_tool', outputs[3]['output'])
+        Client.get_instance().beta.threads.runs.submit_tool_outputs.assert_called_once_with(
+            thread_id=self._run.thread_id, run_id=self._run.id, tool_outputs=outputs
+        )
+
+
+    def test_queued_tool_calls_time_out_with_the_batch(self):
+        registry = ToolRegistry(timeout=0.2, max_workers=1)
+        release = threading.Event()
+        ran = []
+
+        @registry.register
+        def blocking():
+            release.wait(5)
+
+        # Queued behind blocking, which holds the only worker past the deadline.
+        @registry.register
+        def queued():
+            ran.append("queued")
+
+        started = time.monotonic()
+        try:
+            outputs = registry.execute([self._tool_call('call_1', 'blocking', '{}'), self._tool_call('call_2', 'queued', '{}')])
+        finally:
+            release.set()
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertTrue(all('timed out' in output['output'] for output in outputs))
+        time.sleep(0.05)
+        self.assertEqual(ran, [])
+
+        release.clear()
+        started = time.monotonic()
+        try:
+            outputs = asyncio.run(registry.execute_async([self._tool_call('call_1', 'blocking', '{}'), self._tool_call('call_2', 'queued', '{}')]))
+        finally:
+            release.set()
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertTrue(all('timed out' in output['output'] for output in outputs))
+        time.sleep(0.05)
+        self.assertEqual(ran, [])
+
+
+    def test_coroutine_tools_are_cancelled_on_timeout(self):
+        registry = ToolRegistry(timeout=0.1)
+        cancelled = threading.Event()
+
+        @registry.register
+        async def hanging():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        outputs = registry.execute([self._tool_call('call_1', 'hanging', '{}')])
+
+        self.assertIn('timed out', outputs[0]['output'])
+        self.assertTrue(cancelled.wait(1))
+
+
 if __name__ == '__main__':
     unittest.main()
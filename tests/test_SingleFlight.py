@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GPTManager.Client import Client
+from GPTManager.Run import Run
+from GPTManager.SingleFlight import SingleFlight
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.001)
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def setUp(self):
+        Client._instance = None
+        Client._async_instance = None
+        Client.single_flight = SingleFlight()
+
+
+    def test_concurrent_threads_share_one_call(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        results = []
+
+        def fetch():
+            release.wait(5)
+            return object()
+
+        threads = [threading.Thread(target=lambda: results.append(flight.do('run_1', fetch))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        _wait_for(lambda: flight.coalesced == 4)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(flight.calls, 1)
+        self.assertEqual(len({id(result) for result in results}), 1)
+        self.assertEqual(flight.do('run_1', lambda: 'fresh'), 'fresh')
+
+
+    def test_errors_are_shared_and_not_kept(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        errors = []
+
+        def fetch():
+            release.wait(5)
+            raise ValueError("down")
+
+        def worker():
+            try:
+                flight.do('run_1', fetch)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        _wait_for(lambda: flight.coalesced == 2)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(errors), 3)
+        self.assertEqual(flight.do('run_1', lambda: 'ok'), 'ok')
+
+
+    def test_async_tasks_share_one_call(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 'run'
+
+        async def main():
+            waiter = asyncio.ensure_future(flight.do_async('run_1', fetch))
+            results = await asyncio.gather(*(flight.do_async('run_1', fetch) for _ in range(4)))
+            waiter.cancel()
+            return results
+
+        self.assertEqual(asyncio.run(main()), ['run'] * 4)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.coalesced, 4)
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_concurrent_retrieve_run_is_coalesced(self, mock_openai):
+        release = threading.Event()
+        retrieve = mock_openai.return_value.beta.threads.runs.retrieve
+
+        def slow_retrieve(**kwargs):
+            release.wait(5)
+            return retrieve.return_value
+
+        retrieve.side_effect = slow_retrieve
+        retrieve.return_value.status = 'in_progress'
+        runs = [Run(thread_id="thread_1", id="run_1", object="thread.run", status="queued") for _ in range(3)]
+
+        threads = [threading.Thread(target=run.retrieve_run) for run in runs]
+        for thread in threads:
+            thread.start()
+        _wait_for(lambda: Client.single_flight.coalesced == 2)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        retrieve.assert_called_once_with(thread_id="thread_1", run_id="run_1")
+        self.assertTrue(all(run.status == 'in_progress' for run in runs))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from GPTManager.Client import Client
+from GPTManager.Errors import APIError
+from GPTManager.Store import Store
+from GPTManager.Thread import Thread, Message
+from GPTManager.Run import Run
+
+
+def make_message(message_id, created_at, thread_id="test_thread_id"):
+    return Message(
+        id=message_id,
+        object="thread.message",
+        created_at=created_at,
+        thread_id=thread_id,
+        role="user",
+        content=[{"type": "text", "text": {"value": message_id, "annotations": []}}],
+        file_ids=[],
+        assistant_id=None,
+        run_id=None,
+        metadata={},
+    )
+
+
+class TestStore(unittest.TestCase):
+
+    def setUp(self):
+        Client._instance = None
+        self.store = Store.configure(":memory:", max_age=60)
+
+
+    def tearDown(self):
+        Store.disable()
+
+
+    def test_put_and_get(self):
+        self.store.put(make_message("msg_1", 1))
+
+        stored = self.store.get("Message", "msg_1")
+        self.assertEqual(Message(**stored), make_message("msg_1", 1))
+        self.assertIsNone(self.store.get("Message", "msg_missing"))
+
+
+    @patch('GPTManager.Store.time.time')
+    def test_get_respects_max_age(self, mock_time):
+        mock_time.return_value = 1000.0
+        self.store.put(make_message("msg_1", 1))
+
+        mock_time.return_value = 1061.0
+        self.assertIsNone(self.store.get("Message", "msg_1"))
+        self.assertIsNotNone(self.store.get("Message", "msg_1", max_age=None))
+
+
+    def test_iter_rows_pages_by_created_at(self):
+        self.store.put_many(make_message(f"msg_{index:02d}", index) for index in range(25))
+        self.store.put(make_message("msg_other", 5, thread_id="other_thread"))
+
+        rows = list(self.store.iter_rows("Message", thread_id="test_thread_id", page_size=10))
+        self.assertEqual([row["id"] for row in rows], [f"msg_{index:02d}" for index in range(25)])
+
+        rows = list(self.store.iter_rows("Message", thread_id="test_thread_id", order="desc", after="msg_20", limit=3))
+        self.assertEqual([row["id"] for row in rows], ["msg_19", "msg_18", "msg_17"])
+
+
+    def test_delete_thread_removes_its_rows(self):
+        thread = Thread.__new__(Thread)
+        thread.id, thread.object, thread.created_at, thread.metadata = "test_thread_id", "thread", 1, {}
+        self.store.put_many([thread, make_message("msg_1", 1), make_message("msg_2", 2, thread_id="other_thread")])
+
+        self.store.delete("Thread", "test_thread_id")
+
+        self.assertIsNone(self.store.get("Thread", "test_thread_id"))
+        self.assertEqual(list(self.store.ids("Message")), ["msg_2"])
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_thread_reads_and_writes_through(self, mock_openai):
+        mock_openai.return_value.beta.threads.retrieve.return_value = MagicMock(
+            id="test_thread_id", object="thread", created_at=123456789, metadata={"key": "value"}
+        )
+        mock_openai.return_value.beta.threads.messages.list.return_value = MagicMock(
+            data=[make_message("msg_1", 1), make_message("msg_2", 2)], has_more=False
+        )
+
+        thread = Thread("test_thread_id")
+        thread.list_thread_messages()
+        Thread("test_thread_id")
+
+        mock_openai.return_value.beta.threads.retrieve.assert_called_once()
+        self.assertEqual([message.id for message in thread.iter_stored_messages(order="desc")], ["msg_2", "msg_1"])
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_only_finished_runs_are_served_from_store(self, mock_openai):
+        retrieve = mock_openai.return_value.beta.threads.runs.retrieve
+        retrieve.return_value = MagicMock(
+            object="thread.run", created_at=1, status="in_progress", tools=[], file_ids=[],
+            metadata={}, required_action=None, last_error=None, model="gpt-4-1106-preview",
+            instructions=None, started_at=1, expires_at=None, cancelled_at=None, failed_at=None, completed_at=None
+        )
+
+        Run(thread_id="test_thread_id", id="run_1")
+        Run(thread_id="test_thread_id", id="run_1")
+        self.assertEqual(retrieve.call_count, 2)
+
+        retrieve.return_value.status = "completed"
+        Run(thread_id="test_thread_id", id="run_1")
+        run = Run(thread_id="test_thread_id", id="run_1")
+        self.assertEqual(retrieve.call_count, 3)
+        self.assertEqual(run.status, "completed")
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_store_failure_is_not_reported_as_failed_request(self, mock_openai):
+        create = mock_openai.return_value.beta.threads.runs.create
+        create.return_value = MagicMock(
+            id="run_1", object="thread.run", created_at=1, status="queued", tools=[], file_ids=[],
+            metadata={}, required_action=None, last_error=None, model="gpt-4-1106-preview",
+            instructions=None, started_at=None, expires_at=None, cancelled_at=None, failed_at=None, completed_at=None
+        )
+        self.store.close()
+
+        run = Run.__new__(Run)
+        run.thread_id, run.assistant_id = "test_thread_id", "test_assistant_id"
+        with self.assertRaisesRegex(ValueError, "Failed to write to store") as raised:
+            run.create_run()
+
+        self.assertNotIsInstance(raised.exception, APIError)
+        self.assertEqual(run.id, "run_1")
+        create.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
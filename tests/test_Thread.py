@@ -5,7 +5,10 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from GPTManager.Thread import Thread, Message_Base, Message, MessageFile
+from GPTManager.Client import Client
 from GPTManager.Run import Run
+from GPTManager.Errors import BulkCreateError
+from GPTManager.Store import Store
 
 import openai
 import os
@@ -138,6 +141,7 @@ class TestThread(unittest.TestCase):
     @patch('GPTManager.Client.OpenAI')
     def setUp(self, mock_openai):
         openai.api_key = os.getenv('OPENAI_API_KEY')
+        Client._instance = None
         
         mock_openai.return_value.beta.threads.create.return_value = self.mock_thread_data
         mock_openai.return_value.beta.threads.retrieve.return_value = self.mock_thread_data
@@ -175,6 +179,38 @@ class TestThread(unittest.TestCase):
         self.assertEqual(thread.metadata, {"key": "value"})
 
 
+    @patch('GPTManager.Client.OpenAI')
+    def test_ref_fetches_on_first_attribute_access(self, mock_openai):
+        client = Client.get_instance()
+        client.beta.threads.retrieve.reset_mock()
+
+        thread = Thread.ref("test_thread_id")
+        thread.create_message(role='user', content='Hello')
+        client.beta.threads.retrieve.assert_not_called()
+
+        self.assertEqual(thread.created_at, 123456789)
+        self.assertEqual(thread.metadata, {"key": "value"})
+        client.beta.threads.retrieve.assert_called_once_with("test_thread_id")
+        with self.assertRaises(AttributeError):
+            thread.missing
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_modify_ref_does_not_fetch(self, mock_openai):
+        client = Client.get_instance()
+        client.beta.threads.retrieve.reset_mock()
+        store = Store.configure(":memory:")
+        self.addCleanup(Store.disable)
+        stored = Thread.ref("test_thread_id")
+        stored.object, stored.created_at, stored.metadata = "thread", 1, {"old": "value"}
+        store.put(stored)
+
+        Thread.ref("test_thread_id").modify_thread(metadata={'test_key': 'test_value'})
+
+        client.beta.threads.retrieve.assert_not_called()
+        self.assertIsNone(store.get("Thread", "test_thread_id"))
+
+
     @patch('GPTManager.Client.OpenAI')
     def test_modify_thread(self, mock_openai):
         self.thread.modify_thread(metadata={'test_key': 'test_value'})
@@ -235,6 +271,44 @@ class TestThread(unittest.TestCase):
         )
 
 
+    @patch('GPTManager.Client.OpenAI')
+    def test_create_messages_keeps_order_and_reports_failures(self, mock_openai):
+        def create(thread_id, role, content, file_ids):
+            text = content[0]["text"]["value"]
+            if text == "bad":
+                raise RuntimeError("rejected")
+            return MagicMock(id=f"msg_{text}", content=content)
+
+        Client.get_instance().beta.threads.messages.create.side_effect = create
+        messages = [Message_Base(role='user', content=text) for text in ("a", "b", "c")]
+
+        result = self.thread.create_messages(messages, max_concurrency=2)
+        self.assertEqual([message.id for message in result], ["msg_a", "msg_b", "msg_c"])
+
+        messages.insert(1, Message_Base(role='user', content="bad"))
+        with self.assertRaises(BulkCreateError) as raised:
+            self.thread.create_messages(messages)
+        self.assertEqual([message and message.id for message in raised.exception.results], ["msg_a", None, "msg_b", "msg_c"])
+        self.assertEqual(list(raised.exception.errors), [1])
+        # By default each create waits for the previous one, so the thread receives them in input order.
+        sent = [call.kwargs["content"][0]["text"]["value"] for call in Client.get_instance().beta.threads.messages.create.call_args_list[-4:]]
+        self.assertEqual(sent, ["a", "bad", "b", "c"])
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_create_thread_with_messages_uses_one_request(self, mock_openai):
+        client = Client.get_instance()
+        client.beta.threads.messages.create.reset_mock()
+        client.beta.threads.messages.list.return_value = self._message_page(['msg_1', 'msg_2'], False)
+
+        thread = Thread(messages=[Message_Base(role='user', content='Hello'), Message_Base(role='user', content='Again')])
+
+        sent = client.beta.threads.create.call_args.kwargs['messages']
+        self.assertEqual([message['content'][0]['text']['value'] for message in sent], ['Hello', 'Again'])
+        client.beta.threads.messages.create.assert_not_called()
+        self.assertEqual([message.id for message in thread.messages], ['msg_1', 'msg_2'])
+
+
     @patch('GPTManager.Client.OpenAI')
     def test_retrieve_message(self, mock_openai):
         result = self.thread.retrieve_message('test_message_id')
@@ -270,6 +344,113 @@ class TestThread(unittest.TestCase):
         self.assertEqual(len(result), 2)
         self.assertTrue(all((message, Message) for message in result))
 
+    def _message_page(self, ids, has_more):
+        return MagicMock(
+            object = "list",
+            data = [MagicMock(id=message_id, role='user', content=[]) for message_id in ids],
+            first_id = ids[0],
+            last_id = ids[-1],
+            has_more = has_more
+        )
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_list_thread_messages_follows_pages(self, mock_openai):
+        messages_list = Client.get_instance().beta.threads.messages.list
+        messages_list.side_effect = [
+            self._message_page(['msg_1', 'msg_2'], True),
+            self._message_page(['msg_3', 'msg_4'], True),
+            self._message_page(['msg_5'], False),
+        ]
+
+        result = list(self.thread.iter_thread_messages(order='asc', page_size=2, prefetch=False))
+
+        self.assertEqual([message.id for message in result], ['msg_1', 'msg_2', 'msg_3', 'msg_4', 'msg_5'])
+        self.assertEqual(
+            [call.kwargs for call in messages_list.call_args_list],
+            [
+                {'limit': 2, 'order': 'asc'},
+                {'limit': 2, 'order': 'asc', 'after': 'msg_2'},
+                {'limit': 2, 'order': 'asc', 'after': 'msg_4'},
+            ]
+        )
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_list_thread_messages_stops_at_limit(self, mock_openai):
+        messages_list = Client.get_instance().beta.threads.messages.list
+        messages_list.side_effect = [
+            self._message_page(['msg_1', 'msg_2'], True),
+            self._message_page(['msg_3', 'msg_4'], True),
+        ]
+
+        result = self.thread.list_thread_messages(limit=3, page_size=2)
+
+        self.assertEqual([message.id for message in result], ['msg_1', 'msg_2', 'msg_3'])
+        self.assertEqual(messages_list.call_count, 2)
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_list_thread_messages_passes_cursors(self, mock_openai):
+        messages_list = Client.get_instance().beta.threads.messages.list
+        messages_list.return_value = self._message_page(['msg_2'], False)
+
+        result = self.thread.list_thread_messages(order='desc', page_size=500, after='msg_1', before='msg_3')
+
+        self.assertEqual([message.id for message in result], ['msg_2'])
+        messages_list.assert_called_once_with(
+            'test_thread_id', limit=100, order='desc', after='msg_1', before='msg_3'
+        )
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_list_thread_messages_pages_backwards_from_before(self, mock_openai):
+        messages_list = Client.get_instance().beta.threads.messages.list
+        messages_list.side_effect = [
+            self._message_page(['msg_4', 'msg_5'], True),
+            self._message_page(['msg_2', 'msg_3'], True),
+            self._message_page(['msg_1'], False),
+        ]
+
+        result = self.thread.list_thread_messages(order='asc', page_size=2, before='msg_6')
+
+        self.assertEqual([message.id for message in result], ['msg_4', 'msg_5', 'msg_2', 'msg_3', 'msg_1'])
+        self.assertEqual(
+            [call.kwargs for call in messages_list.call_args_list],
+            [
+                {'limit': 2, 'order': 'asc', 'before': 'msg_6'},
+                {'limit': 2, 'order': 'asc', 'before': 'msg_4'},
+                {'limit': 2, 'order': 'asc', 'before': 'msg_2'},
+            ]
+        )
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_list_thread_messages_stops_when_cursor_does_not_advance(self, mock_openai):
+        messages_list = Client.get_instance().beta.threads.messages.list
+        messages_list.return_value = self._message_page(['msg_1'], True)
+
+        result = self.thread.list_thread_messages(after='msg_1')
+
+        self.assertEqual(len(result), 1)
+        messages_list.assert_called_once()
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_sync_messages_fetches_only_new_messages(self, mock_openai):
+        messages_list = Client.get_instance().beta.threads.messages.list
+        messages_list.side_effect = [
+            self._message_page(['msg_1', 'msg_2'], False),
+            self._message_page(['msg_3'], False),
+            MagicMock(data=[], has_more=False),
+        ]
+
+        self.assertEqual([message.id for message in self.thread.sync_messages()], ['msg_1', 'msg_2'])
+        self.assertEqual([message.id for message in self.thread.sync_messages()], ['msg_3'])
+        self.assertEqual(self.thread.sync_messages(), [])
+
+        self.assertEqual([message.id for message in self.thread.messages], ['msg_1', 'msg_2', 'msg_3'])
+        self.assertEqual(self.thread.last_message_id, 'msg_3')
+        self.assertEqual(
+            [call.kwargs.get('after') for call in messages_list.call_args_list],
+            [None, 'msg_2', 'msg_3']
+        )
+        self.assertTrue(all(call.kwargs['order'] == 'asc' for call in messages_list.call_args_list))
+
     @patch('GPTManager.Client.OpenAI')
     def test_retrieve_message_file(self, mock_openai):
         result = self.thread.retrieve_message_file('test_message_id', 'test_file_id')
@@ -302,5 +483,104 @@ class TestThread(unittest.TestCase):
         self.assertEqual(runs[1].id, "test_run_id")
 
 
+    @patch('GPTManager.Polling.time.sleep')
+    @patch('GPTManager.Client.OpenAI')
+    def test_wait_runs(self, mock_openai, mock_sleep):
+        client = Client.get_instance()
+        client.beta.threads.runs.list.return_value = MagicMock(
+            object = "list",
+            data = [
+                MagicMock(id='run_1', object='thread.run', status='completed'),
+                MagicMock(id='run_2', object='thread.run', status='queued'),
+            ],
+            first_id = "run_1",
+            last_id = "run_2",
+            has_more = False
+        )
+        client.beta.threads.runs.retrieve.side_effect = [
+            MagicMock(status='in_progress'),
+            MagicMock(status='completed'),
+        ]
+
+        result = self.thread.wait_runs(timeout=60)
+
+        self.assertEqual([run.status for run in result.runs], ['completed', 'completed'])
+        self.assertEqual(result.polls, {'run_1': 0, 'run_2': 2})
+        self.assertEqual(result.requests, 3)
+        self.assertFalse(result.timed_out)
+
+
+    @patch('GPTManager.Polling.time.sleep')
+    @patch('GPTManager.Client.OpenAI')
+    def test_wait_runs_counts_every_listed_page(self, mock_openai, mock_sleep):
+        client = Client.get_instance()
+        client.beta.threads.runs.list.side_effect = [
+            MagicMock(data=[MagicMock(id='run_1', object='thread.run', status='completed')], has_more=True),
+            MagicMock(data=[MagicMock(id='run_2', object='thread.run', status='failed')], has_more=False),
+        ]
+
+        result = self.thread.wait_runs()
+
+        self.assertEqual([run.id for run in result.runs], ['run_1', 'run_2'])
+        self.assertEqual(result.requests, 2)
+        client.beta.threads.runs.retrieve.assert_not_called()
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_stream_run(self, mock_openai):
+        run_fields = (
+            'id', 'object', 'created_at', 'thread_id', 'assistant_id', 'started_at', 'expires_at',
+            'cancelled_at', 'failed_at', 'completed_at', 'last_error', 'model', 'instructions',
+            'tools', 'file_ids', 'metadata'
+        )
+
+        def run_event(event, status):
+            data = MagicMock(**{name: getattr(self.mock_run_data, name) for name in run_fields})
+            data.status = status
+            return MagicMock(event=event, data=data)
+
+        text_delta = MagicMock(index=0, type='text', text=MagicMock(value='Hel'))
+        events = [
+            run_event('thread.run.created', 'queued'),
+            run_event('thread.run.queued', 'queued'),
+            run_event('thread.run.in_progress', 'in_progress'),
+            MagicMock(event='thread.message.delta', data=MagicMock(id='test_message_id', delta=MagicMock(content=[text_delta]))),
+            MagicMock(event='thread.message.completed', data=self.mock_message_data),
+            run_event('thread.run.completed', 'completed'),
+        ]
+        Client.get_instance().beta.threads.runs.create.return_value = iter(events)
+
+        stream = self.thread.stream_run(MagicMock(id='test_assistant_id'))
+        received = list(stream)
+
+        self.assertEqual(
+            [type(event).__name__ for event in received],
+            ['RunStatusEvent', 'RunStatusEvent', 'MessageDeltaEvent', 'MessageCompletedEvent', 'RunStatusEvent']
+        )
+        self.assertEqual(received[2].text, 'Hel')
+        self.assertEqual(stream.run.id, 'test_run_id')
+        self.assertEqual(stream.run.status, 'completed')
+        self.assertIsInstance(stream.messages[0], Message)
+        Client.get_instance().beta.threads.runs.create.assert_called_once_with(
+            thread_id='test_thread_id', assistant_id='test_assistant_id', stream=True
+        )
+        Client.get_instance().beta.threads.runs.retrieve.assert_not_called()
+
+
+    @patch('GPTManager.Client.OpenAI')
+    def test_stream_run_closes_stream_when_left_early(self, mock_openai):
+        delta = MagicMock(index=0, type='text', text=MagicMock(value='Hel'))
+        event = MagicMock(event='thread.message.delta', data=MagicMock(id='test_message_id', delta=MagicMock(content=[delta])))
+        events = MagicMock()
+        events.__iter__.return_value = iter([event, event, event])
+        Client.get_instance().beta.threads.runs.create.return_value = events
+
+        for received in self.thread.stream_run(MagicMock(id='test_assistant_id')):
+            break
+
+        self.assertEqual(received.text, 'Hel')
+        events.close.assert_called_once()
+
+
 if __name__ == '__main__':
     unittest.main()